@@ -1,20 +1,59 @@
 import streamlit as st
 import pandas as pd
+import numpy as np
 import uuid
+from typing import Dict, Optional
 from database import DatabaseService
+from skill_taxonomy import get_taxonomy
+from cohort_analytics import COHORT_CACHE_TTL, get_cohort_frame
+from data_export import EXPORT_TABLES, EXPORT_FORMATS, EXPORT_DOWNLOAD_MAX_BYTES, export_file, take_export_file, export_command
+from data_import import IMPORT_KINDS, import_csv
+from notifications import flash
+from services import schedule_inactivity_sweep
+from warmup import get_warmup_status
 from utils import *
 
+INTERN_PAGE_SIZE = 25
+HEATMAP_MAX_INTERNS = 200
+# Admins share one login, so they share one "last visit" watermark
+ADMIN_WATERMARK_KEY = "admin"
+CHANGE_LABELS = {
+    'session_logged': "Session logged",
+    'sessions_imported': "Sessions imported",
+    'intern_registered': "Intern registered",
+    'interns_imported': "Interns imported",
+    'intern_updated': "Intern updated",
+    'job_upserted': "Track saved",
+    'job_deleted': "Track deleted"
+}
+ALERT_LABELS = {
+    'score_drop': "Score drop",
+    'duration_outlier': "Unusual session length",
+    'inactivity_streak': "Returned after a gap",
+    'inactive': "Inactive"
+}
+
+# Per-view data loaders: each admin view caches only what it renders, keyed by the
+# data version of the tables it reads, so a write elsewhere invalidates only its readers
+@st.cache_data(ttl=COHORT_CACHE_TTL, show_spinner=False)
+def load_tracks_view(_db: DatabaseService, version: int):
+    return _db.get_jobs()
+
+@st.cache_data(ttl=COHORT_CACHE_TTL, show_spinner=False)
+def load_intern_detail(_db: DatabaseService, intern_id: str, job_id: Optional[str], version: int):
+    logs = _db.get_attendance_for_intern(intern_id)
+    job = _db.get_job_by_id(job_id) if job_id else None
+    return logs, job
+
+@st.cache_data(ttl=COHORT_CACHE_TTL, show_spinner=False)
+def load_leaderboard(_db: DatabaseService, limit: int, job_id: Optional[str], start_date: Optional[str], end_date: Optional[str], version: int):
+    return _db.get_leaderboard(limit, job_id, start_date, end_date)
+
 class AdminDashboard:
     def __init__(self, db: DatabaseService):
         self.db = db
     
     def show(self):
-        st.set_page_config(
-            page_title="InternTrack | Admin Hub",
-            layout="wide",
-            initial_sidebar_state="expanded"
-        )
-        
         col_h1, col_h2 = st.columns([3, 1])
         with col_h1:
             st.title("Admin Command Hub")
@@ -26,16 +65,95 @@ class AdminDashboard:
         
         st.markdown("---")
         
-        tab_tracks, tab_cohort, tab_analytics = st.tabs(["Track Repository", "Cohort Management", "Advanced Analytics"])
-        
-        with tab_tracks:
-            self.manage_tracks()
+        self.show_warmup_status()
+        self.show_changes_since_last_visit()
+        # Inactive-intern alerts are raised in the background, not on the render path
+        schedule_inactivity_sweep()
+        
+        # Only the selected view loads data and builds figures on a rerun
+        views = {
+            "Track Repository": self.manage_tracks,
+            "Cohort Management": self.manage_cohort,
+            "Advanced Analytics": self.show_advanced_analytics,
+            "Alerts": self.show_alerts,
+            "Bulk Import": self.import_data,
+            "Data Export": self.export_data
+        }
+        selected_view = st.radio(
+            "Admin view",
+            list(views.keys()),
+            horizontal=True,
+            key="admin_view",
+            label_visibility="collapsed"
+        )
         
-        with tab_cohort:
-            self.manage_cohort()
+        views[selected_view]()
+    
+    def show_warmup_status(self):
+        status = get_warmup_status()
+        if status is None:
+            return
+        with st.sidebar:
+            st.markdown("#### Cache Warm-up")
+            if status.done:
+                st.caption(f"Finished in {status.elapsed:.1f}s")
+            else:
+                st.progress(status.progress, text=f"{status.current or 'Starting'}...")
+            for name in status.steps:
+                if name in status.timings:
+                    st.caption(f"✓ {name}: {status.timings[name] * 1000:.0f} ms")
+                elif name in status.errors:
+                    st.caption(f"✗ {name}: {status.errors[name]}")
+    
+    def show_changes_since_last_visit(self):
+        if 'admin_last_seen' not in st.session_state:
+            # Remember where the previous visit stopped; this visit starts from now
+            st.session_state.admin_last_seen = self.db.get_admin_watermark(ADMIN_WATERMARK_KEY)
+            self.db.set_admin_watermark(ADMIN_WATERMARK_KEY, self.db.get_change_watermark())
+        
+        counts = self.db.count_changes_since(st.session_state.admin_last_seen)
+        if not counts:
+            return
         
-        with tab_analytics:
-            self.show_advanced_analytics()
+        with st.expander(f"What changed since your last visit ({sum(counts.values())})"):
+            col_c1, col_c2, col_c3, col_c4 = st.columns(4)
+            with col_c1:
+                st.metric("New Sessions", counts.get('session_logged', 0) + counts.get('sessions_imported', 0))
+            with col_c2:
+                st.metric("New Interns", counts.get('intern_registered', 0) + counts.get('interns_imported', 0))
+            with col_c3:
+                st.metric("Profile Updates", counts.get('intern_updated', 0))
+            with col_c4:
+                st.metric("Track Changes", counts.get('job_upserted', 0) + counts.get('job_deleted', 0))
+            
+            changes = self.db.get_changes_since(st.session_state.admin_last_seen, limit=50)
+            names = self.db.get_intern_names([change['intern_id'] for change in changes])
+            rows = []
+            for change in reversed(changes):
+                details = change['details']
+                if change['event'] == 'session_logged':
+                    summary = f"Scored {details.get('score')}/10 • {details.get('duration')} min on {details.get('date')}"
+                elif change['event'] == 'intern_updated' and 'overallScore' in details:
+                    old_score, new_score = details['overallScore']
+                    summary = f"Overall score {old_score if old_score is not None else '-'} → {new_score if new_score is not None else '-'}"
+                elif change['event'] == 'intern_updated':
+                    summary = "Updated " + ", ".join(details.get('fields', []))
+                elif 'count' in details:
+                    summary = f"{details['count']} rows"
+                else:
+                    summary = details.get('title') or details.get('name') or ""
+                rows.append({
+                    "When": change['created_at'],
+                    "Change": CHANGE_LABELS.get(change['event'], change['event']),
+                    "Intern": names.get(change['intern_id'], "") if change['intern_id'] else "",
+                    "Details": summary
+                })
+            st.dataframe(pd.DataFrame(rows), use_container_width=True, hide_index=True)
+            
+            if st.button("Mark all as seen"):
+                st.session_state.admin_last_seen = self.db.get_change_watermark()
+                self.db.set_admin_watermark(ADMIN_WATERMARK_KEY, st.session_state.admin_last_seen)
+                st.rerun()
     
     def manage_tracks(self):
         st.header("Learning Track Repository")
@@ -47,7 +165,7 @@ class AdminDashboard:
                 st.session_state.show_job_modal = True
                 st.session_state.editing_job = None
         
-        jobs = self.db.get_jobs()
+        jobs = load_tracks_view(self.db, self.db.get_data_version(['jobs']))
         
         if not jobs:
             st.info("No learning tracks available. Create your first track to get started!")
@@ -98,8 +216,7 @@ class AdminDashboard:
                 if st.button("Yes, Delete", type="primary", use_container_width=True):
                     self.db.delete_job(st.session_state.delete_job_id)
                     del st.session_state.delete_job_id
-                    st.success("Track deleted successfully!")
-                    time.sleep(1)
+                    flash("Track deleted successfully!")
                     st.rerun()
             with col_conf2:
                 if st.button("Cancel", use_container_width=True):
@@ -182,6 +299,10 @@ class AdminDashboard:
                                             "minLevel": 3
                                         })
                         
+                        taxonomy = get_taxonomy()
+                        for skill in required_skills:
+                            skill['name'] = taxonomy.display_name(skill['name'])
+                        
                         job = {
                             "id": editing['id'] if editing else f"job-{uuid.uuid4().hex[:8]}",
                             "title": title,
@@ -194,8 +315,7 @@ class AdminDashboard:
                         st.session_state.show_job_modal = False
                         if 'editing_job' in st.session_state:
                             del st.session_state.editing_job
-                        st.success("Track saved successfully!")
-                        time.sleep(1)
+                        flash("Track saved successfully!")
                         st.rerun()
             
             with col_form2:
@@ -209,30 +329,22 @@ class AdminDashboard:
         st.header("Intern Cohort Management")
         st.markdown("Monitor and manage all registered interns.")
         
-        interns = self.db.get_all_interns()
+        cohort = get_cohort_frame(self.db)
         
-        if not interns:
+        if not cohort.intern_records:
             st.info("No interns registered yet. Interns will appear here once they register.")
             return
         
+        metrics = cohort.cohort_metrics()
         col_stats1, col_stats2, col_stats3, col_stats4 = st.columns(4)
         with col_stats1:
-            st.metric("Total Interns", len(interns))
+            st.metric("Total Interns", metrics['total_interns'])
         with col_stats2:
-            onboarded = sum(1 for i in interns if i['onboarded'])
-            st.metric("Onboarded", onboarded)
+            st.metric("Onboarded", metrics['onboarded'])
         with col_stats3:
-            active = sum(1 for i in interns if self.db.get_attendance_for_intern(i['id']))
-            st.metric("Active", active)
+            st.metric("Active", metrics['active'])
         with col_stats4:
-            avg_score = 0
-            count = 0
-            for intern in interns:
-                attendance = self.db.get_attendance_for_intern(intern['id'])
-                if attendance:
-                    avg_score += sum(a['score'] for a in attendance if a['score']) / len(attendance)
-                    count += 1
-            st.metric("Avg Score", f"{avg_score/count:.1f}" if count > 0 else "N/A")
+            st.metric("Avg Score", f"{metrics['avg_score']:.1f}" if metrics['avg_score'] is not None else "N/A")
         
         st.markdown("---")
         
@@ -240,19 +352,13 @@ class AdminDashboard:
         
         with col_select:
             st.markdown("### Select Intern")
-            
-            intern_options = [f"{i['name']} ({i['email']})" for i in interns]
-            selected_intern_idx = st.selectbox(
-                "Choose intern to view details:",
-                range(len(intern_options)),
-                format_func=lambda x: intern_options[x],
-                label_visibility="collapsed"
-            )
-            
-            selected_intern = interns[selected_intern_idx]
+            selected_intern = self.intern_picker()
+            if not selected_intern:
+                st.info("No interns match this search.")
+                return
             
             st.markdown("#### Quick Stats")
-            attendance = self.db.get_attendance_for_intern(selected_intern['id'])
+            attendance, _ = self.load_intern_detail(selected_intern)
             
             col_q1, col_q2 = st.columns(2)
             with col_q1:
@@ -271,23 +377,64 @@ class AdminDashboard:
             else:
                 st.info("Select an intern from the list to view detailed performance metrics.")
     
+    def intern_picker(self) -> Optional[Dict]:
+        """Searchable, paginated intern selector; only the visible page is loaded."""
+        def reset_page():
+            st.session_state.intern_page = 1
+        
+        query = st.text_input(
+            "Search interns",
+            placeholder="Name or email starts with...",
+            key="intern_search",
+            on_change=reset_page,
+            label_visibility="collapsed"
+        )
+        
+        total = self.db.count_interns(query)
+        if total == 0:
+            return None
+        
+        pages = (total + INTERN_PAGE_SIZE - 1) // INTERN_PAGE_SIZE
+        if st.session_state.get('intern_page', 1) > pages:
+            st.session_state.intern_page = pages
+        page = 1
+        if pages > 1:
+            page = st.number_input(f"Page (of {pages})", min_value=1, max_value=pages, step=1, key="intern_page")
+        
+        page_interns = self.db.search_interns(query, INTERN_PAGE_SIZE, (page - 1) * INTERN_PAGE_SIZE)
+        selected = st.selectbox(
+            "Choose intern to view details:",
+            page_interns,
+            format_func=lambda i: f"{i['name']} ({i['email']})",
+            label_visibility="collapsed"
+        )
+        st.caption(f"{total} interns" if not query else f"{total} matching interns")
+        
+        return self.db.get_intern_by_id(selected['id']) if selected else None
+    
+    def load_intern_detail(self, intern):
+        version = self.db.get_data_version(['attendance', 'jobs'])
+        return load_intern_detail(self.db, intern['id'], intern['assigned_job_id'], version)
+    
     def show_intern_details(self, intern):
-        logs = self.db.get_attendance_for_intern(intern['id'])
-        job = self.db.get_job_by_id(intern['assigned_job_id']) if intern['assigned_job_id'] else None
+        logs, job = self.load_intern_detail(intern)
+        sessions = SessionSeries(logs)
         
         st.header(f"{intern['name']} - Performance Profile")
         st.caption(f"Email: {intern['email']} • Track: {job['title'] if job else 'Not assigned'}")
         
+        for alert in self.db.get_intern_alerts(intern['id']):
+            st.warning(f"**{ALERT_LABELS.get(alert['kind'], alert['kind'])}** ({alert['session_date']}): {alert['message']}")
+        
         metrics = intern.get('performance_metrics', {})
         
         col_metrics1, col_metrics2, col_metrics3, col_metrics4 = st.columns(4)
         with col_metrics1:
             st.metric("Total Sessions", len(logs))
         with col_metrics2:
-            total_mins = sum(l['duration'] for l in logs)
-            st.metric("Total Minutes", total_mins)
+            st.metric("Total Minutes", int(sessions.durations.sum()))
         with col_metrics3:
-            avg_score = sum(l['score'] for l in logs) / len(logs) if logs else 0
+            avg_score = sessions.scores.mean() if len(sessions) else 0
             st.metric("Avg Score", f"{avg_score:.1f}")
         with col_metrics4:
             status = "On-Track" if intern['onboarded'] else "Pending Onboarding"
@@ -300,13 +447,11 @@ class AdminDashboard:
         with col_chart1:
             st.markdown("#### Performance Trends")
             if logs:
-                recent_logs = logs[-10:]
-                dates = [log['date'] for log in recent_logs]
-                scores = [log['score'] for log in recent_logs]
+                shown = sessions.sample(sessions.scores)
                 
                 fig = go.Figure()
                 fig.add_trace(go.Scatter(
-                    x=dates, y=scores,
+                    x=sessions.dates[shown], y=sessions.scores[shown],
                     mode='lines+markers',
                     name='Scores',
                     line=dict(color='#6366f1', width=3),
@@ -320,7 +465,7 @@ class AdminDashboard:
                     margin=dict(t=30, b=20, l=20, r=20),
                     showlegend=False
                 )
-                fig.update_xaxes(title_text="Date")
+                fig.update_xaxes(title_text="Date", rangeslider_visible=True)
                 fig.update_yaxes(title_text="Score", range=[0, 10])
                 
                 st.plotly_chart(fig, use_container_width=True, config={'displayModeBar': False})
@@ -330,17 +475,13 @@ class AdminDashboard:
         with col_chart2:
             st.markdown("#### Study Effort Distribution")
             if logs:
-                recent_logs = logs[-10:]
-                dates = [log['date'] for log in recent_logs]
-                durations = [log['duration'] for log in recent_logs]
+                shown = sessions.sample(sessions.durations)
                 
                 fig = go.Figure()
                 fig.add_trace(go.Bar(
-                    x=dates, y=durations,
+                    x=sessions.dates[shown], y=sessions.durations[shown],
                     name='Duration (min)',
-                    marker_color='#10b981',
-                    text=durations,
-                    textposition='auto'
+                    marker_color='#10b981'
                 ))
                 
                 fig.update_layout(
@@ -350,7 +491,7 @@ class AdminDashboard:
                     margin=dict(t=30, b=20, l=20, r=20),
                     showlegend=False
                 )
-                fig.update_xaxes(title_text="Date")
+                fig.update_xaxes(title_text="Date", rangeslider_visible=True)
                 fig.update_yaxes(title_text="Duration (minutes)")
                 
                 st.plotly_chart(fig, use_container_width=True, config={'displayModeBar': False})
@@ -368,11 +509,21 @@ class AdminDashboard:
             
             with col_skill2:
                 st.markdown("#### Performance Distribution")
-                fig = create_performance_pie_chart(logs)
+                fig = create_performance_pie_chart(sessions)
                 st.plotly_chart(fig, use_container_width=True, config={'displayModeBar': False})
         else:
             st.info("Skill analysis not available. Intern needs to complete onboarding.")
         
+        st.markdown("#### Best Alternative Tracks")
+        alternatives = self.db.get_best_alternative_tracks(intern['id'], limit=3) if intern['onboarded'] else []
+        if alternatives:
+            df_alternatives = pd.DataFrame([
+                {"Track": a['title'], "Fit": a['fit']} for a in alternatives
+            ])
+            st.dataframe(df_alternatives, use_container_width=True, hide_index=True)
+        else:
+            st.info("No alternative track fit available yet.")
+        
         st.markdown("#### Recent Learning Sessions")
         if logs:
             for log in logs[:5]:
@@ -401,68 +552,102 @@ class AdminDashboard:
         st.header("Advanced Analytics Dashboard")
         st.markdown("Comprehensive analytics across all interns and tracks.")
         
-        interns = self.db.get_all_interns()
-        jobs = self.db.get_jobs()
-        all_attendance = self.db.get_all_attendance()
+        cohort = get_cohort_frame(self.db)
+        interns = cohort.intern_records
+        jobs = cohort.jobs
         
         if not interns:
             st.info("No data available. Add interns and tracks to see analytics.")
             return
         
+        overview = cohort.overview()
         col_ov1, col_ov2, col_ov3, col_ov4 = st.columns(4)
         with col_ov1:
-            st.metric("Total Interns", len(interns))
+            st.metric("Total Interns", overview['total_interns'])
         with col_ov2:
-            st.metric("Total Tracks", len(jobs))
+            st.metric("Total Tracks", overview['total_tracks'])
         with col_ov3:
-            total_sessions = len(all_attendance)
-            st.metric("Total Sessions", total_sessions)
+            st.metric("Total Sessions", overview['total_sessions'])
         with col_ov4:
-            avg_duration = sum(a['duration'] for a in all_attendance) / len(all_attendance) if all_attendance else 0
-            st.metric("Avg Session", f"{avg_duration:.0f} min")
+            st.metric("Avg Session", f"{overview['avg_duration']:.0f} min")
         
         st.markdown("---")
         
         st.markdown("#### Track Popularity & Performance")
         if jobs:
-            track_data = []
-            for job in jobs:
-                interns_in_track = [i for i in interns if i['assigned_job_id'] == job['id']]
-                if interns_in_track:
-                    avg_similarity = 0
-                    count = 0
-                    for intern in interns_in_track:
-                        if intern.get('analysis') and 'similarity' in intern['analysis']:
-                            avg_similarity += intern['analysis']['similarity']
-                            count += 1
-                    
-                    track_data.append({
-                        "Track": job['title'],
-                        "Interns": len(interns_in_track),
-                        "Avg Match": avg_similarity / count if count > 0 else 0
-                    })
-            
-            if track_data:
+            df_tracks = cohort.track_summary()
+            if not df_tracks.empty:
                 import plotly.express as px
-                df_tracks = pd.DataFrame(track_data)
                 fig = px.bar(df_tracks, x='Track', y=['Interns', 'Avg Match'], 
                             barmode='group', title="Track Distribution & Performance")
                 st.plotly_chart(fig, use_container_width=True)
+            
+            df_scores = cohort.track_score_stats()
+            if not df_scores.empty:
+                bands = {job['title']: self.db.get_score_histogram(job['id']).bands() for job in jobs}
+                for band in ("p10", "p50", "p90"):
+                    df_scores[band.upper()] = df_scores['Track'].map(lambda title: bands.get(title, {}).get(band))
+                st.dataframe(df_scores, use_container_width=True, hide_index=True)
+        
+        st.markdown("#### Cohort Map")
+        summary = cohort.intern_summary()
+        if summary['avg_score'].notna().any():
+            st.plotly_chart(create_cohort_scatter(summary), use_container_width=True)
+            st.caption("Each point is an intern: average session score against total hours, coloured by skill match with their track. Grey: not yet onboarded.")
+        else:
+            st.info("No scored sessions yet.")
+        
+        st.markdown("#### Track Fit Opportunities")
+        st.caption("Interns whose skills fit another track better than their assigned one.")
+        names = {i['id']: i['name'] for i in interns}
+        alternatives = self.db.get_track_fit_matrix().best_alternatives(min_gain=10, limit=20)
+        if alternatives:
+            titles = cohort.job_titles
+            df_fit = pd.DataFrame([
+                {
+                    "Name": names.get(a['intern_id'], a['intern_id']),
+                    "Assigned Track": titles.get(a['assigned_job_id'], "N/A"),
+                    "Assigned Fit": a['assigned_fit'],
+                    "Best Track": a['best_title'],
+                    "Best Fit": a['best_fit'],
+                    "Gain": a['gain']
+                }
+                for a in alternatives
+            ])
+            st.dataframe(df_fit, use_container_width=True, hide_index=True)
+        else:
+            st.info("Every intern is already on their best-fitting track.")
+        
+        st.markdown("#### Skill Gap Heatmap")
+        self.show_skill_gap_heatmap(jobs, names)
         
         st.markdown("#### Performance Trends Over Time")
-        if all_attendance:
-            from collections import defaultdict
-            daily_scores = defaultdict(list)
-            
-            for attendance in all_attendance:
-                daily_scores[attendance['date']].append(attendance['score'])
+        daily_scores = cohort.daily_average_scores(days=30)
+        if not daily_scores.empty:
+            fig = go.Figure()
             
-            dates = sorted(daily_scores.keys())[-30:]
-            avg_scores = [sum(daily_scores[d]) / len(daily_scores[d]) for d in dates]
+            daily_histograms = self.db.get_daily_score_histograms(days=30)
+            if daily_histograms:
+                band_dates = list(daily_histograms)
+                band = [daily_histograms[d].bands() for d in band_dates]
+                fig.add_trace(go.Scatter(
+                    x=band_dates + band_dates[::-1],
+                    y=[b['p90'] for b in band] + [b['p10'] for b in band][::-1],
+                    fill='toself',
+                    fillcolor='rgba(99, 102, 241, 0.12)',
+                    line=dict(width=0),
+                    hoverinfo='skip',
+                    name='p10-p90'
+                ))
+                fig.add_trace(go.Scatter(
+                    x=band_dates, y=[b['p50'] for b in band],
+                    mode='lines',
+                    name='Median',
+                    line=dict(color='#a5b4fc', width=2, dash='dash')
+                ))
             
-            fig = go.Figure()
-            fig.add_trace(go.Scatter(
-                x=dates, y=avg_scores,
+            fig.add_trace(scatter_trace(
+                daily_scores.index.tolist(), daily_scores.tolist(),
                 mode='lines+markers',
                 name='Daily Avg Score',
                 line=dict(color='#6366f1', width=2),
@@ -480,24 +665,199 @@ class AdminDashboard:
             fig.update_yaxes(title_text="Average Score", range=[0, 10])
             
             st.plotly_chart(fig, use_container_width=True)
+            st.caption("Line: daily average of all sessions. Band and dashed line: 10th-90th percentile and median of scored sessions.")
         
         st.markdown("#### Top Performing Interns")
-        if interns and all_attendance:
-            intern_scores = []
-            for intern in interns:
-                attendance = self.db.get_attendance_for_intern(intern['id'])
-                if attendance:
-                    avg_score = sum(a['score'] for a in attendance) / len(attendance)
-                    total_duration = sum(a['duration'] for a in attendance)
-                    intern_scores.append({
-                        "Name": intern['name'],
-                        "Track": self.db.get_job_by_id(intern['assigned_job_id'])['title'] if intern['assigned_job_id'] else "N/A",
-                        "Avg Score": round(avg_score, 1),
-                        "Sessions": len(attendance),
-                        "Total Hours": round(total_duration / 60, 1)
-                    })
-            
-            if intern_scores:
-                df_leaderboard = pd.DataFrame(intern_scores)
-                df_leaderboard = df_leaderboard.sort_values('Avg Score', ascending=False).head(10)
-                st.dataframe(df_leaderboard, use_container_width=True, hide_index=True)
+        col_lb1, col_lb2 = st.columns(2)
+        with col_lb1:
+            track_options = [None] + [job['id'] for job in jobs]
+            leaderboard_job = st.selectbox(
+                "Track", track_options,
+                format_func=lambda job_id: "All tracks" if job_id is None else cohort.job_titles[job_id],
+                key="leaderboard_track"
+            )
+        with col_lb2:
+            date_range = st.date_input("Date range", value=(), key="leaderboard_dates")
+        
+        start_date = date_range[0].isoformat() if len(date_range) > 0 else None
+        end_date = date_range[1].isoformat() if len(date_range) > 1 else None
+        version = self.db.get_data_version(['attendance', 'users', 'jobs'])
+        leaderboard = load_leaderboard(self.db, 10, leaderboard_job, start_date, end_date, version)
+        
+        if leaderboard:
+            df_leaderboard = pd.DataFrame([
+                {
+                    "Rank": entry['rank'],
+                    "Name": entry['name'],
+                    "Track": entry['track'],
+                    "Avg Score": entry['avg_score'],
+                    "Sessions": entry['sessions'],
+                    "Total Hours": round(entry['total_duration'] / 60, 1)
+                }
+                for entry in leaderboard
+            ])
+            st.dataframe(df_leaderboard, use_container_width=True, hide_index=True)
+        else:
+            st.info("No sessions recorded for this selection.")
+    
+    def show_skill_gap_heatmap(self, jobs, names: Dict[str, str]):
+        matrix = self.db.get_track_fit_matrix()
+        heatmap_job = st.selectbox(
+            "Heatmap scope",
+            [None] + [job['id'] for job in jobs],
+            format_func=lambda job_id: "All tracks (mean gap per track)" if job_id is None else next(j['title'] for j in jobs if j['id'] == job_id),
+            key="heatmap_track"
+        )
+        
+        if heatmap_job is None:
+            summary = matrix.track_gap_summary()
+            if not summary['skills'] or not summary['interns'].any():
+                st.info("No onboarded interns with skill data yet.")
+                return
+            active = summary['interns'] > 0
+            fig = create_skill_gap_heatmap(
+                summary['mean_gap'][active],
+                summary['skills'],
+                [f"{title} ({count})" for title, count, keep in zip(summary['titles'], summary['interns'], active) if keep],
+                hover_label="Mean gap",
+                customdata=summary['gap_share'][active],
+                hovertemplate="%{y} • %{x}<br>Mean gap: %{z:.2f}<br>Interns with a gap: %{customdata:.0f}%<extra></extra>"
+            )
+        else:
+            gap_data = matrix.gap_matrix(heatmap_job)
+            if not gap_data['intern_ids']:
+                st.info("No onboarded interns on this track yet.")
+                return
+            # The interns furthest from the track's requirements, largest total gap first
+            order = np.argsort(-gap_data['gap'].sum(axis=1), kind='stable')[:HEATMAP_MAX_INTERNS]
+            if len(gap_data['intern_ids']) > HEATMAP_MAX_INTERNS:
+                st.caption(f"Showing the {HEATMAP_MAX_INTERNS} interns with the largest total gap of {len(gap_data['intern_ids'])}.")
+            fig = create_skill_gap_heatmap(
+                gap_data['gap'][order],
+                gap_data['skills'],
+                [names.get(gap_data['intern_ids'][row], gap_data['intern_ids'][row]) for row in order],
+                customdata=np.stack([gap_data['current'][order], gap_data['required'][order]], axis=-1),
+                hovertemplate="%{y} • %{x}<br>Level %{customdata[0]:.0f} of %{customdata[1]:.0f} required<br>Gap: %{z}<extra></extra>"
+            )
+        st.plotly_chart(fig, use_container_width=True)
+    
+    def show_alerts(self):
+        st.header("Alerts")
+        st.markdown("Sessions that break from an intern's own pattern, and interns who have gone quiet.")
+        
+        counts = self.db.count_open_alerts()
+        col_a1, col_a2, col_a3, col_a4 = st.columns(4)
+        with col_a1:
+            st.metric("Open Alerts", sum(counts.values()))
+        with col_a2:
+            st.metric("Score Drops", counts.get('score_drop', 0))
+        with col_a3:
+            st.metric("Inactive Interns", counts.get('inactive', 0))
+        with col_a4:
+            st.metric("Session Outliers", counts.get('duration_outlier', 0) + counts.get('inactivity_streak', 0))
+        
+        jobs = load_tracks_view(self.db, self.db.get_data_version(['jobs']))
+        titles = {job['id']: job['title'] for job in jobs}
+        col_f1, col_f2 = st.columns(2)
+        with col_f1:
+            kind = st.selectbox("Type", [None] + list(ALERT_LABELS), format_func=lambda k: "All types" if k is None else ALERT_LABELS[k])
+        with col_f2:
+            job_id = st.selectbox("Track", [None] + list(titles), format_func=lambda j: "All tracks" if j is None else titles[j], key="alert_track")
+        
+        alerts = self.db.get_alerts(kind=kind, job_id=job_id)
+        if not alerts:
+            st.success("No open alerts.")
+            return
+        
+        names = self.db.get_intern_names([alert['intern_id'] for alert in alerts])
+        st.dataframe(pd.DataFrame([{
+            "Raised": alert['created_at'],
+            "Intern": names.get(alert['intern_id'], alert['intern_id']),
+            "Track": titles.get(alert['job_id'], ""),
+            "Type": ALERT_LABELS.get(alert['kind'], alert['kind']),
+            "Severity": alert['severity'],
+            "Details": alert['message']
+        } for alert in alerts]), use_container_width=True, hide_index=True)
+        
+        labels = {
+            alert['id']: f"{names.get(alert['intern_id'], alert['intern_id'])} • {ALERT_LABELS.get(alert['kind'], alert['kind'])} ({alert['session_date']})"
+            for alert in alerts
+        }
+        to_resolve = st.multiselect("Resolve", list(labels), format_func=labels.get)
+        if st.button("Mark Resolved", disabled=not to_resolve):
+            self.db.resolve_alerts(to_resolve)
+            st.rerun()
+    
+    def import_data(self):
+        st.header("Bulk Import")
+        st.markdown("Load tracks, a new intern cohort or historical attendance from CSV.")
+        
+        with st.expander("Expected columns"):
+            st.markdown("""
+                - **tracks**: `id` (optional), `title`, `domain`, `description`, `required_skills` (e.g. `React:4; CSS:3`)
+                - **interns**: `name`, `email`, `password`, `track` (id or title), `skills` (optional, onboards the intern)
+                - **attendance**: `email`, `date`, `time_in`, `time_out`, `task`, `resources`, `duration`, `score`, `status`
+            """)
+        
+        with st.form("import_form"):
+            kind = st.selectbox("Import", IMPORT_KINDS, format_func=str.title)
+            upload = st.file_uploader("CSV file", type=["csv"])
+            submitted = st.form_submit_button("Import", type="primary")
+        
+        if submitted and upload is not None:
+            import io
+            with st.spinner("Importing..."):
+                report = import_csv(self.db, kind, io.TextIOWrapper(upload, encoding="utf-8-sig", newline=""))
+            st.session_state.import_report = report
+        
+        report = st.session_state.get('import_report')
+        if report:
+            if report.error_count:
+                st.warning(report.summary())
+                st.dataframe(
+                    pd.DataFrame(report.errors, columns=["Line", "Problem"]),
+                    use_container_width=True,
+                    hide_index=True
+                )
+            else:
+                st.success(report.summary())
+    
+    def export_data(self):
+        st.header("Data Export")
+        st.markdown("Download cohort and attendance data as CSV or Parquet.")
+        
+        jobs = load_tracks_view(self.db, self.db.get_data_version(['jobs']))
+        titles = {job['id']: job['title'] for job in jobs}
+        
+        with st.form("export_form"):
+            col_exp1, col_exp2 = st.columns(2)
+            with col_exp1:
+                table = st.selectbox("Dataset", EXPORT_TABLES, format_func=lambda t: t.replace('_', ' ').title())
+                fmt = st.selectbox("Format", EXPORT_FORMATS, format_func=str.upper)
+            with col_exp2:
+                job_id = st.selectbox("Track", [None] + list(titles), format_func=lambda j: "All tracks" if j is None else titles[j])
+                date_range = st.date_input("Date range", value=())
+            prepare = st.form_submit_button("Prepare Export", type="primary")
+        
+        if prepare:
+            filters = {
+                "job_id": job_id,
+                "start_date": date_range[0].isoformat() if len(date_range) > 0 else None,
+                "end_date": date_range[1].isoformat() if len(date_range) > 1 else None
+            }
+            with st.spinner("Exporting..."):
+                data = take_export_file(export_file(self.db, table, fmt, **filters), EXPORT_DOWNLOAD_MAX_BYTES)
+            # The button only exists in the run that prepared it, so the payload is not
+            # rebuilt on later reruns and the temp file is already gone
+            if data is None:
+                st.warning(f"This export is larger than {EXPORT_DOWNLOAD_MAX_BYTES // (1024 * 1024)} MB. Run it with the CLI, which streams straight to disk:")
+                st.code(export_command(table, fmt, **filters), language="bash")
+            else:
+                st.download_button(
+                    f"Download {table}.{fmt}",
+                    data,
+                    file_name=f"{table}.{fmt}",
+                    mime="text/csv" if fmt == "csv" else "application/octet-stream"
+                )
+        else:
+            st.caption(f"Exports up to {EXPORT_DOWNLOAD_MAX_BYTES // (1024 * 1024)} MB can be downloaded here; larger ones run through `python data_export.py`.")
@@ -1,17 +1,33 @@
-import google.generativeai as genai
 import json
 import os
 import re
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
 from dotenv import load_dotenv
+from skill_engine import SkillGapEngine
+from performance import chronological, batch_performance_analysis, metrics_from_stats
+from online_stats import RunningStats
 
 load_dotenv()
 
 class AIService:
     def __init__(self):
-        genai.configure(api_key=os.getenv("API_KEY"))
-        self.model_pro = genai.GenerativeModel('gemini-1.5-pro-latest')
-        self.model_flash = genai.GenerativeModel('gemini-1.5-flash-latest')
+        self._models = {}
+    
+    def _model(self, name: str):
+        # google.generativeai takes most of a second to import, so it loads on the first AI call
+        if name not in self._models:
+            import google.generativeai as genai
+            genai.configure(api_key=os.getenv("API_KEY"))
+            self._models[name] = genai.GenerativeModel(name)
+        return self._models[name]
+    
+    @property
+    def model_pro(self):
+        return self._model('gemini-1.5-pro-latest')
+    
+    @property
+    def model_flash(self):
+        return self._model('gemini-1.5-flash-latest')
     
     def get_analysis(self, job: Dict, user_skills: List[Dict]) -> Dict:
         prompt = f"""Perform a detailed skill gap analysis for the role: {job['title']}.
@@ -115,47 +131,9 @@ class AIService:
             return self.get_fallback_analysis(job, user_skills)
     
     def get_fallback_analysis(self, job: Dict, user_skills: List[Dict]) -> Dict:
-        skill_names = [skill.get('name', '').lower() for skill in user_skills]
-        required_skills = job['required_skills']
-        
-        matched = 0
-        gaps = []
-        
-        for req in required_skills:
-            req_name = req['name'].lower()
-            req_level = req.get('minLevel', 3)
-            
-            user_skill = next((s for s in user_skills if s.get('name', '').lower() == req_name), None)
-            
-            if user_skill:
-                user_level = user_skill.get('level', 0)
-                gap = max(0, req_level - user_level)
-                
-                if gap > 0:
-                    gaps.append({
-                        "skill": req['name'],
-                        "currentLevel": user_level,
-                        "requiredLevel": req_level,
-                        "gapLevel": gap,
-                        "reason": f"Need to improve from level {user_level} to level {req_level}",
-                        "priority": "HIGH" if gap >= 2 else "MEDIUM",
-                        "estimatedImprovementTime": f"{gap * 2} weeks"
-                    })
-                    matched += (user_level / req_level) * 20
-                else:
-                    matched += 20
-            else:
-                gaps.append({
-                    "skill": req['name'],
-                    "currentLevel": 0,
-                    "requiredLevel": req_level,
-                    "gapLevel": req_level,
-                    "reason": "Skill not found in your current skill set",
-                    "priority": "HIGH",
-                    "estimatedImprovementTime": f"{req_level * 2} weeks"
-                })
-        
-        similarity = min(100, int((matched / len(required_skills)) * 100)) if required_skills else 0
+        result = SkillGapEngine([job]).analyze(job['id'], user_skills)
+        similarity = result['similarity']
+        gaps = result['gaps']
         
         return {
             "similarity": similarity,
@@ -344,8 +322,8 @@ class AIService:
         else:
             return quiz_templates['react']
     
-    def get_performance_analysis(self, attendance_data: List[Dict], skill_data: Dict) -> Dict:
-        if not attendance_data:
+    def get_performance_analysis(self, attendance_data: List[Dict], skill_data: Dict, score_stats: Optional[RunningStats] = None) -> Dict:
+        if not attendance_data and not (score_stats and score_stats.count):
             return {
                 "overallScore": 0,
                 "consistency": 0,
@@ -355,22 +333,10 @@ class AIService:
                 "recommendations": []
             }
         
-        scores = [entry['score'] for entry in attendance_data if entry['score']]
-        
-        overall_score = sum(scores) / len(scores) if scores else 0
-        
-        if len(scores) > 1:
-            import statistics
-            consistency = max(0, 100 - (statistics.stdev(scores) * 20))
-        else:
-            consistency = 100
-        
-        if len(scores) > 3:
-            recent_avg = sum(scores[-3:]) / 3
-            older_avg = sum(scores[:3]) / 3
-            improvement_rate = ((recent_avg - older_avg) / older_avg * 100) if older_avg > 0 else 0
-        else:
-            improvement_rate = 0
+        if score_stats is None:
+            scores = [entry['score'] for entry in chronological(attendance_data) if entry['score']]
+            score_stats = RunningStats.from_values(scores)
+        metrics = metrics_from_stats(score_stats)
         
         strengths = []
         weaknesses = []
@@ -383,9 +349,7 @@ class AIService:
                     weaknesses.append(gap['skill'])
         
         return {
-            "overallScore": round(overall_score, 1),
-            "consistency": round(consistency, 1),
-            "improvementRate": round(improvement_rate, 1),
+            **metrics,
             "strengths": strengths[:3],
             "weaknesses": weaknesses[:3],
             "recommendations": [
@@ -395,6 +359,10 @@ class AIService:
             ]
         }
     
+    def get_performance_analysis_batch(self, attendance_frame):
+        """Cohort-wide variant of get_performance_analysis over a columnar (intern_id, date, score) frame."""
+        return batch_performance_analysis(attendance_frame)
+    
     def get_feedback(self, topic: str, score: int, duration: int, quiz_results: Dict) -> str:
         prompt = f"""Provide constructive feedback for an intern who studied "{topic}" 
         for {duration} minutes and scored {score}/10 on their assessment.
@@ -0,0 +1,140 @@
+import math
+from datetime import date
+from typing import Dict, List, Optional
+from online_stats import RunningStats
+from score_histogram import ScoreHistogram
+
+EWMA_ALPHA = 0.3
+MIN_HISTORY = 4
+SCORE_Z_THRESHOLD = 2.5
+DURATION_Z_THRESHOLD = 3.0
+INACTIVITY_DAYS = 7
+MIN_TRACK_SESSIONS = 20
+
+# Floors for the spread so a perfectly steady history does not turn every wobble
+# into a huge z-score
+MIN_SCORE_STD = 1.0
+MIN_DURATION_STD = 10.0
+
+class Ewma:
+    """Exponentially weighted mean and variance, updated in O(1) per value."""
+    
+    def __init__(self, alpha: float = EWMA_ALPHA, mean: float = 0.0, var: float = 0.0, count: int = 0):
+        self.alpha = alpha
+        self.mean = mean
+        self.var = var
+        self.count = count
+    
+    def push(self, value: float) -> None:
+        if self.count == 0:
+            self.mean = float(value)
+        else:
+            diff = value - self.mean
+            increment = self.alpha * diff
+            self.mean += increment
+            self.var = (1 - self.alpha) * (self.var + diff * increment)
+        self.count += 1
+    
+    def z(self, value: float, min_std: float) -> Optional[float]:
+        """Standard score of `value` against the history; None until MIN_HISTORY values."""
+        if self.count < MIN_HISTORY:
+            return None
+        return (value - self.mean) / max(math.sqrt(self.var), min_std)
+    
+    def to_dict(self) -> Dict:
+        return {"mean": self.mean, "var": self.var, "count": self.count}
+    
+    @classmethod
+    def from_dict(cls, data: Dict) -> 'Ewma':
+        return cls(EWMA_ALPHA, data.get('mean', 0.0), data.get('var', 0.0), data.get('count', 0))
+
+class AnomalyState:
+    """Per-intern detector state: score and duration EWMAs plus the last session date."""
+    
+    def __init__(self, score: Optional[Ewma] = None, duration: Optional[Ewma] = None, last_date: Optional[str] = None):
+        self.score = score or Ewma()
+        self.duration = duration or Ewma()
+        self.last_date = last_date
+    
+    def to_dict(self) -> Dict:
+        return {"score": self.score.to_dict(), "duration": self.duration.to_dict(), "last_date": self.last_date}
+    
+    @classmethod
+    def from_dict(cls, data: Dict) -> 'AnomalyState':
+        return cls(Ewma.from_dict(data.get('score', {})), Ewma.from_dict(data.get('duration', {})), data.get('last_date'))
+
+def _alert(kind: str, severity: str, value: float, baseline: float, z: Optional[float], message: str) -> Dict:
+    return {
+        "kind": kind,
+        "severity": severity,
+        "value": value,
+        "baseline": round(baseline, 2),
+        "z": round(z, 2) if z is not None else None,
+        "message": message
+    }
+
+def _outlier(value: float, own: Ewma, track, min_std: float, threshold: float, low_only: bool) -> Optional[List[tuple]]:
+    """(label, baseline, z) per available baseline when `value` is an outlier against all of them.
+    
+    Baselines are the intern's own EWMA (from MIN_HISTORY sessions) and the track's
+    distribution (from MIN_TRACK_SESSIONS); `track` is anything with count/mean/stdev.
+    """
+    checks = []
+    z = own.z(value, min_std)
+    if z is not None:
+        checks.append(("usual", own.mean, z))
+    if track is not None and track.count >= MIN_TRACK_SESSIONS:
+        checks.append(("track", track.mean, (value - track.mean) / max(track.stdev, min_std)))
+    if checks and all(z <= -threshold if low_only else abs(z) >= threshold for _, _, z in checks):
+        return checks
+    return None
+
+def _describe(checks: List[tuple], unit: str = "") -> str:
+    return " and ".join(f"{label} {baseline:.1f}{unit}" for label, baseline, _ in checks)
+
+def detect(state: AnomalyState, log: Dict, track_scores: Optional[ScoreHistogram] = None,
+           track_durations: Optional[RunningStats] = None) -> List[Dict]:
+    """Alerts raised by one new session, then fold it into `state`.
+    
+    Score and duration each get a z-score against the intern's own EWMA and against
+    the track baseline, and are flagged only when every available baseline agrees.
+    So a steady intern who is always below the track mean is not flagged on each
+    session, and a dip that is normal for the track is not flagged either. Before an
+    intern has MIN_HISTORY sessions, the track baseline is the only one.
+    """
+    alerts = []
+    
+    if state.last_date and log['date'] > state.last_date:
+        idle_days = (date.fromisoformat(log['date']) - date.fromisoformat(state.last_date)).days
+        if idle_days >= INACTIVITY_DAYS:
+            alerts.append(_alert(
+                'inactivity_streak', 'MEDIUM', idle_days, INACTIVITY_DAYS, None,
+                f"Returned after {idle_days} days without a session"
+            ))
+    
+    score = log.get('score')
+    if score:
+        checks = _outlier(score, state.score, track_scores, MIN_SCORE_STD, SCORE_Z_THRESHOLD, low_only=True)
+        if checks:
+            # The check closest to the threshold is the one the alert reports and grades
+            _, baseline, z = max(checks, key=lambda check: check[2])
+            alerts.append(_alert(
+                'score_drop', 'HIGH' if z <= -2 * SCORE_Z_THRESHOLD else 'MEDIUM', score, baseline, z,
+                f"Scored {score}/10 against {_describe(checks)}"
+            ))
+        state.score.push(score)
+    
+    duration = log.get('duration') or 0
+    if duration:
+        checks = _outlier(duration, state.duration, track_durations, MIN_DURATION_STD, DURATION_Z_THRESHOLD, low_only=False)
+        if checks:
+            _, baseline, z = min(checks, key=lambda check: abs(check[2]))
+            alerts.append(_alert(
+                'duration_outlier', 'MEDIUM', duration, baseline, z,
+                f"{duration} min session against {_describe(checks, ' min')}"
+            ))
+        state.duration.push(duration)
+    
+    if not state.last_date or log['date'] > state.last_date:
+        state.last_date = log['date']
+    return alerts
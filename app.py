@@ -1,23 +1,34 @@
 import streamlit as st
-import time
 from datetime import datetime
-from database import DatabaseService
-from ai_service import AIService
-from intern_dashboard import InternDashboard
-from admin_dashboard import AdminDashboard
+from notifications import flash, show_flash_messages
+from services import get_db, get_ai
+from warmup import start_warmup
 
-# Initialize services
-db = DatabaseService()
-ai = AIService()
+# Dashboards, pandas, plotly and the AI client load on first use, not for the landing page
+
+def configure_page():
+    """set_page_config for the current role; must be the first Streamlit call of a run."""
+    if st.session_state.role == "INTERN":
+        st.set_page_config(
+            page_title=f"InternTrack | {st.session_state.current_user['name']}'s Dashboard",
+            layout="wide",
+            initial_sidebar_state="collapsed"
+        )
+    elif st.session_state.role:
+        st.set_page_config(
+            page_title="InternTrack | Admin Hub",
+            layout="wide",
+            initial_sidebar_state="expanded"
+        )
+    else:
+        st.set_page_config(
+            page_title="InternTrack | Intelligent Intern Development Platform",
+            page_icon="🎯",
+            layout="wide",
+            initial_sidebar_state="collapsed"
+        )
 
 def landing_page():
-    st.set_page_config(
-        page_title="InternTrack | Intelligent Intern Development Platform",
-        page_icon="🎯",
-        layout="wide",
-        initial_sidebar_state="collapsed"
-    )
-    
     st.markdown("""
         <style>
         .main-title {
@@ -116,8 +127,7 @@ def company_login_page():
             if admin_id == "pgt" and password == "123":
                 st.session_state.role = "COMPANY"
                 st.session_state.auth_view = 'root'
-                st.success("Authentication successful! Redirecting...")
-                time.sleep(1)
+                flash("Authentication successful! Welcome to the Admin Hub.")
                 st.rerun()
             else:
                 st.error("Authentication failed. Please check your credentials.")
@@ -142,7 +152,7 @@ def intern_auth_page():
         
         if st.session_state.is_reg:
             st.markdown("### Select Learning Track")
-            jobs = db.get_jobs()
+            jobs = get_db().get_jobs()
             if jobs:
                 job_titles = {j['id']: f"{j['title']} ({j['domain']})" for j in jobs}
                 selected_job = st.selectbox(
@@ -167,10 +177,9 @@ def intern_auth_page():
                     elif not selected_job:
                         st.error("Please select a learning track.")
                     else:
-                        if db.register_intern(name, email, password, selected_job):
-                            st.success("Profile created successfully! Please login with your credentials.")
+                        if get_db().register_intern(name, email, password, selected_job):
+                            flash("Profile created successfully! Please login with your credentials.")
                             st.session_state.is_reg = False
-                            time.sleep(2)
                             st.rerun()
                         else:
                             st.error("Email already registered. Please use a different email or login.")
@@ -178,13 +187,12 @@ def intern_auth_page():
                     if not email or not password:
                         st.error("Please enter both email and password.")
                     else:
-                        user = db.login_intern(email, password)
+                        user = get_db().login_intern(email, password)
                         if user:
                             st.session_state.role = "INTERN"
                             st.session_state.current_user = user
                             st.session_state.auth_view = 'root'
-                            st.success("Login successful! Loading your dashboard...")
-                            time.sleep(1)
+                            flash("Login successful! Welcome back.")
                             st.rerun()
                         else:
                             st.error("Invalid login credentials. Please try again.")
@@ -207,6 +215,9 @@ def main():
     if 'is_reg' not in st.session_state:
         st.session_state.is_reg = False
     
+    configure_page()
+    show_flash_messages()
+    
     st.markdown("""
         <style>
         .main .block-container {
@@ -247,11 +258,16 @@ def main():
     if not st.session_state.role:
         landing_page()
     elif st.session_state.role == "INTERN":
-        intern_dashboard = InternDashboard(db, ai)
+        from intern_dashboard import InternDashboard
+        intern_dashboard = InternDashboard(get_db(), get_ai())
         intern_dashboard.show()
     else:
-        admin_dashboard = AdminDashboard(db)
+        from admin_dashboard import AdminDashboard
+        admin_dashboard = AdminDashboard(get_db())
         admin_dashboard.show()
+    
+    # Only once this run's page is out, so the warm-up never delays a first paint
+    start_warmup()
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,69 @@
+import queue
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from typing import Any, Callable, Optional
+
+JOB_WORKERS = 2
+# Finished jobs kept for polling; the oldest are dropped first
+JOB_HISTORY_LIMIT = 1000
+
+class Job:
+    def __init__(self, kind: str):
+        self.id = uuid.uuid4().hex
+        self.kind = kind
+        self.state = "queued"
+        self.result: Any = None
+        self.error: Optional[str] = None
+        self.submitted_at = time.time()
+        self.finished_at: Optional[float] = None
+    
+    @property
+    def done(self) -> bool:
+        return self.state in ("done", "failed")
+
+class JobQueue:
+    """In-process FIFO of slow work (LLM calls, metric recomputation) run on worker threads.
+    
+    Callers submit and return at once; they poll get(job_id) for the state and result.
+    Jobs do not survive a restart, so results that matter must also be persisted by the job.
+    """
+    
+    def __init__(self, workers: int = JOB_WORKERS, history_limit: int = JOB_HISTORY_LIMIT):
+        self.history_limit = history_limit
+        self.jobs: OrderedDict = OrderedDict()
+        self.lock = threading.Lock()
+        self.queue: queue.Queue = queue.Queue()
+        for index in range(workers):
+            threading.Thread(target=self._work, name=f"interntrack-jobs-{index}", daemon=True).start()
+    
+    def submit(self, kind: str, func: Callable, *args, **kwargs) -> str:
+        job = Job(kind)
+        with self.lock:
+            self.jobs[job.id] = job
+            while len(self.jobs) > self.history_limit:
+                self.jobs.popitem(last=False)
+        self.queue.put((job, func, args, kwargs))
+        return job.id
+    
+    def get(self, job_id: str) -> Optional[Job]:
+        with self.lock:
+            return self.jobs.get(job_id)
+    
+    def pending(self) -> int:
+        return self.queue.unfinished_tasks
+    
+    def _work(self) -> None:
+        while True:
+            job, func, args, kwargs = self.queue.get()
+            job.state = "running"
+            try:
+                job.result = func(*args, **kwargs)
+                job.state = "done"
+            except Exception as e:
+                job.error = str(e)
+                job.state = "failed"
+            finally:
+                job.finished_at = time.time()
+                self.queue.task_done()
@@ -0,0 +1,62 @@
+"""Throughput of the bulk CSV import into a scratch database.
+
+Usage: python benchmarks/bench_bulk_import.py [interns] [sessions_per_intern]
+"""
+import io
+import os
+import sys
+import csv
+import time
+import random
+import tempfile
+from datetime import date, timedelta
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from database import DatabaseService
+from data_import import import_csv
+
+def synthetic_csv(header, rows) -> io.StringIO:
+    stream = io.StringIO()
+    writer = csv.writer(stream)
+    writer.writerow(header)
+    writer.writerows(rows)
+    stream.seek(0)
+    return stream
+
+def main():
+    interns = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+    sessions = int(sys.argv[2]) if len(sys.argv) > 2 else 20
+    rng = random.Random(7)
+    start = date(2025, 1, 1)
+    
+    intern_rows = [
+        (f"Intern {i}", f"intern{i}@example.com", "secret", "job-1", "React:3; JavaScript:4")
+        for i in range(interns)
+    ]
+    # A few bad rows and duplicates, which must be reported without aborting
+    intern_rows += [("No Email", "", "secret", "job-1", ""), ("Dup", "intern0@example.com", "secret", "job-1", "")]
+    attendance_rows = [
+        (f"intern{i}@example.com", (start + timedelta(days=s)).isoformat(), "10:00:00", "11:00:00",
+         "Study", "docs; video", rng.randint(10, 180), rng.randint(0, 10), "COMPLETED")
+        for i in range(interns) for s in range(sessions)
+    ]
+    attendance_rows.append(("intern0@example.com", "not-a-date", "10:00", "", "", "", 30, 5, ""))
+    
+    with tempfile.TemporaryDirectory() as scratch:
+        os.chdir(scratch)
+        db = DatabaseService()
+        
+        for kind, header, rows in [
+            ("interns", ["name", "email", "password", "track", "skills"], intern_rows),
+            ("attendance", ["email", "date", "time_in", "time_out", "task", "resources", "duration", "score", "status"], attendance_rows)
+        ]:
+            stream = synthetic_csv(header, rows)
+            started = time.perf_counter()
+            report = import_csv(db, kind, stream)
+            elapsed = time.perf_counter() - started
+            print(f"{report.summary()} in {elapsed:.2f}s ({len(rows) / elapsed * 60:,.0f} rows/min)")
+        db.close()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+"""Benchmark batch_performance_analysis against the per-intern get_performance_analysis loop.
+
+Usage: python benchmarks/bench_performance_analysis.py [interns] [sessions_per_intern]
+"""
+import os
+import sys
+import time
+import random
+from datetime import date, timedelta
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pandas as pd
+from ai_service import AIService
+from performance import batch_performance_analysis
+
+def synthetic_attendance(interns: int, sessions: int, seed: int = 7) -> pd.DataFrame:
+    rng = random.Random(seed)
+    start = date(2025, 1, 1)
+    rows = []
+    for i in range(interns):
+        for s in range(rng.randint(1, sessions)):
+            rows.append({
+                "intern_id": f"intern-{i:06d}",
+                "date": (start + timedelta(days=s)).isoformat(),
+                "time_in": f"{rng.randint(8, 20):02d}:00:00",
+                "duration": rng.randint(10, 180),
+                "score": rng.randint(0, 10)
+            })
+    return pd.DataFrame(rows)
+
+def per_intern_loop(ai: AIService, frame: pd.DataFrame) -> dict:
+    results = {}
+    for intern_id, rows in frame.groupby('intern_id'):
+        results[intern_id] = ai.get_performance_analysis(rows.to_dict('records'), {})
+    return results
+
+def main():
+    interns = int(sys.argv[1]) if len(sys.argv) > 1 else 5000
+    sessions = int(sys.argv[2]) if len(sys.argv) > 2 else 40
+    frame = synthetic_attendance(interns, sessions)
+    ai = AIService()
+    
+    started = time.perf_counter()
+    loop_results = per_intern_loop(ai, frame)
+    loop_time = time.perf_counter() - started
+    
+    started = time.perf_counter()
+    batch = batch_performance_analysis(frame)
+    batch_time = time.perf_counter() - started
+    
+    mismatches = 0
+    for intern_id, expected in loop_results.items():
+        row = batch.loc[intern_id]
+        for key in ("overallScore", "consistency", "improvementRate"):
+            if abs(row[key] - expected[key]) > 0.051:
+                mismatches += 1
+    
+    print(f"interns={interns} rows={len(frame)}")
+    print(f"per-intern loop: {loop_time:.3f}s")
+    print(f"batch:           {batch_time:.3f}s ({loop_time / batch_time:.1f}x)")
+    print(f"mismatched values: {mismatches}")
+
+if __name__ == "__main__":
+    main()
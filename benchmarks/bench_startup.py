@@ -0,0 +1,63 @@
+"""Benchmark cold start: importing app.py and rendering the landing page in a fresh process.
+
+Each run is a new interpreter in an empty temporary directory, so nothing is cached
+between runs and the probe's interntrack.db never lands in the repository. Also reports which
+heavy modules the landing page pulled in; none of them should be needed before login.
+
+Usage: python benchmarks/bench_startup.py [runs]
+"""
+import os
+import subprocess
+import sys
+import json
+import statistics
+import tempfile
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+# plotly is left out: streamlit itself imports it
+HEAVY_MODULES = ["pandas", "numpy", "google.generativeai", "database", "admin_dashboard", "intern_dashboard"]
+
+PROBE = """
+import json, sys, time
+started = time.perf_counter()
+sys.path.insert(0, {root!r})
+import app
+imported = time.perf_counter() - started
+
+from streamlit.testing.v1 import AppTest
+at = AppTest.from_file({app!r}, default_timeout=60)
+started = time.perf_counter()
+at.run()
+first_paint = time.perf_counter() - started
+started = time.perf_counter()
+at.run()
+rerun = time.perf_counter() - started
+
+print(json.dumps({{
+    "import": imported,
+    "first_paint": first_paint,
+    "rerun": rerun,
+    "errors": [str(e.value) for e in at.exception],
+    "loaded": [m for m in {heavy!r} if m in sys.modules]
+}}))
+"""
+
+def probe() -> dict:
+    code = PROBE.format(root=ROOT, app=os.path.join(ROOT, "app.py"), heavy=HEAVY_MODULES)
+    with tempfile.TemporaryDirectory() as scratch:
+        output = subprocess.run([sys.executable, "-c", code], cwd=scratch, capture_output=True, text=True, check=True).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+def main():
+    runs = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+    results = [probe() for _ in range(runs)]
+    
+    for key, label in (("import", "import app"), ("first_paint", "landing first paint"), ("rerun", "landing rerun")):
+        values = [result[key] * 1000 for result in results]
+        print(f"{label:<20} median {statistics.median(values):7.1f} ms  (min {min(values):.1f}, max {max(values):.1f})")
+    print(f"heavy modules loaded: {', '.join(results[-1]['loaded']) or 'none'}")
+    if results[-1]['errors']:
+        print(f"errors: {results[-1]['errors']}")
+
+if __name__ == "__main__":
+    main()
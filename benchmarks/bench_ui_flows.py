@@ -0,0 +1,122 @@
+"""Load test: admin logins and dashboard reruns completed by a fixed number of workers.
+
+Each worker is a separate process (AppTest keeps one runtime per process) that drives
+its own sessions back to back, like one server thread serving queued users. A session
+submits the admin login form, which flashes a toast and calls st.rerun() into the admin
+hub, then reruns the hub a few times the way every widget interaction does. All workers
+share one scratch interntrack.db in a temporary directory, never the repository's.
+
+Each run is measured twice: first as a baseline with the old st.success plus
+time.sleep(--sleep seconds) before st.rerun(), then with the current flash path.
+
+Usage: python benchmarks/bench_ui_flows.py [workers] [logins_per_worker] [reruns_per_login] [--sleep SECONDS]
+"""
+import os
+import argparse
+import subprocess
+import sys
+import json
+import time
+import tempfile
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+OLD_SLEEP_SECONDS = 1.0
+
+WORKER = """
+import json, sys, time
+sys.path.insert(0, {root!r})
+import notifications
+import streamlit as st
+from streamlit.testing.v1 import AppTest
+
+if {sleep!r}:
+    def sleeping_flash(message, kind="success"):
+        # The code before flash(): show the message, then hold the script thread
+        st.success(message)
+        time.sleep({sleep!r})
+    # app.py imports flash from notifications on every run, so patching the module swaps it in
+    notifications.flash = sleeping_flash
+
+def session():
+    at = AppTest.from_file({app!r}, default_timeout=60)
+    at.session_state.auth_view = 'company'
+    at.run()
+    at.text_input(key="admin_id").input("pgt")
+    at.text_input(key="admin_pass").input("123")
+    started = time.perf_counter()
+    [button for button in at.button if button.label == "Authenticate & Enter Hub"][0].click().run()
+    submit = time.perf_counter() - started
+    if at.exception or at.session_state.role != "COMPANY":
+        raise RuntimeError(f"login failed: {{[e.value for e in at.exception]}}")
+    
+    reruns = []
+    for _ in range({reruns}):
+        started = time.perf_counter()
+        at.run()
+        reruns.append(time.perf_counter() - started)
+    if at.exception:
+        raise RuntimeError(f"rerun failed: {{[e.value for e in at.exception]}}")
+    return submit, reruns
+
+session()  # warm imports, services and the database before the clock starts
+sys.stdout.write("ready\\n")
+sys.stdout.flush()
+sys.stdin.readline()
+results = [session() for _ in range({logins})]
+print(json.dumps({{"submit": [s for s, _ in results], "rerun": [r for _, rs in results for r in rs]}}))
+"""
+
+def percentile(values: list, q: float) -> float:
+    ordered = sorted(values)
+    return ordered[max(0, int(len(ordered) * q) - 1)] * 1000
+
+def run(workers: int, logins: int, reruns: int, sleep: float, scratch: str) -> tuple:
+    code = WORKER.format(root=ROOT, app=os.path.join(ROOT, "app.py"), logins=logins, reruns=reruns, sleep=sleep)
+    procs = [
+        subprocess.Popen([sys.executable, "-c", code], cwd=scratch, stdin=subprocess.PIPE,
+                         stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True)
+        for _ in range(workers)
+    ]
+    for proc in procs:
+        if proc.stdout.readline().strip() != "ready":
+            raise RuntimeError("worker failed to start")
+    
+    # Release every worker at once and time until the last one finishes
+    started = time.perf_counter()
+    for proc in procs:
+        proc.stdin.write("go\n")
+        proc.stdin.flush()
+    timings = {"submit": [], "rerun": []}
+    for proc in procs:
+        output, _ = proc.communicate()
+        for key, values in json.loads(output.strip().splitlines()[-1]).items():
+            timings[key].extend(values)
+    return workers * logins / (time.perf_counter() - started), timings
+
+def main():
+    parser = argparse.ArgumentParser(description="Admin login and rerun throughput, old sleep path vs flash.")
+    parser.add_argument("workers", type=int, nargs="?", default=4)
+    parser.add_argument("logins", type=int, nargs="?", default=5, help="admin sessions per worker")
+    parser.add_argument("reruns", type=int, nargs="?", default=3, help="hub reruns per session")
+    parser.add_argument("--sleep", type=float, default=OLD_SLEEP_SECONDS,
+                        help="seconds the baseline sleeps before st.rerun(); 0 skips the baseline")
+    args = parser.parse_args()
+    
+    print(f"{args.workers} workers x {args.logins} admin sessions, {args.reruns} hub reruns each")
+    modes = [(f"sleep {args.sleep:g}s", args.sleep)] if args.sleep > 0 else []
+    modes.append(("flash", 0.0))
+    results = {}
+    for label, sleep in modes:
+        # A fresh database per mode, so the second run does not start from a warmer one
+        with tempfile.TemporaryDirectory() as scratch:
+            throughput, timings = run(args.workers, args.logins, args.reruns, sleep, scratch)
+        results[label] = throughput
+        print(f"{label:<10} {throughput:6.2f} sessions/s  "
+              f"submit p50 {percentile(timings['submit'], 0.5):7.1f} ms  p95 {percentile(timings['submit'], 0.95):7.1f} ms  "
+              f"hub rerun p50 {percentile(timings['rerun'], 0.5):7.1f} ms  p95 {percentile(timings['rerun'], 0.95):7.1f} ms")
+    if len(results) == 2:
+        baseline, current = results.values()
+        print(f"flash vs sleep: {current / baseline:.1f}x sessions/s")
+
+if __name__ == "__main__":
+    main()
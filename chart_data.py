@@ -0,0 +1,98 @@
+import hashlib
+import json
+import numpy as np
+from datetime import date
+from typing import Dict, List, Optional
+from score_histogram import SCORE_BINS, ScoreHistogram
+
+# Upper bound on points per plotted series; longer histories are downsampled
+MAX_CHART_POINTS = 150
+
+def data_fingerprint(rows: List[Dict]) -> str:
+    """Cheap identity of a row list: row count, ids and the newest created_at.
+    
+    Attendance rows are never edited in place, so new or removed sessions are the only
+    changes a chart has to notice. Rows without an id are hashed whole.
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    latest = ""
+    for row in rows:
+        if 'id' in row:
+            digest.update(str(row['id']).encode())
+        else:
+            digest.update(json.dumps(row, sort_keys=True, default=str).encode())
+        digest.update(b"\x00")
+        latest = max(latest, str(row.get('created_at') or ""))
+    return f"{len(rows)}:{latest}:{digest.hexdigest()}"
+
+def chronological_sessions(attendance_data: List[Dict]) -> List[Dict]:
+    """Sessions oldest first; the database returns them newest first."""
+    return sorted(attendance_data, key=lambda entry: (entry['date'], entry.get('time_in') or ''))
+
+def lttb_indices(x: np.ndarray, y: np.ndarray, threshold: int) -> np.ndarray:
+    """Largest-Triangle-Three-Buckets: indices of `threshold` points that keep the shape of y(x).
+    
+    The first and last points are always kept; from each bucket in between, the point
+    forming the largest triangle with the previous pick and the next bucket's mean wins.
+    """
+    n = len(x)
+    if threshold >= n or threshold < 3:
+        return np.arange(n)
+    
+    every = (n - 2) / (threshold - 2)
+    picked = np.empty(threshold, dtype=np.int64)
+    picked[0] = a = 0
+    for i in range(threshold - 2):
+        start = int(i * every) + 1
+        end = int((i + 1) * every) + 1
+        next_end = min(int((i + 2) * every) + 1, n)
+        next_x = x[end:next_end].mean()
+        next_y = y[end:next_end].mean()
+        areas = np.abs((x[a] - next_x) * (y[start:end] - y[a]) - (x[a] - x[start:end]) * (next_y - y[a]))
+        a = start + int(areas.argmax())
+        picked[i + 1] = a
+    picked[-1] = n - 1
+    return picked
+
+class SessionSeries:
+    """One intern's sessions as NumPy columns, oldest first.
+    
+    Built once per render from the attendance rows; every chart of that render reads
+    its dates, scores, durations, histogram and trend from here instead of walking the
+    rows again. Unscored sessions (score 0) count towards durations but not towards
+    the score histogram or trend.
+    """
+    
+    def __init__(self, attendance_data: List[Dict]):
+        self.fingerprint = data_fingerprint(attendance_data)
+        rows = chronological_sessions(attendance_data)
+        count = len(rows)
+        
+        self.dates = np.array([entry['date'] for entry in rows], dtype=object)
+        self.days = np.fromiter((date.fromisoformat(entry['date']).toordinal() for entry in rows), dtype=float, count=count)
+        self.scores = np.fromiter((entry['score'] or 0 for entry in rows), dtype=float, count=count)
+        self.durations = np.fromiter((entry['duration'] or 0 for entry in rows), dtype=float, count=count)
+        self.scored = self.scores != 0
+        
+        bins = np.clip(np.rint(self.scores[self.scored]), 0, SCORE_BINS - 1).astype(np.int64)
+        self.histogram = ScoreHistogram(np.bincount(bins, minlength=SCORE_BINS).tolist())
+        self._trend = None
+    
+    def __len__(self) -> int:
+        return len(self.dates)
+    
+    def bucket_counts(self, edges: List[tuple]) -> List[int]:
+        return self.histogram.bucket_counts(edges)
+    
+    def trend(self) -> Optional[np.poly1d]:
+        """Least-squares line of scored sessions against days since the first session."""
+        if self._trend is None:
+            days = self.days[self.scored]
+            if len(np.unique(days)) < 2:
+                return None
+            self._trend = np.poly1d(np.polyfit(days - self.days[0], self.scores[self.scored], 1))
+        return self._trend
+    
+    def sample(self, values: np.ndarray, threshold: int = MAX_CHART_POINTS) -> np.ndarray:
+        """Indices of at most `threshold` sessions that keep the shape of `values` over time."""
+        return lttb_indices(self.days, values, threshold)
@@ -0,0 +1,190 @@
+import time
+import threading
+import pandas as pd
+from typing import List, Dict, Optional
+from database import DatabaseService
+from skill_engine import SkillGapEngine
+from performance import batch_performance_analysis
+
+COHORT_CACHE_TTL = 300
+
+# Changes a frame absorbs as deltas: new attendance rows are appended and updated interns
+# are patched in place; anything else rebuilds it. Events that touch none of the frame's
+# columns (score stats, metrics) need neither.
+APPEND_ONLY_EVENTS = {'session_logged', 'sessions_imported'}
+DELTA_EVENTS = APPEND_ONLY_EVENTS | {'intern_updated'}
+FRAME_EVENTS = DELTA_EVENTS | {'intern_registered', 'interns_imported', 'job_upserted', 'job_deleted'}
+# Intern fields the frame's columns derive from; updates to the others (analysis, metrics) are skipped
+FRAME_INTERN_FIELDS = {'skills', 'onboarded'}
+
+class CohortFrame:
+    """Columnar snapshot of interns, tracks and attendance for one data version.
+    
+    Admin cohort metrics and charts derive from this one object. It is
+    shared across sessions, so treat the frames as read-only.
+    """
+    
+    def __init__(self, interns: List[Dict], jobs: List[Dict], attendance: pd.DataFrame, version: int, change_id: int):
+        self.version = version
+        self.change_id = change_id
+        self.built_at = time.time()
+        self.jobs = jobs
+        self.intern_records = interns
+        self.job_titles = {job['id']: job['title'] for job in jobs}
+        
+        self.interns = pd.DataFrame(
+            [
+                {
+                    "id": intern['id'],
+                    "name": intern['name'],
+                    "email": intern['email'],
+                    "job_id": intern['assigned_job_id'],
+                    "onboarded": intern['onboarded'],
+                    "skills": intern['skills']
+                }
+                for intern in interns
+            ],
+            columns=["id", "name", "email", "job_id", "onboarded", "skills"]
+        )
+        self.interns['track'] = self.interns['job_id'].map(self.job_titles).fillna("N/A")
+        
+        self.attendance = attendance
+        self.attendance['job_id'] = attendance['intern_id'].map(self.interns.set_index('id')['job_id'])
+        self.attendance_rowid = int(attendance['rowid'].max()) if len(attendance) else 0
+        self._performance = None
+        self._intern_summary = None
+    
+    def with_changes(self, sessions: pd.DataFrame, updated: List[Dict], version: int, change_id: int) -> 'CohortFrame':
+        """A new frame with `sessions` appended and `updated` interns patched in.
+        
+        This one stays unchanged for its readers.
+        """
+        frame = CohortFrame.__new__(CohortFrame)
+        frame.__dict__.update(self.__dict__)
+        frame.version = version
+        frame.change_id = change_id
+        if updated:
+            records = {intern['id']: intern for intern in updated}
+            frame.intern_records = [records.get(intern['id'], intern) for intern in self.intern_records]
+            frame.interns = self.interns.copy()
+            for row in frame.interns.index[frame.interns['id'].isin(records)]:
+                intern = records[frame.interns.at[row, 'id']]
+                frame.interns.at[row, 'onboarded'] = intern['onboarded']
+                frame.interns.at[row, 'skills'] = intern['skills']
+            frame._intern_summary = None
+        if len(sessions):
+            sessions = sessions.assign(job_id=sessions['intern_id'].map(self.interns.set_index('id')['job_id']))
+            frame.attendance = pd.concat([self.attendance, sessions], ignore_index=True)
+            frame.attendance_rowid = int(sessions['rowid'].max())
+            frame._performance = None
+            frame._intern_summary = None
+        return frame
+    
+    @property
+    def performance(self) -> pd.DataFrame:
+        if self._performance is None:
+            self._performance = batch_performance_analysis(self.attendance)
+        return self._performance
+    
+    def cohort_metrics(self) -> Dict:
+        performance = self.performance
+        return {
+            "total_interns": len(self.interns),
+            "onboarded": int(self.interns['onboarded'].sum()),
+            "active": len(performance),
+            "avg_score": float(performance['overallScore'].mean()) if len(performance) else None
+        }
+    
+    def overview(self) -> Dict:
+        return {
+            "total_interns": len(self.interns),
+            "total_tracks": len(self.jobs),
+            "total_sessions": len(self.attendance),
+            "avg_duration": float(self.attendance['duration'].mean()) if len(self.attendance) else 0.0
+        }
+    
+    def track_summary(self) -> pd.DataFrame:
+        """Interns and mean skill match per track that has at least one intern."""
+        onboarded = self.interns[self.interns['onboarded']]
+        cohort = SkillGapEngine(self.jobs).score(
+            onboarded['skills'].tolist(),
+            onboarded['job_id'].tolist(),
+            onboarded['id'].tolist()
+        )
+        counts = self.interns['job_id'].value_counts()
+        
+        rows = []
+        for summary in cohort.track_summary():
+            if summary['job_id'] in counts:
+                rows.append({
+                    "Track": summary['title'],
+                    "Interns": int(counts[summary['job_id']]),
+                    "Avg Match": summary['avg_similarity']
+                })
+        return pd.DataFrame(rows, columns=["Track", "Interns", "Avg Match"])
+    
+    def track_score_stats(self) -> pd.DataFrame:
+        scored = self.attendance[self.attendance['score'].fillna(0) != 0]
+        stats = scored.groupby('job_id')['score'].agg(['count', 'mean', 'std', 'min', 'max'])
+        stats.index = stats.index.map(self.job_titles)
+        stats = stats.reset_index()
+        stats.columns = ["Track", "Sessions", "Avg Score", "Std Dev", "Min", "Max"]
+        return stats.round({"Avg Score": 1, "Std Dev": 2}).fillna({"Std Dev": 0.0})
+    
+    def intern_summary(self) -> pd.DataFrame:
+        """One row per intern: average session score, total hours and skill match with the assigned track."""
+        if self._intern_summary is None:
+            scored = self.attendance[self.attendance['score'].fillna(0) != 0]
+            onboarded = self.interns[self.interns['onboarded']]
+            cohort = SkillGapEngine(self.jobs).score(
+                onboarded['skills'].tolist(),
+                onboarded['job_id'].tolist(),
+                onboarded['id'].tolist()
+            )
+            
+            summary = self.interns[['id', 'name', 'track']].set_index('id')
+            summary['avg_score'] = scored.groupby('intern_id')['score'].mean()
+            summary['total_hours'] = (self.attendance.groupby('intern_id')['duration'].sum() / 60).reindex(summary.index, fill_value=0)
+            summary['skill_match'] = pd.Series(cohort.similarity, index=onboarded['id'].to_numpy())
+            self._intern_summary = summary.reset_index()
+        return self._intern_summary
+    
+    def daily_average_scores(self, days: int = 30) -> pd.Series:
+        daily = self.attendance.groupby('date')['score'].mean().sort_index()
+        return daily.iloc[-days:]
+
+_latest: Optional[CohortFrame] = None
+_latest_lock = threading.Lock()
+
+def get_cohort_frame(db: DatabaseService) -> CohortFrame:
+    """The process-wide cohort frame, kept current from the change log.
+    
+    New sessions are appended as deltas past the frame's attendance rowid watermark and
+    interns whose skills changed are re-read one by one; other relevant changes, or an
+    expired TTL, rebuild it from the tables.
+    """
+    global _latest
+    with _latest_lock:
+        version = db.get_data_version()
+        frame = _latest
+        if frame is not None and frame.version == version:
+            return frame
+        
+        # Read the watermark before the data so nothing committed in between is missed
+        change_id = db.get_change_watermark()
+        if frame is not None and time.time() - frame.built_at < COHORT_CACHE_TTL:
+            events = set(db.count_changes_since(frame.change_id)) & FRAME_EVENTS
+            if events <= DELTA_EVENTS:
+                sessions = db.get_attendance_frame(after_rowid=frame.attendance_rowid) if events & APPEND_ONLY_EVENTS else pd.DataFrame()
+                updated = []
+                if 'intern_updated' in events:
+                    intern_ids = {
+                        change['intern_id'] for change in db.get_changes_since(frame.change_id)
+                        if change['event'] == 'intern_updated' and FRAME_INTERN_FIELDS & set(change['details'].get('fields', []))
+                    }
+                    updated = [intern for intern in map(db.get_intern_by_id, sorted(intern_ids)) if intern]
+                _latest = frame.with_changes(sessions, updated, version, change_id)
+                return _latest
+        
+        _latest = CohortFrame(db.get_all_interns(), db.get_jobs(), db.get_attendance_frame(), version, change_id)
+        return _latest
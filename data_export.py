@@ -0,0 +1,237 @@
+import csv
+import json
+import os
+import tempfile
+import time
+from typing import Dict, Iterator, List, Optional
+from database import DatabaseService
+
+EXPORT_CHUNK_SIZE = 5000
+EXPORT_TABLES = ["attendance", "users", "performance_metrics"]
+EXPORT_FORMATS = ["csv", "parquet"]
+# Prepared downloads are written here and swept once they are this old
+EXPORT_TEMP_DIR = os.path.join(tempfile.gettempdir(), "interntrack-exports")
+EXPORT_TEMP_MAX_AGE = 3600
+# Largest export the dashboard serves through a download button; bigger ones go through the CLI
+EXPORT_DOWNLOAD_MAX_BYTES = 50 * 1024 * 1024
+
+# Fixed columns per table so every chunk (and the CSV header) has the same shape
+EXPORT_COLUMNS = {
+    "attendance": ["id", "intern_id", "job_id", "date", "time_in", "time_out", "task",
+                   "resources", "duration", "score", "status", "created_at"],
+    "users": ["id", "name", "email", "job_id", "onboarded", "skills", "similarity",
+              "overallScore", "consistency", "improvementRate", "created_at"],
+    "performance_metrics": ["id", "intern_id", "job_id", "date", "metric_type", "value", "created_at"]
+}
+
+# Parquet column types; built lazily because pyarrow is only needed for Parquet
+PARQUET_SCHEMAS = {
+    "attendance": lambda pa: [
+        ("id", pa.string()), ("intern_id", pa.string()), ("job_id", pa.string()), ("date", pa.string()),
+        ("time_in", pa.string()), ("time_out", pa.string()), ("task", pa.string()), ("resources", pa.string()),
+        ("duration", pa.int64()), ("score", pa.int64()), ("status", pa.string()), ("created_at", pa.string())
+    ],
+    "users": lambda pa: [
+        ("id", pa.string()), ("name", pa.string()), ("email", pa.string()), ("job_id", pa.string()),
+        ("onboarded", pa.bool_()), ("skills", pa.string()), ("similarity", pa.float64()),
+        ("overallScore", pa.float64()), ("consistency", pa.float64()), ("improvementRate", pa.float64()),
+        ("created_at", pa.string())
+    ],
+    "performance_metrics": lambda pa: [
+        ("id", pa.string()), ("intern_id", pa.string()), ("job_id", pa.string()), ("date", pa.string()),
+        ("metric_type", pa.string()), ("value", pa.float64()), ("created_at", pa.string())
+    ]
+}
+
+def _export_query(table: str, job_id: Optional[str], start_date: Optional[str], end_date: Optional[str]):
+    if table == "attendance":
+        query = '''
+            SELECT a.id, a.intern_id, u.assigned_job_id, a.date, a.time_in, a.time_out, a.task,
+                   a.resources, a.duration, a.score, a.status, a.created_at
+            FROM attendance a LEFT JOIN users u ON u.id = a.intern_id
+        '''
+        date_column = "a.date"
+    elif table == "users":
+        query = '''
+            SELECT u.id, u.name, u.email, u.assigned_job_id, u.onboarded, u.skills, u.analysis,
+                   u.performance_metrics, u.created_at
+            FROM users u
+        '''
+        date_column = "DATE(u.created_at)"
+    elif table == "performance_metrics":
+        query = '''
+            SELECT p.id, p.intern_id, u.assigned_job_id, p.date, p.metric_type, p.value, p.created_at
+            FROM performance_metrics p LEFT JOIN users u ON u.id = p.intern_id
+        '''
+        date_column = "p.date"
+    else:
+        raise ValueError(f"Unknown export table: {table}")
+    
+    conditions, params = [], []
+    if job_id:
+        conditions.append("u.assigned_job_id = ?")
+        params.append(job_id)
+    if start_date:
+        conditions.append(f"{date_column} >= ?")
+        params.append(start_date)
+    if end_date:
+        conditions.append(f"{date_column} <= ?")
+        params.append(end_date)
+    if conditions:
+        query += " WHERE " + " AND ".join(conditions)
+    return query, params
+
+def _flatten_user(row) -> Dict:
+    skills = json.loads(row[5]) if row[5] else []
+    analysis = json.loads(row[6]) if row[6] else {}
+    metrics = json.loads(row[7]) if row[7] else {}
+    return {
+        "id": row[0],
+        "name": row[1],
+        "email": row[2],
+        "job_id": row[3],
+        "onboarded": bool(row[4]),
+        "skills": "; ".join(f"{skill.get('name', '')}:{skill.get('level', 0)}" for skill in skills),
+        "similarity": analysis.get('similarity'),
+        "overallScore": metrics.get('overallScore'),
+        "consistency": metrics.get('consistency'),
+        "improvementRate": metrics.get('improvementRate'),
+        "created_at": row[8]
+    }
+
+def _flatten(table: str, row) -> Dict:
+    if table == "users":
+        return _flatten_user(row)
+    record = dict(zip(EXPORT_COLUMNS[table], row))
+    if table == "attendance":
+        record['resources'] = "; ".join(json.loads(record['resources'])) if record['resources'] else ""
+    return record
+
+def iter_export_chunks(db: DatabaseService, table: str, job_id: Optional[str] = None,
+                       start_date: Optional[str] = None, end_date: Optional[str] = None,
+                       chunk_size: int = EXPORT_CHUNK_SIZE) -> Iterator[List[Dict]]:
+    """Flattened rows of `table` in chunks of at most `chunk_size`, read with fetchmany.
+    
+    `users` is filtered on the registration date; the other tables on the row date.
+    """
+    query, params = _export_query(table, job_id, start_date, end_date)
+    # A dedicated cursor, so a consumer that queries the db between chunks does not reset it
+    cursor = db.conn.cursor()
+    cursor.execute(query, params)
+    while True:
+        rows = cursor.fetchmany(chunk_size)
+        if not rows:
+            break
+        yield [_flatten(table, row) for row in rows]
+
+def write_csv(chunks: Iterator[List[Dict]], table: str, out) -> int:
+    """Write chunks to a text stream; returns the number of rows written."""
+    writer = csv.DictWriter(out, fieldnames=EXPORT_COLUMNS[table])
+    writer.writeheader()
+    written = 0
+    for chunk in chunks:
+        writer.writerows(chunk)
+        written += len(chunk)
+    return written
+
+def write_parquet(chunks: Iterator[List[Dict]], table: str, out) -> int:
+    """Write chunks as row groups of one Parquet file (path or binary stream)."""
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+    
+    schema = pa.schema(PARQUET_SCHEMAS[table](pa))
+    written = 0
+    with pq.ParquetWriter(out, schema) as writer:
+        for chunk in chunks:
+            writer.write_table(pa.Table.from_pylist(chunk, schema=schema))
+            written += len(chunk)
+    return written
+
+def export_table(db: DatabaseService, table: str, fmt: str, out, job_id: Optional[str] = None,
+                 start_date: Optional[str] = None, end_date: Optional[str] = None,
+                 chunk_size: int = EXPORT_CHUNK_SIZE) -> int:
+    """Stream `table` to `out` (a text stream for CSV, a path or binary stream for Parquet)."""
+    chunks = iter_export_chunks(db, table, job_id, start_date, end_date, chunk_size)
+    if fmt == "csv":
+        return write_csv(chunks, table, out)
+    if fmt == "parquet":
+        return write_parquet(chunks, table, out)
+    raise ValueError(f"Unknown export format: {fmt}")
+
+def _sweep_export_files(max_age: float = EXPORT_TEMP_MAX_AGE) -> None:
+    cutoff = time.time() - max_age
+    for name in os.listdir(EXPORT_TEMP_DIR):
+        path = os.path.join(EXPORT_TEMP_DIR, name)
+        try:
+            if os.path.getmtime(path) < cutoff:
+                os.remove(path)
+        except OSError:
+            # Removed by another session's sweep in the meantime
+            pass
+
+def export_file(db: DatabaseService, table: str, fmt: str, **filters) -> str:
+    """Stream an export into a new file under EXPORT_TEMP_DIR and return its path.
+    
+    Memory stays at one chunk whatever the table size; callers keep the path, not the data.
+    """
+    os.makedirs(EXPORT_TEMP_DIR, exist_ok=True)
+    _sweep_export_files()
+    handle, path = tempfile.mkstemp(suffix=f".{fmt}", prefix=f"{table}-", dir=EXPORT_TEMP_DIR)
+    try:
+        if fmt == "csv":
+            with os.fdopen(handle, "w", newline="", encoding="utf-8") as out:
+                export_table(db, table, fmt, out, **filters)
+        else:
+            os.close(handle)
+            export_table(db, table, fmt, path, **filters)
+    except Exception:
+        os.remove(path)
+        raise
+    return path
+
+def take_export_file(path: str, max_bytes: int = EXPORT_DOWNLOAD_MAX_BYTES) -> Optional[bytes]:
+    """Read a file from export_file and delete it; None when it is larger than max_bytes."""
+    try:
+        if os.path.getsize(path) > max_bytes:
+            return None
+        with open(path, "rb") as f:
+            return f.read()
+    finally:
+        os.remove(path)
+
+def export_command(table: str, fmt: str, job_id: Optional[str] = None,
+                   start_date: Optional[str] = None, end_date: Optional[str] = None) -> str:
+    """The CLI invocation that streams the same export straight to disk."""
+    parts = ["python data_export.py", table, "--format", fmt, "-o", f"{table}.{fmt}"]
+    for flag, value in (("--track", job_id), ("--start", start_date), ("--end", end_date)):
+        if value:
+            parts += [flag, value]
+    return " ".join(parts)
+
+if __name__ == "__main__":
+    import argparse
+    import sys
+    
+    parser = argparse.ArgumentParser(description="Export InternTrack data to CSV or Parquet.")
+    parser.add_argument("table", choices=EXPORT_TABLES)
+    parser.add_argument("--format", choices=EXPORT_FORMATS, default="csv")
+    parser.add_argument("--output", "-o", help="Output file (CSV defaults to stdout)")
+    parser.add_argument("--track", help="Only interns assigned to this job id")
+    parser.add_argument("--start", help="First date, YYYY-MM-DD")
+    parser.add_argument("--end", help="Last date, YYYY-MM-DD")
+    parser.add_argument("--chunk-size", type=int, default=EXPORT_CHUNK_SIZE)
+    args = parser.parse_args()
+    
+    if args.format == "parquet" and not args.output:
+        parser.error("--output is required for parquet")
+    
+    db = DatabaseService()
+    filters = dict(job_id=args.track, start_date=args.start, end_date=args.end, chunk_size=args.chunk_size)
+    if args.output and args.format == "csv":
+        with open(args.output, "w", newline="", encoding="utf-8") as out:
+            count = export_table(db, args.table, args.format, out, **filters)
+    elif args.output:
+        count = export_table(db, args.table, args.format, args.output, **filters)
+    else:
+        count = export_table(db, args.table, args.format, sys.stdout, **filters)
+    print(f"Exported {count} {args.table} rows", file=sys.stderr)
@@ -0,0 +1,233 @@
+import csv
+import re
+import uuid
+from datetime import date
+from typing import Dict, Iterable, List
+from database import DatabaseService
+from skill_engine import SkillGapEngine
+from skill_taxonomy import get_taxonomy
+
+IMPORT_BATCH_SIZE = 5000
+MAX_REPORTED_ERRORS = 1000
+IMPORT_KINDS = ["tracks", "interns", "attendance"]
+
+TIME_PATTERN = re.compile(r'^\d{2}:\d{2}(:\d{2})?$')
+EMAIL_PATTERN = re.compile(r'^[^@\s]+@[^@\s]+$')
+
+class ImportReport:
+    """Counts and the first MAX_REPORTED_ERRORS bad rows of one import."""
+    
+    def __init__(self, kind: str):
+        self.kind = kind
+        self.inserted = 0
+        self.duplicates = 0
+        self.error_count = 0
+        self.errors: List[tuple] = []
+    
+    def error(self, line: int, message: str) -> None:
+        self.error_count += 1
+        if len(self.errors) < MAX_REPORTED_ERRORS:
+            self.errors.append((line, message))
+    
+    def summary(self) -> str:
+        return f"{self.kind}: {self.inserted} imported, {self.duplicates} duplicates skipped, {self.error_count} rows rejected"
+
+def parse_skills(text: str) -> List[Dict]:
+    """'React:4; TypeScript' -> skill dicts; separators ';' or ',', default level 3."""
+    taxonomy = get_taxonomy()
+    skills = []
+    for part in re.split(r'[;,]', text or ''):
+        part = part.strip()
+        if not part:
+            continue
+        name, _, level = part.partition(':')
+        level = int(level) if level.strip() else 3
+        if not 1 <= level <= 5:
+            raise ValueError(f"skill level out of range for {name.strip()}: {level}")
+        skills.append({"name": taxonomy.display_name(name), "level": level})
+    return skills
+
+def _required(row: Dict, column: str) -> str:
+    value = (row.get(column) or '').strip()
+    if not value:
+        raise ValueError(f"missing {column}")
+    return value
+
+def _rows_with_lines(rows: Iterable[Dict]):
+    # Line 1 is the CSV header
+    return enumerate(rows, start=2)
+
+def import_tracks(db: DatabaseService, rows: Iterable[Dict]) -> ImportReport:
+    """Columns: id (optional), title, domain, description, required_skills ('React:4; CSS:3')."""
+    report = ImportReport("tracks")
+    for line, row in _rows_with_lines(rows):
+        try:
+            required_skills = [
+                {"name": skill['name'], "minLevel": skill['level']}
+                for skill in parse_skills(_required(row, 'required_skills'))
+            ]
+            job = {
+                "id": (row.get('id') or '').strip() or f"job-{uuid.uuid4().hex[:8]}",
+                "title": _required(row, 'title'),
+                "domain": _required(row, 'domain'),
+                "description": (row.get('description') or '').strip(),
+                "required_skills": required_skills
+            }
+        except ValueError as e:
+            report.error(line, str(e))
+            continue
+        db.upsert_job(job)
+        report.inserted += 1
+    return report
+
+def import_interns(db: DatabaseService, rows: Iterable[Dict], batch_size: int = IMPORT_BATCH_SIZE) -> ImportReport:
+    """Columns: name, email, password, track (job id or title), skills (optional).
+    
+    Emails already registered, or seen earlier in the file, are skipped. Interns with
+    skills are onboarded with a skill gap analysis from the local engine.
+    """
+    report = ImportReport("interns")
+    jobs = db.get_jobs()
+    engine = SkillGapEngine(jobs)
+    track_ids = {job['id']: job['id'] for job in jobs}
+    track_ids.update({job['title'].lower(): job['id'] for job in jobs})
+    seen = set(db.get_intern_emails())
+    
+    def flush(batch: List[Dict]) -> None:
+        onboarded = [intern for intern in batch if intern['skills']]
+        if onboarded:
+            cohort = engine.score(
+                [intern['skills'] for intern in onboarded],
+                [intern['assigned_job_id'] for intern in onboarded]
+            )
+            for row, intern in enumerate(onboarded):
+                intern['analysis'] = {"similarity": int(cohort.similarity[row]), "gaps": cohort.gap_records(row, 5)}
+        report.inserted += db.insert_interns(batch)
+    
+    batch = []
+    for line, row in _rows_with_lines(rows):
+        try:
+            email = _required(row, 'email')
+            if not EMAIL_PATTERN.match(email):
+                raise ValueError(f"invalid email: {email}")
+            track = _required(row, 'track')
+            job_id = track_ids.get(track) or track_ids.get(track.lower())
+            if job_id is None:
+                raise ValueError(f"unknown track: {track}")
+            skills = parse_skills(row.get('skills', ''))
+            intern = {
+                "id": str(uuid.uuid4()),
+                "name": _required(row, 'name'),
+                "email": email,
+                "password": _required(row, 'password'),
+                "assigned_job_id": job_id,
+                "skills": skills,
+                "onboarded": bool(skills),
+                "analysis": None
+            }
+        except ValueError as e:
+            report.error(line, str(e))
+            continue
+        
+        if email.lower() in seen:
+            report.duplicates += 1
+            continue
+        seen.add(email.lower())
+        
+        batch.append(intern)
+        if len(batch) >= batch_size:
+            flush(batch)
+            batch = []
+    if batch:
+        flush(batch)
+    return report
+
+def import_attendance(db: DatabaseService, rows: Iterable[Dict], batch_size: int = IMPORT_BATCH_SIZE) -> ImportReport:
+    """Columns: email, date, time_in, time_out, task, resources ('a; b'), duration, score, status.
+    
+    Score stats and anomaly detector state of every intern touched are rebuilt once at the end.
+    """
+    report = ImportReport("attendance")
+    intern_ids = db.get_intern_emails()
+    touched = set()
+    
+    batch = []
+    for line, row in _rows_with_lines(rows):
+        try:
+            email = _required(row, 'email')
+            intern_id = intern_ids.get(email.lower())
+            if intern_id is None:
+                raise ValueError(f"unknown intern: {email}")
+            session_date = _required(row, 'date')
+            date.fromisoformat(session_date)
+            time_in = _required(row, 'time_in')
+            time_out = (row.get('time_out') or '').strip() or None
+            for value in (time_in, time_out):
+                if value and not TIME_PATTERN.match(value):
+                    raise ValueError(f"invalid time: {value}")
+            duration = int(row.get('duration') or 0)
+            score = int(row.get('score') or 0)
+            if duration < 0:
+                raise ValueError(f"negative duration: {duration}")
+            if not 0 <= score <= 10:
+                raise ValueError(f"score out of range: {score}")
+            log = {
+                "intern_id": intern_id,
+                "date": session_date,
+                "time_in": time_in,
+                "time_out": time_out,
+                "task": (row.get('task') or '').strip(),
+                "resources": [r.strip() for r in (row.get('resources') or '').split(';') if r.strip()],
+                "duration": duration,
+                "score": score,
+                "status": (row.get('status') or '').strip().upper() or "COMPLETED"
+            }
+        except ValueError as e:
+            report.error(line, str(e))
+            continue
+        
+        batch.append(log)
+        touched.add(intern_id)
+        if len(batch) >= batch_size:
+            report.inserted += db.insert_attendance(batch)
+            batch = []
+    if batch:
+        report.inserted += db.insert_attendance(batch)
+    
+    if touched:
+        db.rebuild_score_stats_many(sorted(touched))
+        db.rebuild_anomaly_states(sorted(touched))
+    return report
+
+def import_csv(db: DatabaseService, kind: str, stream, batch_size: int = IMPORT_BATCH_SIZE) -> ImportReport:
+    """Import a CSV text stream of `kind` rows; the file is read row by row."""
+    rows = csv.DictReader(stream)
+    if kind == "tracks":
+        return import_tracks(db, rows)
+    if kind == "interns":
+        return import_interns(db, rows, batch_size)
+    if kind == "attendance":
+        return import_attendance(db, rows, batch_size)
+    raise ValueError(f"Unknown import kind: {kind}")
+
+if __name__ == "__main__":
+    import argparse
+    import sys
+    import time
+    
+    parser = argparse.ArgumentParser(description="Bulk import InternTrack tracks, interns or attendance from CSV.")
+    parser.add_argument("kind", choices=IMPORT_KINDS)
+    parser.add_argument("path", help="CSV file with a header row")
+    parser.add_argument("--batch-size", type=int, default=IMPORT_BATCH_SIZE)
+    args = parser.parse_args()
+    
+    started = time.perf_counter()
+    with open(args.path, newline="", encoding="utf-8-sig") as stream:
+        report = import_csv(DatabaseService(), args.kind, stream, args.batch_size)
+    elapsed = time.perf_counter() - started
+    
+    print(f"{report.summary()} in {elapsed:.1f}s")
+    for line, message in report.errors:
+        print(f"  line {line}: {message}", file=sys.stderr)
+    if report.error_count > len(report.errors):
+        print(f"  ... and {report.error_count - len(report.errors)} more", file=sys.stderr)
@@ -1,17 +1,168 @@
+import os
 import sqlite3
 import json
 from datetime import date, datetime, timedelta
 import uuid
-from typing import List, Dict, Optional
+import functools
+import logging
+import queue
+import threading
+import weakref
+from typing import List, Dict, Optional, Callable
+from online_stats import RunningStats
+from score_histogram import ScoreHistogram
+from anomaly_detection import AnomalyState, INACTIVITY_DAYS, detect
+
+logger = logging.getLogger(__name__)
+
+CHANGE_LOG_RETENTION_DAYS = 90
+# Seconds a connection waits for another connection's write lock before raising
+DB_BUSY_TIMEOUT = 30
+# Idle connections kept for reuse; threads beyond this close theirs when they end
+DB_POOL_SIZE = 8
+
+def writes(method):
+    """Run a mutator under the process-wide write lock and roll back its transaction on error."""
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        with self.write_lock:
+            try:
+                return method(self, *args, **kwargs)
+            except Exception:
+                self.conn.rollback()
+                raise
+    return wrapper
+
+class _Lease:
+    __slots__ = ('conn', '__weakref__')
+    
+    def __init__(self, conn: sqlite3.Connection):
+        self.conn = conn
+
+class ConnectionPool:
+    """SQLite connections shared across threads, one thread at a time.
+    
+    Streamlit runs every rerun on a new thread, so a connection per thread would open a
+    new connection (with a cold page cache) on every rerun. Instead a thread borrows an
+    idle connection on first use and hands it back when the thread ends.
+    """
+    def __init__(self, path: str, size: int = DB_POOL_SIZE):
+        self.path = path
+        self.idle: queue.LifoQueue = queue.LifoQueue(maxsize=size)
+        self._local = threading.local()
+    
+    def connection(self) -> sqlite3.Connection:
+        lease = getattr(self._local, 'lease', None)
+        if lease is None:
+            try:
+                conn = self.idle.get_nowait()
+            except queue.Empty:
+                conn = sqlite3.connect(self.path, timeout=DB_BUSY_TIMEOUT, check_same_thread=False)
+            lease = self._local.lease = _Lease(conn)
+            # The thread's locals are dropped when it ends, which returns the connection
+            weakref.finalize(lease, self._give_back, conn)
+        return lease.conn
+    
+    def _give_back(self, conn: sqlite3.Connection) -> None:
+        try:
+            # Never pass an unfinished transaction on to the next thread
+            conn.rollback()
+            self.idle.put_nowait(conn)
+        except (sqlite3.Error, queue.Full):
+            conn.close()
+    
+    def close(self) -> None:
+        """Close the idle connections and this thread's; other threads keep theirs until they end."""
+        lease = getattr(self._local, 'lease', None)
+        if lease is not None:
+            del self._local.lease
+            lease.conn.close()
+        while True:
+            try:
+                self.idle.get_nowait().close()
+            except queue.Empty:
+                return
 
 class DatabaseService:
+    # Process-wide change listeners and derived caches; they outlive the per-rerun instances
+    listeners: List[Callable[[str, object], None]] = []
+    # Events reach the listeners on one dispatcher thread, in commit order, so a slow or
+    # failing listener never holds up or fails the write that raised the event
+    _events: queue.Queue = queue.Queue()
+    _dispatcher: Optional[threading.Thread] = None
+    _dispatcher_lock = threading.Lock()
+    track_fit = None
+    _track_fit_lock = threading.Lock()
+    # In-process per-intern write counters; dashboards compare them to skip reloading
+    intern_versions: Dict[str, int] = {}
+    # Mutators read-modify-write JSON state (score stats, detector state) and read
+    # per-connection counters (total_changes, rowcount), so writers go one at a time
+    write_lock = threading.RLock()
+    
     def __init__(self):
-        self.conn = self.init_db()
+        # Resolved once, so connections opened later by other threads use the same file
+        self.path = os.path.abspath('interntrack.db')
+        self.pool = ConnectionPool(self.path)
+        with self.write_lock:
+            self.init_db()
+    
+    @property
+    def conn(self) -> sqlite3.Connection:
+        """This thread's connection: sessions, warm-up and job workers never share a transaction."""
+        return self.pool.connection()
+    
+    def close(self) -> None:
+        self.pool.close()
+    
+    @classmethod
+    def add_listener(cls, listener: Callable[[str, object], None]) -> None:
+        cls.listeners.append(listener)
+    
+    @classmethod
+    def touch_interns(cls, intern_ids) -> None:
+        for intern_id in intern_ids:
+            cls.intern_versions[intern_id] = cls.intern_versions.get(intern_id, 0) + 1
+    
+    def get_intern_version(self, intern_id: str) -> int:
+        """Bumped by this process's writes to the intern's profile or sessions; no query involved."""
+        return self.intern_versions.get(intern_id, 0)
+    
+    def notify(self, event: str, payload) -> None:
+        """Queue a change event for the listeners; called after the write has committed."""
+        if not self.listeners:
+            return
+        cls = type(self)
+        with cls._dispatcher_lock:
+            if cls._dispatcher is None:
+                cls._dispatcher = threading.Thread(target=cls._dispatch, name="interntrack-listeners", daemon=True)
+                cls._dispatcher.start()
+        # Callers keep using their dicts (e.g. the session's current_user) after the write
+        cls._events.put((event, dict(payload) if isinstance(payload, dict) else payload))
+    
+    @classmethod
+    def _dispatch(cls) -> None:
+        while True:
+            event, payload = cls._events.get()
+            try:
+                for listener in list(cls.listeners):
+                    try:
+                        listener(event, payload)
+                    except Exception:
+                        logger.exception("Change listener %r failed on %s", listener, event)
+            finally:
+                cls._events.task_done()
+    
+    @classmethod
+    def wait_for_listeners(cls) -> None:
+        """Block until every queued change event has been delivered."""
+        cls._events.join()
     
     def init_db(self):
         """Initialize SQLite database with all required tables"""
-        conn = sqlite3.connect('interntrack.db', check_same_thread=False)
+        conn = self.conn
         cursor = conn.cursor()
+        # Readers on other connections keep their snapshot instead of blocking on a writer
+        cursor.execute("PRAGMA journal_mode=WAL")
         
         cursor.execute('''
             CREATE TABLE IF NOT EXISTS jobs (
@@ -70,6 +221,120 @@ class DatabaseService:
             )
         ''')
         
+        # Write counters bumped by every mutator. PRAGMA data_version would be cheaper but
+        # ignores commits made on the same connection, which is all of ours
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS data_versions (
+                name TEXT PRIMARY KEY,
+                version INTEGER NOT NULL DEFAULT 0
+            )
+        ''')
+        
+        # Scored sessions per (track, day, score); any track/date scope is a SUM over
+        # these rows, so distributions cost O(tracks x days) however large the cohort
+        cursor.execute("SELECT COUNT(*) FROM sqlite_master WHERE type = 'table' AND name = 'score_histograms'")
+        backfill_histograms = cursor.fetchone()[0] == 0
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS score_histograms (
+                job_id TEXT NOT NULL,
+                date TEXT NOT NULL,
+                score INTEGER NOT NULL,
+                count INTEGER NOT NULL DEFAULT 0,
+                PRIMARY KEY (job_id, date, score)
+            )
+        ''')
+        cursor.execute("CREATE INDEX IF NOT EXISTS idx_score_histograms_date ON score_histograms (date)")
+        if backfill_histograms:
+            cursor.execute('''
+                INSERT INTO score_histograms (job_id, date, score, count)
+                SELECT COALESCE(u.assigned_job_id, ''), a.date, MIN(MAX(CAST(ROUND(a.score) AS INTEGER), 0), 10), COUNT(*)
+                FROM attendance a LEFT JOIN users u ON u.id = a.intern_id
+                WHERE a.score
+                GROUP BY 1, 2, 3
+            ''')
+        
+        # Per-track session duration moments, the anomaly detector's track baseline
+        cursor.execute("SELECT COUNT(*) FROM sqlite_master WHERE type = 'table' AND name = 'track_duration_stats'")
+        backfill_durations = cursor.fetchone()[0] == 0
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS track_duration_stats (
+                job_id TEXT PRIMARY KEY,
+                count INTEGER NOT NULL DEFAULT 0,
+                total REAL NOT NULL DEFAULT 0,
+                total_sq REAL NOT NULL DEFAULT 0
+            )
+        ''')
+        if backfill_durations:
+            cursor.execute('''
+                INSERT INTO track_duration_stats (job_id, count, total, total_sq)
+                SELECT COALESCE(u.assigned_job_id, ''), COUNT(*), SUM(a.duration), SUM(a.duration * a.duration)
+                FROM attendance a LEFT JOIN users u ON u.id = a.intern_id
+                WHERE a.duration > 0
+                GROUP BY 1
+            ''')
+        
+        # Append-only feed of what the mutators changed; its ids are the watermarks that
+        # incremental consumers and the admin "since last visit" panel resume from
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS change_log (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                event TEXT NOT NULL,
+                intern_id TEXT,
+                job_id TEXT,
+                details TEXT,
+                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+            )
+        ''')
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS admin_watermarks (
+                admin TEXT PRIMARY KEY,
+                change_id INTEGER NOT NULL,
+                seen_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+            )
+        ''')
+        cursor.execute("DELETE FROM change_log WHERE created_at < DATETIME('now', ?)", (f"-{CHANGE_LOG_RETENTION_DAYS} days",))
+        
+        cursor.execute("CREATE INDEX IF NOT EXISTS idx_attendance_intern ON attendance (intern_id, date)")
+        # NOCASE so the default case-insensitive LIKE 'prefix%' can use them
+        cursor.execute("CREATE INDEX IF NOT EXISTS idx_users_name ON users (name COLLATE NOCASE)")
+        cursor.execute("CREATE INDEX IF NOT EXISTS idx_users_email ON users (email COLLATE NOCASE)")
+        
+        cursor.execute("PRAGMA table_info(users)")
+        if 'score_stats' not in [column[1] for column in cursor.fetchall()]:
+            cursor.execute("ALTER TABLE users ADD COLUMN score_stats TEXT")
+            cursor.execute("SELECT DISTINCT intern_id FROM attendance")
+            for (intern_id,) in cursor.fetchall():
+                stats = self._score_stats_from_attendance(cursor, intern_id)
+                cursor.execute("UPDATE users SET score_stats = ? WHERE id = ?", (json.dumps(stats.to_dict()), intern_id))
+        
+        cursor.execute("PRAGMA table_info(users)")
+        if 'anomaly_state' not in [column[1] for column in cursor.fetchall()]:
+            cursor.execute("ALTER TABLE users ADD COLUMN anomaly_state TEXT")
+            cursor.execute("SELECT DISTINCT intern_id FROM attendance")
+            for (intern_id,) in cursor.fetchall():
+                state = self._anomaly_state_from_attendance(cursor, intern_id)
+                cursor.execute("UPDATE users SET anomaly_state = ? WHERE id = ?", (json.dumps(state.to_dict()), intern_id))
+        
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS alerts (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                intern_id TEXT NOT NULL,
+                job_id TEXT,
+                kind TEXT NOT NULL,
+                severity TEXT NOT NULL,
+                value REAL,
+                baseline REAL,
+                z REAL,
+                message TEXT,
+                session_date TEXT,
+                resolved INTEGER NOT NULL DEFAULT 0,
+                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                FOREIGN KEY (intern_id) REFERENCES users (id)
+            )
+        ''')
+        cursor.execute("CREATE INDEX IF NOT EXISTS idx_alerts_open ON alerts (resolved, id)")
+        cursor.execute("CREATE INDEX IF NOT EXISTS idx_alerts_intern ON alerts (intern_id, resolved, kind)")
+        
         cursor.execute("SELECT COUNT(*) FROM jobs")
         if cursor.fetchone()[0] == 0:
             sample_jobs = [
@@ -95,8 +360,81 @@ class DatabaseService:
             ''', sample_jobs)
         
         conn.commit()
-        return conn
     
+    def _bump_version(self, cursor, *names: str) -> None:
+        cursor.executemany('''
+            INSERT INTO data_versions (name, version) VALUES (?, 1)
+            ON CONFLICT(name) DO UPDATE SET version = version + 1
+        ''', [(name,) for name in names])
+    
+    def _record_change(self, cursor, event: str, intern_id: Optional[str] = None,
+                       job_id: Optional[str] = None, details: Optional[Dict] = None) -> None:
+        cursor.execute(
+            "INSERT INTO change_log (event, intern_id, job_id, details) VALUES (?, ?, ?, ?)",
+            (event, intern_id, job_id, json.dumps(details) if details else None)
+        )
+    
+    def get_change_watermark(self) -> int:
+        """Id of the latest change; read it before the data it should cover."""
+        cursor = self.conn.cursor()
+        cursor.execute("SELECT COALESCE(MAX(id), 0) FROM change_log")
+        return cursor.fetchone()[0]
+    
+    def get_changes_since(self, change_id: int, limit: Optional[int] = None) -> List[Dict]:
+        """Changes after `change_id`, oldest first (the newest `limit` when limited)."""
+        cursor = self.conn.cursor()
+        query = "SELECT id, event, intern_id, job_id, details, created_at FROM change_log WHERE id > ? ORDER BY id DESC"
+        if limit:
+            cursor.execute(query + " LIMIT ?", (change_id, limit))
+        else:
+            cursor.execute(query, (change_id,))
+        
+        return [
+            {
+                "id": row[0],
+                "event": row[1],
+                "intern_id": row[2],
+                "job_id": row[3],
+                "details": json.loads(row[4]) if row[4] else {},
+                "created_at": row[5]
+            }
+            for row in reversed(cursor.fetchall())
+        ]
+    
+    def count_changes_since(self, change_id: int) -> Dict[str, int]:
+        cursor = self.conn.cursor()
+        cursor.execute('''
+            SELECT event, SUM(CASE WHEN event IN ('sessions_imported', 'interns_imported')
+                                   THEN json_extract(details, '$.count') ELSE 1 END)
+            FROM change_log WHERE id > ? GROUP BY event
+        ''', (change_id,))
+        return dict(cursor.fetchall())
+    
+    def get_admin_watermark(self, admin: str) -> int:
+        cursor = self.conn.cursor()
+        cursor.execute("SELECT change_id FROM admin_watermarks WHERE admin = ?", (admin,))
+        row = cursor.fetchone()
+        return row[0] if row else 0
+    
+    @writes
+    def set_admin_watermark(self, admin: str, change_id: int) -> None:
+        cursor = self.conn.cursor()
+        cursor.execute('''
+            INSERT INTO admin_watermarks (admin, change_id) VALUES (?, ?)
+            ON CONFLICT(admin) DO UPDATE SET change_id = MAX(change_id, excluded.change_id), seen_at = CURRENT_TIMESTAMP
+        ''', (admin, change_id))
+        self.conn.commit()
+    
+    def get_data_version(self, names: Optional[List[str]] = None) -> int:
+        """Monotonic counter over the given tables (all tables by default) for cache keys."""
+        cursor = self.conn.cursor()
+        if names:
+            cursor.execute(f"SELECT COALESCE(SUM(version), 0) FROM data_versions WHERE name IN ({', '.join('?' for _ in names)})", names)
+        else:
+            cursor.execute("SELECT COALESCE(SUM(version), 0) FROM data_versions")
+        return cursor.fetchone()[0]
+    
+    @writes
     def register_intern(self, name: str, email: str, password: str, job_id: str) -> bool:
         cursor = self.conn.cursor()
         cursor.execute("SELECT COUNT(*) FROM users WHERE email = ?", (email,))
@@ -109,7 +447,17 @@ class DatabaseService:
             VALUES (?, ?, ?, ?, ?, ?, ?)
         ''', (user_id, name, email, password, job_id, 0, json.dumps({})))
         
+        self._record_change(cursor, 'intern_registered', user_id, job_id, {"name": name})
+        self._bump_version(cursor, 'users')
         self.conn.commit()
+        self.notify('intern_registered', {
+            "id": user_id,
+            "name": name,
+            "email": email,
+            "assigned_job_id": job_id,
+            "skills": [],
+            "onboarded": False
+        })
         return True
     
     def login_intern(self, email: str, password: str) -> Optional[Dict]:
@@ -143,52 +491,69 @@ class DatabaseService:
             }
         return None
     
+    @writes
     def update_intern(self, user: Dict) -> None:
         cursor = self.conn.cursor()
         cursor.execute("PRAGMA table_info(users)")
         columns = [column[1] for column in cursor.fetchall()]
         
-        if 'performance_metrics' in columns:
+        fields = ("skills", "onboarded", "analysis", "performance_metrics")
+        has_metrics = 'performance_metrics' in columns
+        current = (
+            json.dumps(user['skills']),
+            int(user['onboarded']),
+            json.dumps(user['analysis']),
+            json.dumps(user.get('performance_metrics', {})) if has_metrics else None
+        )
+        cursor.execute(f"SELECT skills, onboarded, analysis, {'performance_metrics' if has_metrics else 'NULL'} FROM users WHERE id = ?", (user['id'],))
+        previous = cursor.fetchone()
+        if previous is not None:
+            # Registration leaves skills and analysis NULL; compare them as the JSON written here
+            previous = (previous[0] or json.dumps([]), previous[1], previous[2] or json.dumps(None), previous[3])
+        if previous is not None and tuple(previous) == current:
+            # Dashboards re-save unchanged interns on rerun; skip the write and the change feed
+            return
+        
+        if has_metrics:
             cursor.execute('''
                 UPDATE users 
                 SET skills = ?, onboarded = ?, analysis = ?, performance_metrics = ?
                 WHERE id = ?
-            ''', (
-                json.dumps(user['skills']),
-                int(user['onboarded']),
-                json.dumps(user['analysis']),
-                json.dumps(user.get('performance_metrics', {})),
-                user['id']
-            ))
+            ''', (*current, user['id']))
         else:
             cursor.execute('''
                 UPDATE users 
                 SET skills = ?, onboarded = ?, analysis = ?
                 WHERE id = ?
-            ''', (
-                json.dumps(user['skills']),
-                int(user['onboarded']),
-                json.dumps(user['analysis']),
-                user['id']
-            ))
+            ''', (*current[:3], user['id']))
+        
+        previous = previous or (None,) * len(fields)
+        details = {"fields": [name for name, old, new in zip(fields, previous, current) if old != new]}
+        old_score = (json.loads(previous[3]) or {}).get('overallScore') if previous[3] else None
+        new_score = (user.get('performance_metrics') or {}).get('overallScore')
+        if old_score != new_score:
+            details["overallScore"] = [old_score, new_score]
+        self._record_change(cursor, 'intern_updated', user['id'], user.get('assigned_job_id'), details)
         
+        self._bump_version(cursor, 'users')
         self.conn.commit()
+        self.touch_interns([user['id']])
+        self.notify('intern_updated', user)
     
+    @writes
     def update_performance_metrics(self, intern_id: str, metrics: Dict) -> None:
         cursor = self.conn.cursor()
-        for metric_type, value in metrics.items():
-            metric_id = str(uuid.uuid4())
-            cursor.execute('''
-                INSERT INTO performance_metrics (id, intern_id, date, metric_type, value)
-                VALUES (?, ?, ?, ?, ?)
-            ''', (
-                metric_id,
-                intern_id,
-                date.today().isoformat(),
-                metric_type,
-                value
-            ))
+        # Analyses also carry strengths/weaknesses lists; the REAL value column takes numbers only
+        cursor.executemany('''
+            INSERT INTO performance_metrics (id, intern_id, date, metric_type, value)
+            VALUES (?, ?, ?, ?, ?)
+        ''', [
+            (str(uuid.uuid4()), intern_id, date.today().isoformat(), metric_type, value)
+            for metric_type, value in metrics.items()
+            if isinstance(value, (int, float)) and not isinstance(value, bool)
+        ])
         
+        self._bump_version(cursor, 'performance_metrics')
         self.conn.commit()
     
     def get_jobs(self) -> List[Dict]:
@@ -225,6 +590,7 @@ class DatabaseService:
             }
         return None
     
+    @writes
     def upsert_job(self, job: Dict) -> None:
         cursor = self.conn.cursor()
         cursor.execute("SELECT COUNT(*) FROM jobs WHERE id = ?", (job['id'],))
@@ -251,13 +617,110 @@ class DatabaseService:
                 json.dumps(job['required_skills'])
             ))
         
+        self._record_change(cursor, 'job_upserted', job_id=job['id'], details={"title": job['title']})
+        self._bump_version(cursor, 'jobs')
         self.conn.commit()
+        self.notify('job_upserted', job)
     
+    @writes
     def delete_job(self, job_id: str) -> None:
         cursor = self.conn.cursor()
         cursor.execute("DELETE FROM jobs WHERE id = ?", (job_id,))
+        self._record_change(cursor, 'job_deleted', job_id=job_id)
+        self._bump_version(cursor, 'jobs')
         self.conn.commit()
+        self.notify('job_deleted', job_id)
+    
+    def get_intern_emails(self) -> Dict[str, str]:
+        """Lower-cased email -> intern id for every registered intern."""
+        cursor = self.conn.cursor()
+        cursor.execute("SELECT LOWER(email), id FROM users")
+        return dict(cursor.fetchall())
+    
+    def get_intern_names(self, intern_ids: List[str]) -> Dict[str, str]:
+        """Intern id -> name for the given ids; unknown ids are left out."""
+        ids = sorted({intern_id for intern_id in intern_ids if intern_id})
+        if not ids:
+            return {}
+        cursor = self.conn.cursor()
+        cursor.execute(f"SELECT id, name FROM users WHERE id IN ({', '.join('?' for _ in ids)})", ids)
+        return dict(cursor.fetchall())
     
+    @writes
+    def insert_interns(self, interns: List[Dict]) -> int:
+        """Insert many interns in one transaction; rows whose email already exists are skipped."""
+        cursor = self.conn.cursor()
+        before = self.conn.total_changes
+        cursor.executemany('''
+            INSERT INTO users (id, name, email, password, assigned_job_id, skills, onboarded, analysis, performance_metrics)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+            ON CONFLICT(email) DO NOTHING
+        ''', [
+            (
+                intern['id'],
+                intern['name'],
+                intern['email'],
+                intern['password'],
+                intern['assigned_job_id'],
+                json.dumps(intern['skills']),
+                int(intern['onboarded']),
+                json.dumps(intern['analysis']) if intern.get('analysis') else None,
+                json.dumps({})
+            )
+            for intern in interns
+        ])
+        inserted = self.conn.total_changes - before
+        if inserted < len(interns):
+            ids = [intern['id'] for intern in interns]
+            cursor.execute(f"SELECT id FROM users WHERE id IN ({', '.join('?' for _ in ids)})", ids)
+            kept = {row[0] for row in cursor.fetchall()}
+            interns = [intern for intern in interns if intern['id'] in kept]
+        
+        if interns:
+            self._record_change(cursor, 'interns_imported', details={"count": len(interns)})
+        self._bump_version(cursor, 'users')
+        self.conn.commit()
+        for intern in interns:
+            self.notify('intern_registered', intern)
+        return inserted
+    
+    @writes
+    def insert_attendance(self, logs: List[Dict]) -> int:
+        """Insert many sessions in one transaction without touching score stats.
+        
+        Callers rebuild the stats of the affected interns afterwards
+        (rebuild_score_stats_many), since backfilled sessions are rarely in date order.
+        """
+        cursor = self.conn.cursor()
+        cursor.executemany('''
+            INSERT INTO attendance (id, intern_id, date, time_in, time_out, task, resources, duration, score, status, quiz_results)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+        ''', [
+            (
+                log.get('id') or str(uuid.uuid4()),
+                log['intern_id'],
+                log['date'],
+                log['time_in'],
+                log['time_out'],
+                log['task'],
+                json.dumps(log['resources']),
+                log['duration'],
+                log['score'],
+                log['status'],
+                json.dumps(log.get('quiz_results', {}))
+            )
+            for log in logs
+        ])
+        
+        self._add_to_score_histograms(cursor, logs)
+        self._add_to_track_durations(cursor, logs)
+        self._record_change(cursor, 'sessions_imported', details={"count": len(logs)})
+        self._bump_version(cursor, 'attendance', 'score_histograms')
+        self.conn.commit()
+        self.touch_interns({log['intern_id'] for log in logs})
+        return len(logs)
+    
+    @writes
     def log_attendance(self, log: Dict) -> str:
         cursor = self.conn.cursor()
         log_id = str(uuid.uuid4())
@@ -279,13 +742,322 @@ class DatabaseService:
             json.dumps(log.get('quiz_results', {}))
         ))
         
+        # Detection first, so the session is judged against the baselines before it
+        self._detect_anomalies(cursor, log)
+        self._add_to_track_durations(cursor, [log])
+        if log['score']:
+            self._push_score_stats(cursor, log['intern_id'], log['score'])
+            self._add_to_score_histograms(cursor, [log])
+        
+        self._record_change(cursor, 'session_logged', log['intern_id'], details={
+            "date": log['date'],
+            "score": log['score'],
+            "duration": log['duration']
+        })
+        self._bump_version(cursor, 'attendance', 'users', 'score_histograms', 'alerts')
         self.conn.commit()
+        self.touch_interns([log['intern_id']])
+        self.notify('attendance_logged', {**log, "id": log_id})
         return log_id
     
+    def _score_stats_from_attendance(self, cursor, intern_id: str) -> RunningStats:
+        cursor.execute('''
+            SELECT score FROM attendance WHERE intern_id = ? AND score
+            ORDER BY date, time_in
+        ''', (intern_id,))
+        return RunningStats.from_values(row[0] for row in cursor.fetchall())
+    
+    def _push_score_stats(self, cursor, intern_id: str, score: int) -> None:
+        """O(1) update of the running score stats stored next to the user.
+        
+        Sessions are assumed to arrive in date order; backfills should call
+        rebuild_score_stats so the early/recent windows stay chronological.
+        """
+        cursor.execute("SELECT score_stats FROM users WHERE id = ?", (intern_id,))
+        row = cursor.fetchone()
+        if row is None:
+            return
+        if row[0]:
+            stats = RunningStats.from_dict(json.loads(row[0]))
+            stats.push(score)
+        else:
+            stats = self._score_stats_from_attendance(cursor, intern_id)
+        cursor.execute("UPDATE users SET score_stats = ? WHERE id = ?", (json.dumps(stats.to_dict()), intern_id))
+    
+    @writes
+    def rebuild_score_stats(self, intern_id: str) -> RunningStats:
+        cursor = self.conn.cursor()
+        stats = self._score_stats_from_attendance(cursor, intern_id)
+        cursor.execute("UPDATE users SET score_stats = ? WHERE id = ?", (json.dumps(stats.to_dict()), intern_id))
+        self._bump_version(cursor, 'users')
+        self.conn.commit()
+        return stats
+    
+    @writes
+    def rebuild_score_stats_many(self, intern_ids: List[str]) -> None:
+        """rebuild_score_stats for many interns in a single transaction."""
+        cursor = self.conn.cursor()
+        updates = [
+            (json.dumps(self._score_stats_from_attendance(cursor, intern_id).to_dict()), intern_id)
+            for intern_id in intern_ids
+        ]
+        cursor.executemany("UPDATE users SET score_stats = ? WHERE id = ?", updates)
+        self._bump_version(cursor, 'users')
+        self.conn.commit()
+        self.touch_interns(intern_ids)
+    
+    def _anomaly_state_from_attendance(self, cursor, intern_id: str) -> AnomalyState:
+        """Replay an intern's sessions in date order through the detector, discarding alerts."""
+        cursor.execute('''
+            SELECT date, score, duration FROM attendance WHERE intern_id = ?
+            ORDER BY date, time_in
+        ''', (intern_id,))
+        state = AnomalyState()
+        for session_date, score, duration in cursor.fetchall():
+            detect(state, {"date": session_date, "score": score, "duration": duration})
+        return state
+    
+    def _detect_anomalies(self, cursor, log: Dict) -> None:
+        """Run the online detector on a new session and store any alerts; O(1) per session."""
+        cursor.execute("SELECT anomaly_state, assigned_job_id FROM users WHERE id = ?", (log['intern_id'],))
+        row = cursor.fetchone()
+        if row is None:
+            return
+        state = AnomalyState.from_dict(json.loads(row[0])) if row[0] else self._anomaly_state_from_attendance(cursor, log['intern_id'])
+        track_scores = self.get_score_histogram(row[1] or '')
+        track_durations = self.get_track_duration_stats(row[1] or '')
+        
+        alerts = detect(state, log, track_scores, track_durations)
+        cursor.executemany('''
+            INSERT INTO alerts (intern_id, job_id, kind, severity, value, baseline, z, message, session_date)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+        ''', [
+            (log['intern_id'], row[1], a['kind'], a['severity'], a['value'], a['baseline'], a['z'], a['message'], log['date'])
+            for a in alerts
+        ])
+        # A new session ends any open inactivity alert
+        cursor.execute("UPDATE alerts SET resolved = 1 WHERE intern_id = ? AND resolved = 0 AND kind = 'inactive'", (log['intern_id'],))
+        cursor.execute("UPDATE users SET anomaly_state = ? WHERE id = ?", (json.dumps(state.to_dict()), log['intern_id']))
+    
+    @writes
+    def rebuild_anomaly_states(self, intern_ids: List[str]) -> None:
+        """Recompute detector state from history, e.g. after backfilling sessions out of order."""
+        cursor = self.conn.cursor()
+        updates = [
+            (json.dumps(self._anomaly_state_from_attendance(cursor, intern_id).to_dict()), intern_id)
+            for intern_id in intern_ids
+        ]
+        cursor.executemany("UPDATE users SET anomaly_state = ? WHERE id = ?", updates)
+        self.conn.commit()
+    
+    @writes
+    def sweep_inactive_interns(self, today: Optional[str] = None, days: int = INACTIVITY_DAYS) -> int:
+        """Raise an 'inactive' alert for interns without a session in `days` days.
+        
+        Last-session dates come from the detector state, so no attendance is scanned.
+        One alert is raised per idle stretch: once resolved, it stays quiet until the
+        intern's next session.
+        """
+        cutoff = (date.fromisoformat(today) if today else date.today()) - timedelta(days=days)
+        cursor = self.conn.cursor()
+        cursor.execute('''
+            INSERT INTO alerts (intern_id, job_id, kind, severity, value, baseline, message, session_date)
+            SELECT u.id, u.assigned_job_id, 'inactive', 'HIGH',
+                   JULIANDAY(?) - JULIANDAY(json_extract(u.anomaly_state, '$.last_date')), ?,
+                   'No session since ' || json_extract(u.anomaly_state, '$.last_date'),
+                   json_extract(u.anomaly_state, '$.last_date')
+            FROM users u
+            WHERE json_extract(u.anomaly_state, '$.last_date') < ?
+              AND NOT EXISTS (
+                  SELECT 1 FROM alerts a
+                  WHERE a.intern_id = u.id AND a.kind = 'inactive'
+                    AND a.session_date = json_extract(u.anomaly_state, '$.last_date')
+              )
+        ''', ((cutoff + timedelta(days=days)).isoformat(), days, cutoff.isoformat()))
+        raised = cursor.rowcount
+        if raised:
+            self._bump_version(cursor, 'alerts')
+        self.conn.commit()
+        return raised
+    
+    @staticmethod
+    def _alert_from_row(row) -> Dict:
+        return {
+            "id": row[0],
+            "intern_id": row[1],
+            "job_id": row[2],
+            "kind": row[3],
+            "severity": row[4],
+            "value": row[5],
+            "baseline": row[6],
+            "z": row[7],
+            "message": row[8],
+            "session_date": row[9],
+            "resolved": bool(row[10]),
+            "created_at": row[11]
+        }
+    
+    def get_alerts(self, resolved: bool = False, kind: Optional[str] = None, job_id: Optional[str] = None,
+                   limit: int = 100) -> List[Dict]:
+        """Newest alerts first, through the (resolved, id) index."""
+        conditions, params = ["resolved = ?"], [int(resolved)]
+        if kind:
+            conditions.append("kind = ?")
+            params.append(kind)
+        if job_id:
+            conditions.append("job_id = ?")
+            params.append(job_id)
+        cursor = self.conn.cursor()
+        cursor.execute(f'''
+            SELECT id, intern_id, job_id, kind, severity, value, baseline, z, message, session_date, resolved, created_at
+            FROM alerts WHERE {" AND ".join(conditions)} ORDER BY id DESC LIMIT ?
+        ''', (*params, limit))
+        return [self._alert_from_row(row) for row in cursor.fetchall()]
+    
+    def get_intern_alerts(self, intern_id: str, include_resolved: bool = False) -> List[Dict]:
+        cursor = self.conn.cursor()
+        cursor.execute(f'''
+            SELECT id, intern_id, job_id, kind, severity, value, baseline, z, message, session_date, resolved, created_at
+            FROM alerts WHERE intern_id = ? {"" if include_resolved else "AND resolved = 0"} ORDER BY id DESC
+        ''', (intern_id,))
+        return [self._alert_from_row(row) for row in cursor.fetchall()]
+    
+    def count_open_alerts(self) -> Dict[str, int]:
+        cursor = self.conn.cursor()
+        cursor.execute("SELECT kind, COUNT(*) FROM alerts WHERE resolved = 0 GROUP BY kind")
+        return dict(cursor.fetchall())
+    
+    @writes
+    def resolve_alerts(self, alert_ids: List[int]) -> None:
+        cursor = self.conn.cursor()
+        cursor.executemany("UPDATE alerts SET resolved = 1 WHERE id = ?", [(alert_id,) for alert_id in alert_ids])
+        self._bump_version(cursor, 'alerts')
+        self.conn.commit()
+    
+    def _add_to_score_histograms(self, cursor, logs: List[Dict]) -> None:
+        """Count scored sessions into their (track, day, score) bins, by the intern's current track."""
+        scored = [log for log in logs if log['score']]
+        if not scored:
+            return
+        intern_ids = list({log['intern_id'] for log in scored})
+        cursor.execute(f"SELECT id, assigned_job_id FROM users WHERE id IN ({', '.join('?' for _ in intern_ids)})", intern_ids)
+        tracks = dict(cursor.fetchall())
+        
+        bins: Dict[tuple, int] = {}
+        for log in scored:
+            key = (tracks.get(log['intern_id']) or '', log['date'], ScoreHistogram.bin_for(log['score']))
+            bins[key] = bins.get(key, 0) + 1
+        cursor.executemany('''
+            INSERT INTO score_histograms (job_id, date, score, count) VALUES (?, ?, ?, ?)
+            ON CONFLICT(job_id, date, score) DO UPDATE SET count = count + excluded.count
+        ''', [(*key, count) for key, count in bins.items()])
+    
+    def _add_to_track_durations(self, cursor, logs: List[Dict]) -> None:
+        """Fold session durations into their track's moments, by the intern's current track."""
+        timed = [log for log in logs if log.get('duration')]
+        if not timed:
+            return
+        intern_ids = list({log['intern_id'] for log in timed})
+        cursor.execute(f"SELECT id, assigned_job_id FROM users WHERE id IN ({', '.join('?' for _ in intern_ids)})", intern_ids)
+        tracks = dict(cursor.fetchall())
+        
+        moments: Dict[str, List[float]] = {}
+        for log in timed:
+            entry = moments.setdefault(tracks.get(log['intern_id']) or '', [0, 0.0, 0.0])
+            entry[0] += 1
+            entry[1] += log['duration']
+            entry[2] += log['duration'] ** 2
+        cursor.executemany('''
+            INSERT INTO track_duration_stats (job_id, count, total, total_sq) VALUES (?, ?, ?, ?)
+            ON CONFLICT(job_id) DO UPDATE SET count = count + excluded.count, total = total + excluded.total,
+                                              total_sq = total_sq + excluded.total_sq
+        ''', [(job_id, *entry) for job_id, entry in moments.items()])
+    
+    def get_track_duration_stats(self, job_id: str) -> RunningStats:
+        """Mean and spread of session durations on a track (count, mean and m2 only; no windows)."""
+        cursor = self.conn.cursor()
+        cursor.execute("SELECT count, total, total_sq FROM track_duration_stats WHERE job_id = ?", (job_id,))
+        row = cursor.fetchone()
+        if not row or not row[0]:
+            return RunningStats()
+        count, total, total_sq = row
+        mean = total / count
+        return RunningStats.from_dict({"count": count, "total": total, "mean": mean, "m2": max(total_sq - total * mean, 0.0)})
+    
+    def _score_histogram_filter(self, job_id: Optional[str], start_date: Optional[str], end_date: Optional[str]):
+        conditions, params = [], []
+        if job_id is not None:
+            conditions.append("job_id = ?")
+            params.append(job_id)
+        if start_date:
+            conditions.append("date >= ?")
+            params.append(start_date)
+        if end_date:
+            conditions.append("date <= ?")
+            params.append(end_date)
+        return (" WHERE " + " AND ".join(conditions) if conditions else ""), params
+    
+    def get_score_histogram(self, job_id: Optional[str] = None, start_date: Optional[str] = None,
+                            end_date: Optional[str] = None) -> ScoreHistogram:
+        """Distribution of session scores for a track and/or date range (all by default)."""
+        where, params = self._score_histogram_filter(job_id, start_date, end_date)
+        cursor = self.conn.cursor()
+        cursor.execute(f"SELECT score, SUM(count) FROM score_histograms{where} GROUP BY score", params)
+        
+        histogram = ScoreHistogram()
+        for score, count in cursor.fetchall():
+            histogram.counts[score] = count
+        return histogram
+    
+    def get_daily_score_histograms(self, job_id: Optional[str] = None, days: int = 30) -> Dict[str, ScoreHistogram]:
+        """Per-day score distributions for the last `days` days that have scored sessions."""
+        where, params = self._score_histogram_filter(job_id, None, None)
+        cursor = self.conn.cursor()
+        cursor.execute(f'''
+            SELECT date, score, SUM(count) FROM score_histograms
+            WHERE date IN (SELECT DISTINCT date FROM score_histograms{where} ORDER BY date DESC LIMIT ?)
+            {"AND job_id = ?" if job_id is not None else ""}
+            GROUP BY date, score ORDER BY date
+        ''', (*params, days, *params))
+        
+        histograms: Dict[str, ScoreHistogram] = {}
+        for day, score, count in cursor.fetchall():
+            histograms.setdefault(day, ScoreHistogram()).counts[score] = count
+        return histograms
+    
+    def get_intern_score_percentile(self, intern_id: str) -> Optional[float]:
+        """Percentile of an intern's average score among all scored sessions on their track."""
+        cursor = self.conn.cursor()
+        cursor.execute("SELECT assigned_job_id FROM users WHERE id = ?", (intern_id,))
+        row = cursor.fetchone()
+        stats = self.get_score_stats(intern_id)
+        if not row or not stats.count:
+            return None
+        return self.get_score_histogram(row[0] or '').percentile_of(stats.average)
+    
+    def get_score_stats(self, intern_id: str) -> RunningStats:
+        cursor = self.conn.cursor()
+        cursor.execute("SELECT score_stats FROM users WHERE id = ?", (intern_id,))
+        row = cursor.fetchone()
+        return RunningStats.from_dict(json.loads(row[0])) if row and row[0] else RunningStats()
+    
+    def get_track_score_stats(self, job_id: Optional[str] = None) -> RunningStats:
+        """Score stats for a track (or the whole cohort) merged from the per-intern states."""
+        cursor = self.conn.cursor()
+        if job_id is None:
+            cursor.execute("SELECT score_stats FROM users WHERE score_stats IS NOT NULL")
+        else:
+            cursor.execute("SELECT score_stats FROM users WHERE score_stats IS NOT NULL AND assigned_job_id = ?", (job_id,))
+        
+        merged = RunningStats()
+        for row in cursor.fetchall():
+            merged = merged.merge(RunningStats.from_dict(json.loads(row[0])))
+        return merged
+    
     def get_attendance_for_intern(self, intern_id: str) -> List[Dict]:
         cursor = self.conn.cursor()
         cursor.execute('''
-            SELECT id, date, time_in, time_out, task, resources, duration, score, status, quiz_results
+            SELECT id, date, time_in, time_out, task, resources, duration, score, status, quiz_results, created_at
             FROM attendance WHERE intern_id = ? ORDER BY date DESC, time_in DESC
         ''', (intern_id,))
         
@@ -302,10 +1074,33 @@ class DatabaseService:
                 "duration": row[6],
                 "score": row[7],
                 "status": row[8],
-                "quiz_results": json.loads(row[9]) if row[9] else {}
+                "quiz_results": json.loads(row[9]) if row[9] else {},
+                "created_at": row[10]
             })
         return attendance
     
+    @writes
+    def set_session_feedback(self, log_id: str, feedback: str) -> None:
+        """Store AI feedback generated after the session row was written."""
+        cursor = self.conn.cursor()
+        cursor.execute('''
+            UPDATE attendance SET quiz_results = json_set(COALESCE(quiz_results, '{}'), '$.feedback', ?)
+            WHERE id = ?
+        ''', (feedback, log_id))
+        cursor.execute("SELECT intern_id FROM attendance WHERE id = ?", (log_id,))
+        row = cursor.fetchone()
+        self.conn.commit()
+        if row:
+            self.touch_interns([row[0]])
+    
+    def get_recently_active_interns(self, limit: int = 20) -> List[str]:
+        """Ids of the interns with the most recently logged sessions, newest first."""
+        cursor = self.conn.cursor()
+        cursor.execute('''
+            SELECT intern_id FROM attendance GROUP BY intern_id ORDER BY MAX(rowid) DESC LIMIT ?
+        ''', (limit,))
+        return [row[0] for row in cursor.fetchall()]
+    
     def get_all_attendance(self) -> List[Dict]:
         cursor = self.conn.cursor()
         cursor.execute('''
@@ -331,6 +1126,25 @@ class DatabaseService:
             })
         return attendance
     
+    def get_attendance_frame(self, intern_ids: Optional[List[str]] = None, after_rowid: Optional[int] = None):
+        """Columnar attendance (rowid, intern_id, date, time_in, duration, score) as a pandas DataFrame.
+        
+        `after_rowid` returns only sessions inserted after that rowid watermark.
+        """
+        import pandas as pd
+        
+        query = "SELECT rowid, intern_id, date, time_in, duration, score FROM attendance"
+        conditions, params = [], []
+        if intern_ids is not None:
+            conditions.append(f"intern_id IN ({', '.join('?' for _ in intern_ids)})")
+            params.extend(intern_ids)
+        if after_rowid is not None:
+            conditions.append("rowid > ?")
+            params.append(after_rowid)
+        if conditions:
+            query += " WHERE " + " AND ".join(conditions)
+        return pd.read_sql_query(query, self.conn, params=params)
+    
     def get_all_interns(self) -> List[Dict]:
         cursor = self.conn.cursor()
         cursor.execute("PRAGMA table_info(users)")
@@ -363,6 +1177,74 @@ class DatabaseService:
             })
         return interns
     
+    def get_intern_by_id(self, intern_id: str) -> Optional[Dict]:
+        cursor = self.conn.cursor()
+        cursor.execute("PRAGMA table_info(users)")
+        columns = [column[1] for column in cursor.fetchall()]
+        
+        if 'performance_metrics' in columns:
+            query = '''
+                SELECT id, name, email, assigned_job_id, skills, onboarded, analysis, performance_metrics
+                FROM users WHERE id = ?
+            '''
+        else:
+            query = '''
+                SELECT id, name, email, assigned_job_id, skills, onboarded, analysis, NULL
+                FROM users WHERE id = ?
+            '''
+        
+        cursor.execute(query, (intern_id,))
+        row = cursor.fetchone()
+        if row:
+            return {
+                "id": row[0],
+                "name": row[1],
+                "email": row[2],
+                "assigned_job_id": row[3],
+                "skills": json.loads(row[4]) if row[4] else [],
+                "onboarded": bool(row[5]),
+                "analysis": json.loads(row[6]) if row[6] else None,
+                "performance_metrics": json.loads(row[7]) if row[7] else None
+            }
+        return None
+    
+    @staticmethod
+    def _intern_search_filter(query: str):
+        """WHERE clause and params matching a name or email prefix, case-insensitively."""
+        query = (query or '').strip()
+        if not query:
+            return "", ()
+        pattern = query.replace('\\', '\\\\').replace('%', '\\%').replace('_', '\\_') + '%'
+        return "WHERE name LIKE ? ESCAPE '\\' OR email LIKE ? ESCAPE '\\'", (pattern, pattern)
+    
+    def search_interns(self, query: str = "", limit: int = 25, offset: int = 0) -> List[Dict]:
+        """One page of interns whose name or email starts with `query`, without the JSON blobs."""
+        where, params = self._intern_search_filter(query)
+        cursor = self.conn.cursor()
+        cursor.execute(f'''
+            SELECT id, name, email, assigned_job_id, onboarded
+            FROM users {where}
+            ORDER BY name COLLATE NOCASE, id
+            LIMIT ? OFFSET ?
+        ''', (*params, limit, offset))
+        
+        return [
+            {
+                "id": row[0],
+                "name": row[1],
+                "email": row[2],
+                "assigned_job_id": row[3],
+                "onboarded": bool(row[4])
+            }
+            for row in cursor.fetchall()
+        ]
+    
+    def count_interns(self, query: str = "") -> int:
+        where, params = self._intern_search_filter(query)
+        cursor = self.conn.cursor()
+        cursor.execute(f"SELECT COUNT(*) FROM users {where}", params)
+        return cursor.fetchone()[0]
+    
     def get_performance_metrics(self, intern_id: str, days: int = 30) -> List[Dict]:
         cursor = self.conn.cursor()
         start_date = (datetime.now() - timedelta(days=days)).strftime('%Y-%m-%d')
@@ -383,3 +1265,84 @@ class DatabaseService:
                 "value": row[2]
             })
         return metrics
+    
+    def get_track_fit_matrix(self):
+        """Intern x track fit matrix, built on first use and kept current through change events."""
+        cls = type(self)
+        with cls._track_fit_lock:
+            if cls.track_fit is None:
+                from skill_engine import TrackFitMatrix
+                cls.track_fit = TrackFitMatrix(self.get_all_interns(), self.get_jobs())
+                cls.add_listener(cls.track_fit.on_change)
+        return cls.track_fit
+    
+    def get_best_alternative_tracks(self, intern_id: str, limit: int = 3) -> List[Dict]:
+        return self.get_track_fit_matrix().rank_tracks(intern_id, limit)
+    
+    def _ranked_interns(self, per_track: bool, job_id: Optional[str], start_date: Optional[str], end_date: Optional[str]):
+        """SQL ranking interns by average score, plus its parameters.
+        
+        Ranks use RANK() over the displayed (1 decimal) average, so interns that look tied
+        share a rank and the next rank is skipped.
+        """
+        partition = "PARTITION BY job_id " if per_track else ""
+        query = f'''
+            WITH totals AS (
+                SELECT a.intern_id, u.name, u.assigned_job_id AS job_id,
+                       ROUND(AVG(a.score), 1) AS avg_score, COUNT(*) AS sessions,
+                       COALESCE(SUM(a.duration), 0) AS total_duration
+                FROM attendance a JOIN users u ON u.id = a.intern_id
+                WHERE (? IS NULL OR u.assigned_job_id = ?)
+                  AND (? IS NULL OR a.date >= ?)
+                  AND (? IS NULL OR a.date <= ?)
+                GROUP BY a.intern_id
+            )
+            SELECT t.intern_id, t.name, t.job_id, j.title, t.avg_score, t.sessions, t.total_duration,
+                   RANK() OVER ({partition}ORDER BY t.avg_score DESC) AS rank,
+                   COUNT(*) OVER ({partition.strip()}) AS ranked
+            FROM totals t LEFT JOIN jobs j ON j.id = t.job_id
+        '''
+        return query, (job_id, job_id, start_date, start_date, end_date, end_date)
+    
+    @staticmethod
+    def _leaderboard_entry(row) -> Dict:
+        return {
+            "intern_id": row[0],
+            "name": row[1],
+            "job_id": row[2],
+            "track": row[3] or "N/A",
+            "avg_score": row[4],
+            "sessions": row[5],
+            "total_duration": row[6],
+            "rank": row[7],
+            "ranked": row[8]
+        }
+    
+    def get_leaderboard(self, limit: int = 10, job_id: Optional[str] = None,
+                        start_date: Optional[str] = None, end_date: Optional[str] = None) -> List[Dict]:
+        """Top interns by average score; interns tied at the cut-off are all included."""
+        query, params = self._ranked_interns(False, job_id, start_date, end_date)
+        cursor = self.conn.cursor()
+        cursor.execute(f"SELECT * FROM ({query}) WHERE rank <= ? ORDER BY rank, name", (*params, limit))
+        return [self._leaderboard_entry(row) for row in cursor.fetchall()]
+    
+    def get_track_leaderboards(self, limit: int = 5, start_date: Optional[str] = None,
+                               end_date: Optional[str] = None) -> Dict[str, List[Dict]]:
+        """Top interns of every track in one query, keyed by job id."""
+        query, params = self._ranked_interns(True, None, start_date, end_date)
+        cursor = self.conn.cursor()
+        cursor.execute(f"SELECT * FROM ({query}) WHERE rank <= ? AND job_id IS NOT NULL ORDER BY job_id, rank, name", (*params, limit))
+        
+        leaderboards: Dict[str, List[Dict]] = {}
+        for row in cursor.fetchall():
+            leaderboards.setdefault(row[2], []).append(self._leaderboard_entry(row))
+        return leaderboards
+    
+    def get_intern_rank(self, intern_id: str, per_track: bool = True,
+                        start_date: Optional[str] = None, end_date: Optional[str] = None) -> Optional[Dict]:
+        """An intern's leaderboard entry within their track (or the whole cohort); None without sessions."""
+        query, params = self._ranked_interns(per_track, None, start_date, end_date)
+        cursor = self.conn.cursor()
+        cursor.execute(f"SELECT * FROM ({query}) WHERE intern_id = ?", (*params, intern_id))
+        row = cursor.fetchone()
+        return self._leaderboard_entry(row) if row else None
@@ -1,10 +1,65 @@
 import streamlit as st
 import time
 from datetime import datetime, date
+from typing import Dict, List, Optional
 from database import DatabaseService
 from ai_service import AIService
+from skill_taxonomy import get_taxonomy
+from notifications import flash
+from services import get_job_queue
 from utils import *
 
+# Snapshots also expire, so writes this process never sees (CLI imports, other
+# servers) and other interns' sessions moving the rank show up eventually
+SNAPSHOT_MAX_AGE = 300
+
+def generate_session_feedback(db: DatabaseService, ai: AIService, log_id: str, task: str, score: int,
+                              duration: int, summary: Dict) -> str:
+    """Background job: ask the AI for feedback on a submitted quiz and store it on the session."""
+    feedback = ai.get_feedback(task, score, duration, summary)
+    db.set_session_feedback(log_id, feedback)
+    return feedback
+
+def refresh_performance_metrics(db: DatabaseService, ai: AIService, intern_id: str) -> Dict:
+    """Background job: recompute an intern's performance metrics after a new session.
+    
+    This is the only writer of the stored metrics; dashboards just read them.
+    """
+    user = db.get_intern_by_id(intern_id)
+    if user is None:
+        return {}
+    attendance = db.get_attendance_for_intern(intern_id)
+    performance_metrics = ai.get_performance_analysis(attendance, user.get('analysis') or {}, db.get_score_stats(intern_id))
+    with db.write_lock:
+        # Merge into the intern as stored now, not as it was when the job was queued
+        user = db.get_intern_by_id(intern_id)
+        if user is None:
+            return {}
+        db.update_performance_metrics(intern_id, performance_metrics)
+        db.update_intern({**user, "performance_metrics": performance_metrics})
+    return performance_metrics
+
+class InternSnapshot:
+    """Everything the intern dashboard reads from the database, kept in session state.
+    
+    Reruns from typing or clicking reuse it without a query; it is rebuilt once the
+    intern's version moves (log_attendance, update_intern) or it is SNAPSHOT_MAX_AGE old.
+    """
+    
+    def __init__(self, intern_id: str, version: int, job: Optional[Dict], attendance: List[Dict],
+                 rank: Optional[Dict], percentile: Optional[float]):
+        self.intern_id = intern_id
+        self.version = version
+        self.built_at = time.time()
+        self.job = job
+        self.attendance = attendance
+        self.sessions = SessionSeries(attendance)
+        self.rank = rank
+        self.percentile = percentile
+    
+    def is_current(self, intern_id: str, version: int) -> bool:
+        return self.intern_id == intern_id and self.version == version and time.time() - self.built_at < SNAPSHOT_MAX_AGE
+
 class InternDashboard:
     def __init__(self, db: DatabaseService, ai: AIService):
         self.db = db
@@ -13,12 +68,6 @@ class InternDashboard:
     def show(self):
         user = st.session_state.current_user
         
-        st.set_page_config(
-            page_title=f"InternTrack | {user['name']}'s Dashboard",
-            layout="wide",
-            initial_sidebar_state="collapsed"
-        )
-        
         col_header1, col_header2, col_header3 = st.columns([3, 1, 1])
         with col_header1:
             st.markdown(f"""
@@ -39,6 +88,7 @@ class InternDashboard:
             if st.button("Exit Portal", type="secondary", use_container_width=True):
                 del st.session_state.role
                 del st.session_state.current_user
+                st.session_state.pop('intern_snapshot', None)
                 st.rerun()
         
         st.markdown("---")
@@ -47,26 +97,51 @@ class InternDashboard:
             self.onboard_intern(user)
             return
         
-        job = self.db.get_job_by_id(user['assigned_job_id'])
-        attendance = self.db.get_attendance_for_intern(user['id'])
-        
-        if attendance and user.get('analysis'):
-            performance_metrics = self.ai.get_performance_analysis(attendance, user.get('analysis', {}))
-            user['performance_metrics'] = performance_metrics
-            self.db.update_intern(user)
+        snapshot = self.load_snapshot(user)
         
         col1, col2, col3 = st.columns([1, 2, 1])
         
         with col1:
-            self.show_profile_overview(user, job)
+            self.show_profile_overview(user, snapshot)
         
         with col2:
-            self.show_performance_analytics(user, attendance)
+            self.show_performance_analytics(user, snapshot)
         
         with col3:
-            self.show_learning_session(user, attendance)
+            self.show_learning_session(user, snapshot)
+    
+    def load_snapshot(self, user) -> InternSnapshot:
+        snapshot = st.session_state.get('intern_snapshot')
+        if snapshot is not None and snapshot.is_current(user['id'], self.db.get_intern_version(user['id'])):
+            return snapshot
+        
+        # Read the version first: a write landing while we load just causes one more rebuild
+        version = self.db.get_intern_version(user['id'])
+        attendance = self.db.get_attendance_for_intern(user['id'])
+        stored = self.db.get_intern_by_id(user['id'])
+        user['performance_metrics'] = (stored or {}).get('performance_metrics') or {}
+        if attendance and user.get('analysis') and not user['performance_metrics']:
+            # Never computed (e.g. imported history); the metrics job fills it in and bumps the version
+            job = get_job_queue().get(st.session_state.get('metrics_job', ''))
+            if job is None or job.done:
+                st.session_state.metrics_job = get_job_queue().submit(
+                    "performance_metrics", refresh_performance_metrics, self.db, self.ai, user['id']
+                )
+        
+        snapshot = InternSnapshot(
+            user['id'],
+            version,
+            self.db.get_job_by_id(user['assigned_job_id']),
+            attendance,
+            self.db.get_intern_rank(user['id']),
+            self.db.get_intern_score_percentile(user['id'])
+        )
+        st.session_state.intern_snapshot = snapshot
+        return snapshot
     
-    def show_profile_overview(self, user, job):
+    def show_profile_overview(self, user, snapshot: InternSnapshot):
+        job = snapshot.job
+        
         st.markdown("### Track Overview")
         
         with st.container():
@@ -82,6 +157,13 @@ class InternDashboard:
             fig = create_skill_gap_pie(similarity)
             st.plotly_chart(fig, use_container_width=True, config={'displayModeBar': False})
             
+            rank = snapshot.rank
+            if rank:
+                st.metric("Track Rank", f"#{rank['rank']} of {rank['ranked']}", help="By average session score among interns on your track")
+            percentile = snapshot.percentile
+            if percentile is not None:
+                st.metric("Score Percentile", f"{percentile:.0f}%", help="Share of scored sessions on your track below your average score")
+            
             st.markdown("---")
             
             st.markdown("#### Your Current Skills")
@@ -101,10 +183,11 @@ class InternDashboard:
                 st.markdown(f"**{req['name']}**")
                 st.caption(f"Minimum Level: {req['minLevel']}/5")
     
-    def show_performance_analytics(self, user, attendance):
+    def show_performance_analytics(self, user, snapshot: InternSnapshot):
+        attendance, sessions = snapshot.attendance, snapshot.sessions
         st.markdown("### Performance Analytics")
         
-        fig = create_performance_analysis_chart(attendance, user.get('performance_metrics', {}))
+        fig = create_performance_analysis_chart(sessions, user.get('performance_metrics', {}))
         st.plotly_chart(fig, use_container_width=True, config={'displayModeBar': False})
         
         st.markdown("---")
@@ -178,7 +261,8 @@ class InternDashboard:
         else:
             st.info("No learning sessions logged yet.")
     
-    def show_learning_session(self, user, attendance):
+    def show_learning_session(self, user, snapshot: InternSnapshot):
+        attendance, sessions = snapshot.attendance, snapshot.sessions
         st.markdown("### Learning Session")
         
         if 'clocked_in' not in st.session_state:
@@ -191,93 +275,13 @@ class InternDashboard:
             st.session_state.quiz_answers = {}
             st.session_state.quiz_feedback = ""
         
-        with st.container():
-            st.markdown("#### Session Configuration")
-            
-            task = st.text_area(
-                "Learning Objective",
-                placeholder="What specific concept or skill are you focusing on today?",
-                disabled=st.session_state.clocked_in,
-                value=st.session_state.task,
-                key="task_input",
-                height=100
-            )
-            
-            st.markdown("#### Learning Resources")
-            st.caption("Add URLs to resources you'll be studying")
-            
-            resource_input_container = st.container()
-            with resource_input_container:
-                resource_col1, resource_col2 = st.columns([4, 1])
-                with resource_col1:
-                    resource_input = st.text_input(
-                        "Resource URL",
-                        placeholder="https://...",
-                        key="resource_input",
-                        label_visibility="collapsed",
-                        disabled=st.session_state.clocked_in
-                    )
-                with resource_col2:
-                    if st.button("Add", disabled=st.session_state.clocked_in, use_container_width=True):
-                        if resource_input and resource_input not in st.session_state.resources:
-                            st.session_state.resources.append(resource_input)
-                            st.rerun()
-            
-            if st.session_state.resources:
-                st.markdown("**Added Resources:**")
-                for i, res in enumerate(st.session_state.resources):
-                    col_r1, col_r2 = st.columns([5, 1])
-                    with col_r1:
-                        st.caption(f"{i+1}. {res[:50]}...")
-                    with col_r2:
-                        if not st.session_state.clocked_in:
-                            if st.button("Delete", key=f"del_res_{i}"):
-                                st.session_state.resources.pop(i)
-                                st.rerun()
-            
-            st.markdown("#### Session Timer")
-            
-            if st.session_state.clocked_in:
-                elapsed = int(time.time() - st.session_state.start_time)
-                hours = elapsed // 3600
-                minutes = (elapsed % 3600) // 60
-                seconds = elapsed % 60
-                
-                col_t1, col_t2, col_t3 = st.columns(3)
-                with col_t1:
-                    st.metric("Hours", f"{hours:02d}")
-                with col_t2:
-                    st.metric("Minutes", f"{minutes:02d}")
-                with col_t3:
-                    st.metric("Seconds", f"{seconds:02d}")
-                
-                if st.button("End Session & Take Quiz", type="primary", use_container_width=True):
-                    if task and st.session_state.resources:
-                        with st.spinner("Generating assessment questions..."):
-                            quiz_data = self.ai.get_daily_quiz(task, st.session_state.resources)
-                            st.session_state.quiz_data = quiz_data
-                            st.session_state.quiz_answers = {}
-                            st.session_state.show_quiz = True
-                            st.session_state.clocked_in = False
-                        st.rerun()
-                    else:
-                        st.error("Please specify a learning objective and add at least one resource.")
-            else:
-                if st.button("Start Learning Session", type="primary", use_container_width=True):
-                    if task and st.session_state.resources:
-                        st.session_state.clocked_in = True
-                        st.session_state.start_time = time.time()
-                        st.session_state.task = task
-                        st.success("Session started! Focus on your learning objective.")
-                        st.rerun()
-                    else:
-                        st.error("Please specify a learning objective and add at least one resource.")
+        self.session_controls()
         
         st.markdown("---")
         
         st.markdown("### Score Velocity Analysis")
         if attendance:
-            fig = create_score_velocity_chart(attendance)
+            fig = create_score_velocity_chart(sessions)
             st.plotly_chart(fig, use_container_width=True, config={'displayModeBar': False})
             
             if user.get('performance_metrics'):
@@ -294,9 +298,107 @@ class InternDashboard:
         else:
             st.info("Your performance analytics will appear here after your first session.")
         
+        self.show_last_assessment(snapshot)
+        
         if st.session_state.get('show_quiz', False):
             self.show_quiz_modal(user)
     
+    @st.fragment
+    def session_controls(self):
+        """Objective, resources and start/stop; reruns on its own, not with the whole dashboard."""
+        st.markdown("#### Session Configuration")
+        
+        task = st.text_area(
+            "Learning Objective",
+            placeholder="What specific concept or skill are you focusing on today?",
+            disabled=st.session_state.clocked_in,
+            value=st.session_state.task,
+            key="task_input",
+            height=100
+        )
+        
+        st.markdown("#### Learning Resources")
+        st.caption("Add URLs to resources you'll be studying")
+        
+        resource_input_container = st.container()
+        with resource_input_container:
+            resource_col1, resource_col2 = st.columns([4, 1])
+            with resource_col1:
+                st.text_input(
+                    "Resource URL",
+                    placeholder="https://...",
+                    key="resource_input",
+                    label_visibility="collapsed",
+                    disabled=st.session_state.clocked_in
+                )
+            with resource_col2:
+                st.button("Add", disabled=st.session_state.clocked_in, use_container_width=True, on_click=self.add_resource)
+        
+        if st.session_state.resources:
+            st.markdown("**Added Resources:**")
+            for i, res in enumerate(st.session_state.resources):
+                col_r1, col_r2 = st.columns([5, 1])
+                with col_r1:
+                    st.caption(f"{i+1}. {res[:50]}...")
+                with col_r2:
+                    if not st.session_state.clocked_in:
+                        st.button("Delete", key=f"del_res_{i}", on_click=self.remove_resource, args=(i,))
+        
+        st.markdown("#### Session Timer")
+        
+        if st.session_state.clocked_in:
+            self.session_timer()
+            
+            if st.button("End Session & Take Quiz", type="primary", use_container_width=True):
+                if task and st.session_state.resources:
+                    with st.spinner("Generating assessment questions..."):
+                        quiz_data = self.ai.get_daily_quiz(task, st.session_state.resources)
+                        st.session_state.quiz_data = quiz_data
+                        st.session_state.quiz_answers = {}
+                        st.session_state.show_quiz = True
+                        st.session_state.clocked_in = False
+                    st.rerun()
+                else:
+                    st.error("Please specify a learning objective and add at least one resource.")
+        else:
+            # start_session runs before the fragment redraws; still being here means it refused
+            if st.button("Start Learning Session", type="primary", use_container_width=True, on_click=self.start_session):
+                st.error("Please specify a learning objective and add at least one resource.")
+    
+    # Widget callbacks update state before the fragment redraws, so no explicit rerun is needed
+    def add_resource(self):
+        resource = st.session_state.resource_input
+        if resource and resource not in st.session_state.resources:
+            st.session_state.resources.append(resource)
+    
+    def remove_resource(self, index: int):
+        st.session_state.resources.pop(index)
+    
+    def start_session(self):
+        if st.session_state.task_input and st.session_state.resources:
+            st.session_state.clocked_in = True
+            st.session_state.start_time = time.time()
+            st.session_state.task = st.session_state.task_input
+            st.toast("Session started! Focus on your learning objective.")
+    
+    @st.fragment(run_every=1)
+    def session_timer(self):
+        # Ticks once a second without rerunning the dashboard around it
+        if not st.session_state.clocked_in or st.session_state.start_time is None:
+            return
+        elapsed = int(time.time() - st.session_state.start_time)
+        hours = elapsed // 3600
+        minutes = (elapsed % 3600) // 60
+        seconds = elapsed % 60
+        
+        col_t1, col_t2, col_t3 = st.columns(3)
+        with col_t1:
+            st.metric("Hours", f"{hours:02d}")
+        with col_t2:
+            st.metric("Minutes", f"{minutes:02d}")
+        with col_t3:
+            st.metric("Seconds", f"{seconds:02d}")
+    
     def show_quiz_modal(self, user):
         st.markdown("---")
         
@@ -358,18 +460,15 @@ class InternDashboard:
                 weaknesses = [f"Q{i+1}" for i in incorrect_answers[:2]]
             
             duration = int(time.time() - st.session_state.start_time) // 60 if st.session_state.start_time else 0
-            feedback = self.ai.get_feedback(
-                st.session_state.task,
-                score,
-                duration,
-                {
-                    "total_questions": total_questions,
-                    "correct_answers": score,
-                    "strengths": strengths,
-                    "weaknesses": weaknesses
-                }
-            )
+            summary = {
+                "total_questions": total_questions,
+                "correct_answers": score,
+                "strengths": strengths,
+                "weaknesses": weaknesses
+            }
             
+            # Only grading and the session row happen on this run; the AI feedback
+            # call and the metric recomputation go to the background job queue
             log_entry = {
                 "intern_id": user['id'],
                 "date": date.today().isoformat(),
@@ -388,32 +487,25 @@ class InternDashboard:
                     "incorrect_answers": incorrect_answers,
                     "strengths": strengths,
                     "weaknesses": weaknesses,
-                    "feedback": feedback
+                    "feedback": None
                 }
             }
             
             log_id = self.db.log_attendance(log_entry)
             
-            if attendance := self.db.get_attendance_for_intern(user['id']):
-                performance_metrics = self.ai.get_performance_analysis(attendance, user.get('analysis', {}))
-                self.db.update_performance_metrics(user['id'], performance_metrics)
-                user['performance_metrics'] = performance_metrics
-                self.db.update_intern(user)
-            
-            st.success("Quiz submitted successfully!")
-            
-            col_r1, col_r2, col_r3 = st.columns(3)
-            with col_r1:
-                st.metric("Score", f"{score}/{total_questions}")
-            with col_r2:
-                st.metric("Percentage", f"{percentage:.1f}%")
-            with col_r3:
-                st.metric("Status", "PASS" if score >= 6 else "REVIEW")
-            
-            st.markdown("### Detailed Feedback")
-            st.info(feedback)
+            jobs = get_job_queue()
+            st.session_state.last_assessment = {
+                "log_id": log_id,
+                "score": score,
+                "total_questions": total_questions,
+                "percentage": percentage,
+                "feedback_job": jobs.submit(
+                    "session_feedback", generate_session_feedback,
+                    self.db, self.ai, log_id, st.session_state.task, score, duration, summary
+                ),
+                "metrics_job": jobs.submit("performance_metrics", refresh_performance_metrics, self.db, self.ai, user['id'])
+            }
             
-            time.sleep(3)
             st.session_state.clocked_in = False
             st.session_state.start_time = None
             st.session_state.resources = []
@@ -424,6 +516,45 @@ class InternDashboard:
             
             st.rerun()
     
+    def show_last_assessment(self, snapshot: InternSnapshot):
+        result = st.session_state.get('last_assessment')
+        if not result:
+            return
+        
+        st.markdown("---")
+        st.markdown("### Assessment Submitted")
+        col_r1, col_r2, col_r3 = st.columns(3)
+        with col_r1:
+            st.metric("Score", f"{result['score']}/{result['total_questions']}")
+        with col_r2:
+            st.metric("Percentage", f"{result['percentage']:.1f}%")
+        with col_r3:
+            st.metric("Status", "PASS" if result['score'] >= 6 else "REVIEW")
+        
+        st.markdown("### Detailed Feedback")
+        job = get_job_queue().get(result['feedback_job'])
+        if job is not None and not job.done:
+            self.feedback_poller(result['feedback_job'])
+        elif job is not None and job.state == "done":
+            st.info(job.result)
+        else:
+            # Failed, or the job was dropped (e.g. a restart); fall back to what was stored
+            stored = next((log for log in snapshot.attendance if log['id'] == result['log_id']), None)
+            feedback = stored['quiz_results'].get('feedback') if stored else None
+            st.info(feedback or "Feedback could not be generated for this session.")
+        
+        if st.button("Dismiss", key="dismiss_assessment"):
+            del st.session_state.last_assessment
+            st.rerun()
+    
+    @st.fragment(run_every=1)
+    def feedback_poller(self, job_id: str):
+        job = get_job_queue().get(job_id)
+        if job is None or job.done:
+            # One full rerun renders the finished panel, which no longer polls
+            st.rerun()
+        st.caption("Generating personalised feedback...")
+    
     def onboard_intern(self, user):
         job = self.db.get_job_by_id(user['assigned_job_id'])
         
@@ -505,6 +636,11 @@ class InternDashboard:
                                 "name": item,
                                 "level": 3
                             })
+                    
+                    taxonomy = get_taxonomy()
+                    required_names = {taxonomy.normalize(s['name']): s['name'] for s in job['required_skills']}
+                    for skill in parsed_skills:
+                        skill['name'] = required_names.get(taxonomy.normalize(skill['name']), taxonomy.display_name(skill['name']))
                     user_skills = parsed_skills
         
         with col_btn2:
@@ -523,6 +659,5 @@ class InternDashboard:
                         
                         st.session_state.current_user = user
                         
-                        st.success("Onboarding complete! Personalized analysis generated.")
-                        time.sleep(2)
+                        flash("Onboarding complete! Personalized analysis generated.")
                         st.rerun()
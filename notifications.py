@@ -0,0 +1,22 @@
+import streamlit as st
+
+FLASH_KEY = "flash_messages"
+FLASH_ICONS = {
+    "success": "✅",
+    "info": "ℹ️",
+    "warning": "⚠️",
+    "error": "❌"
+}
+
+def flash(message: str, kind: str = "success") -> None:
+    """Queue a message for the next script run, so it survives a following st.rerun().
+    
+    Use this instead of st.success + time.sleep before a rerun: the run ends at once
+    and the message is shown as a toast on the page the rerun lands on.
+    """
+    st.session_state.setdefault(FLASH_KEY, []).append((kind, message))
+
+def show_flash_messages() -> None:
+    """Show and clear the queued messages; called once near the top of every run."""
+    for kind, message in st.session_state.pop(FLASH_KEY, []):
+        st.toast(message, icon=FLASH_ICONS.get(kind))
@@ -0,0 +1,105 @@
+import math
+from collections import deque
+from typing import Dict, Iterable, Optional
+
+class RunningStats:
+    """Welford mean/variance with fixed-size early and recent windows.
+    
+    Adding a value is O(1) and two states merge exactly (Chan et al.), so stats for
+    any subset of streams combine without revisiting the raw values. `a.merge(b)`
+    treats `b` as following `a` in time, which is what the windows rely on.
+    """
+    
+    def __init__(self, window: int = 3):
+        self.window = window
+        self.count = 0
+        self.total = 0.0
+        self.mean = 0.0
+        self.m2 = 0.0
+        self.minimum: Optional[float] = None
+        self.maximum: Optional[float] = None
+        self.early: list = []
+        self.recent: deque = deque(maxlen=window)
+    
+    @classmethod
+    def from_values(cls, values: Iterable[float], window: int = 3) -> 'RunningStats':
+        stats = cls(window)
+        for value in values:
+            stats.push(value)
+        return stats
+    
+    def push(self, value: float) -> None:
+        value = float(value)
+        self.count += 1
+        self.total += value
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self.m2 += delta * (value - self.mean)
+        self.minimum = value if self.minimum is None else min(self.minimum, value)
+        self.maximum = value if self.maximum is None else max(self.maximum, value)
+        if len(self.early) < self.window:
+            self.early.append(value)
+        self.recent.append(value)
+    
+    def merge(self, other: 'RunningStats') -> 'RunningStats':
+        merged = RunningStats(self.window)
+        merged.count = self.count + other.count
+        merged.total = self.total + other.total
+        if merged.count:
+            delta = other.mean - self.mean
+            merged.mean = self.mean + delta * other.count / merged.count
+            merged.m2 = self.m2 + other.m2 + delta * delta * self.count * other.count / merged.count
+        extremes = [v for v in (self.minimum, other.minimum) if v is not None]
+        merged.minimum = min(extremes) if extremes else None
+        extremes = [v for v in (self.maximum, other.maximum) if v is not None]
+        merged.maximum = max(extremes) if extremes else None
+        merged.early = (self.early + other.early)[:self.window]
+        merged.recent.extend(list(self.recent) + list(other.recent))
+        return merged
+    
+    @property
+    def average(self) -> float:
+        # Exact for integer streams such as quiz scores, unlike the running mean
+        return self.total / self.count if self.count else 0.0
+    
+    @property
+    def variance(self) -> float:
+        return self.m2 / (self.count - 1) if self.count > 1 else 0.0
+    
+    @property
+    def stdev(self) -> float:
+        return math.sqrt(max(self.variance, 0.0))
+    
+    @property
+    def early_mean(self) -> float:
+        return sum(self.early) / len(self.early) if self.early else 0.0
+    
+    @property
+    def recent_mean(self) -> float:
+        return sum(self.recent) / len(self.recent) if self.recent else 0.0
+    
+    def to_dict(self) -> Dict:
+        return {
+            "window": self.window,
+            "count": self.count,
+            "total": self.total,
+            "mean": self.mean,
+            "m2": self.m2,
+            "min": self.minimum,
+            "max": self.maximum,
+            "early": self.early,
+            "recent": list(self.recent)
+        }
+    
+    @classmethod
+    def from_dict(cls, data: Dict) -> 'RunningStats':
+        stats = cls(data.get('window', 3))
+        stats.count = data.get('count', 0)
+        stats.total = data.get('total', 0.0)
+        stats.mean = data.get('mean', 0.0)
+        stats.m2 = data.get('m2', 0.0)
+        stats.minimum = data.get('min')
+        stats.maximum = data.get('max')
+        stats.early = list(data.get('early', []))
+        stats.recent.extend(data.get('recent', []))
+        return stats
@@ -0,0 +1,71 @@
+import numpy as np
+import pandas as pd
+from typing import Dict
+from online_stats import RunningStats
+
+PERFORMANCE_COLUMNS = ["sessions", "overallScore", "consistency", "improvementRate"]
+
+def chronological(attendance_data):
+    """Attendance rows oldest first; the database returns them newest first."""
+    return sorted(attendance_data, key=lambda entry: (entry.get('date') or '', entry.get('time_in') or ''))
+
+def metrics_from_stats(stats: RunningStats) -> Dict:
+    """Overall score, consistency and improvement rate from a running score stream."""
+    consistency = max(0, 100 - stats.stdev * 20) if stats.count > 1 else 100
+    
+    improvement_rate = 0
+    if stats.count > 3 and stats.early_mean > 0:
+        improvement_rate = (stats.recent_mean - stats.early_mean) / stats.early_mean * 100
+    
+    return {
+        "overallScore": round(stats.average, 1),
+        "consistency": round(consistency, 1),
+        "improvementRate": round(improvement_rate, 1)
+    }
+
+def batch_performance_analysis(frame: pd.DataFrame) -> pd.DataFrame:
+    """Overall score, consistency and improvement rate for every intern at once.
+    
+    `frame` is columnar attendance with at least `intern_id`, `date` and `score`
+    (`time_in` breaks ties within a day). The result is indexed by intern_id and
+    matches `AIService.get_performance_analysis` run on each intern separately.
+    """
+    if frame.empty:
+        return pd.DataFrame(columns=PERFORMANCE_COLUMNS, index=pd.Index([], name='intern_id'))
+    
+    order = ['intern_id', 'date'] + (['time_in'] if 'time_in' in frame.columns else [])
+    frame = frame.sort_values(order, kind='stable')
+    sessions = frame.groupby('intern_id', sort=True).size()
+    
+    # Sessions without a score do not count towards any metric
+    scored = frame[frame['score'].fillna(0) != 0]
+    scores = scored['score'].astype(float)
+    grouped = scores.groupby(scored['intern_id'], sort=True)
+    
+    count = grouped.size()
+    overall = grouped.mean()
+    stdev = grouped.std(ddof=1)
+    
+    position = grouped.cumcount().to_numpy()
+    from_end = count.reindex(scored['intern_id']).to_numpy() - position - 1
+    early = scores[position < 3].groupby(scored['intern_id'][position < 3]).mean()
+    recent = scores[from_end < 3].groupby(scored['intern_id'][from_end < 3]).mean()
+    
+    consistency = np.where(count > 1, np.maximum(0, 100 - stdev * 20), 100)
+    improvement = np.where(
+        (count > 3) & (early > 0),
+        (recent - early) / early.where(early > 0, 1) * 100,
+        0
+    )
+    
+    # Python's round() rather than NumPy's, so halves round like the per-intern version
+    result = pd.DataFrame({
+        "overallScore": overall,
+        "consistency": consistency,
+        "improvementRate": improvement
+    }, index=count.index).map(lambda value: round(float(value), 1))
+    
+    result = result.reindex(sessions.index).fillna({"overallScore": 0.0, "consistency": 100.0, "improvementRate": 0.0})
+    result.insert(0, "sessions", sessions)
+    result.index.name = 'intern_id'
+    return result
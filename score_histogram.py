@@ -0,0 +1,74 @@
+from typing import Dict, Iterable, List, Optional
+
+SCORE_BINS = 11  # integer scores 0-10, one bin each
+
+class ScoreHistogram:
+    """Exact distribution of integer 0-10 scores as fixed bins.
+    
+    Histograms merge by adding counts, so per-day or per-track summaries combine into
+    any larger scope, and percentiles cost O(bins) whatever the number of sessions.
+    """
+    
+    def __init__(self, counts: Optional[List[int]] = None):
+        self.counts = list(counts) if counts else [0] * SCORE_BINS
+    
+    @staticmethod
+    def bin_for(score: float) -> int:
+        return min(SCORE_BINS - 1, max(0, int(round(score))))
+    
+    @classmethod
+    def from_scores(cls, scores: Iterable[float]) -> 'ScoreHistogram':
+        histogram = cls()
+        for score in scores:
+            histogram.counts[cls.bin_for(score)] += 1
+        return histogram
+    
+    def merge(self, other: 'ScoreHistogram') -> 'ScoreHistogram':
+        return ScoreHistogram([a + b for a, b in zip(self.counts, other.counts)])
+    
+    @property
+    def count(self) -> int:
+        return sum(self.counts)
+    
+    @property
+    def mean(self) -> float:
+        return sum(score * n for score, n in enumerate(self.counts)) / self.count if self.count else 0.0
+    
+    def percentile(self, q: float) -> Optional[int]:
+        """Nearest-rank q-th percentile (0-100); None when empty."""
+        total = self.count
+        if not total:
+            return None
+        rank = max(1, -(-q * total // 100))
+        seen = 0
+        for score, n in enumerate(self.counts):
+            seen += n
+            if seen >= rank:
+                return score
+        return SCORE_BINS - 1
+    
+    def percentile_of(self, score: float) -> Optional[float]:
+        """Percentile rank of a score: share of scores below it, counting ties as half."""
+        total = self.count
+        if not total:
+            return None
+        below = sum(n for value, n in enumerate(self.counts) if value < score)
+        if float(score).is_integer() and 0 <= score < SCORE_BINS:
+            below += self.counts[int(score)] / 2
+        return below / total * 100
+    
+    def bands(self) -> Dict[str, Optional[int]]:
+        return {"p10": self.percentile(10), "p50": self.percentile(50), "p90": self.percentile(90)}
+    
+    def bucket_counts(self, edges: List[tuple]) -> List[int]:
+        """Counts for inclusive (low, high) score ranges."""
+        return [sum(self.counts[low:high + 1]) for low, high in edges]
+    
+    @property
+    def stdev(self) -> float:
+        """Sample standard deviation of the binned scores."""
+        total = self.count
+        if total < 2:
+            return 0.0
+        mean = self.mean
+        return (sum(n * (score - mean) ** 2 for score, n in enumerate(self.counts)) / (total - 1)) ** 0.5
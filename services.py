@@ -0,0 +1,63 @@
+import threading
+import time
+from typing import TYPE_CHECKING, Optional
+
+if TYPE_CHECKING:
+    from ai_service import AIService
+    from background_jobs import JobQueue
+    from database import DatabaseService
+
+# Streamlit re-executes app.py on every interaction but imports this module once per
+# process, so these are built on first use and then shared by every session
+_db = None
+_ai = None
+_jobs = None
+_lock = threading.Lock()
+
+# The inactivity sweep is a write, so admin pages queue it at most this often (seconds)
+INACTIVITY_SWEEP_INTERVAL = 15 * 60
+_last_sweep: Optional[float] = None
+
+def get_db() -> 'DatabaseService':
+    """The process-wide DatabaseService; schema setup and seeding run once, on first call.
+    
+    Each thread using it gets its own SQLite connection, and writes are serialised.
+    """
+    global _db
+    if _db is None:
+        with _lock:
+            if _db is None:
+                from database import DatabaseService
+                _db = DatabaseService()
+    return _db
+
+def get_ai() -> 'AIService':
+    global _ai
+    if _ai is None:
+        with _lock:
+            if _ai is None:
+                from ai_service import AIService
+                _ai = AIService()
+    return _ai
+
+def get_job_queue() -> 'JobQueue':
+    global _jobs
+    if _jobs is None:
+        with _lock:
+            if _jobs is None:
+                from background_jobs import JobQueue
+                _jobs = JobQueue()
+    return _jobs
+
+def schedule_inactivity_sweep() -> Optional[str]:
+    """Queue the inactive-intern sweep unless one was queued in the last INACTIVITY_SWEEP_INTERVAL.
+    
+    Returns the job id, or None when the last sweep is still fresh.
+    """
+    global _last_sweep
+    now = time.monotonic()
+    with _lock:
+        if _last_sweep is not None and now - _last_sweep < INACTIVITY_SWEEP_INTERVAL:
+            return None
+        _last_sweep = now
+    return get_job_queue().submit("inactivity_sweep", get_db().sweep_inactive_interns)
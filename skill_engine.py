@@ -0,0 +1,499 @@
+import threading
+import numpy as np
+from collections import defaultdict
+from typing import List, Dict, Optional
+from skill_taxonomy import get_taxonomy
+
+PRIORITY_NONE = 0
+PRIORITY_MEDIUM = 1
+PRIORITY_HIGH = 2
+PRIORITY_LABELS = {PRIORITY_MEDIUM: "MEDIUM", PRIORITY_HIGH: "HIGH"}
+
+class SkillGapEngine:
+    """Scores skill gaps for a whole cohort against all tracks in one vectorized pass.
+    
+    Tracks' `minLevel` requirements and interns' skill levels are encoded as dense
+    matrices over a shared skill vocabulary, so similarity, per-skill gaps and
+    priorities come out of a handful of NumPy operations instead of per-intern loops.
+    """
+    
+    def __init__(self, jobs: List[Dict]):
+        self.jobs = jobs
+        self.job_index = {job['id']: idx for idx, job in enumerate(jobs)}
+        self.skill_index: Dict[str, int] = {}
+        self.skill_names: List[str] = []
+        get_taxonomy().register_skills([req['name'] for job in jobs for req in job['required_skills']])
+        
+        # Per track: (column, display name) in the order the track lists its skills
+        self.job_skills: List[List[tuple]] = []
+        for job in jobs:
+            columns = []
+            seen = set()
+            for req in job['required_skills']:
+                col = self._column_for(req['name'])
+                if col not in seen:
+                    seen.add(col)
+                    columns.append((col, req['name']))
+            self.job_skills.append(columns)
+        
+        self.required = np.zeros((len(jobs), len(self.skill_names)), dtype=np.float32)
+        for track, job in enumerate(jobs):
+            levels = {self.skill_index[self.normalize(req['name'])]: req.get('minLevel', 3) for req in reversed(job['required_skills'])}
+            for col, level in levels.items():
+                self.required[track, col] = level
+    
+    @staticmethod
+    def normalize(name: str) -> str:
+        return get_taxonomy().normalize(name)
+    
+    def _column_for(self, name: str) -> int:
+        key = self.normalize(name)
+        if key not in self.skill_index:
+            self.skill_index[key] = len(self.skill_names)
+            self.skill_names.append(name)
+        return self.skill_index[key]
+    
+    def encode_skills(self, skill_lists: List[List[Dict]]):
+        """Encode interns' skill lists as (levels, present) matrices over the vocabulary.
+        
+        Skills outside the track vocabulary cannot affect any gap and are dropped.
+        When an intern lists the same skill twice the first entry wins.
+        """
+        rows, cols, values = [], [], []
+        for row, skills in enumerate(skill_lists):
+            for skill in skills or []:
+                col = self.skill_index.get(self.normalize(skill.get('name', '')))
+                if col is not None:
+                    rows.append(row)
+                    cols.append(col)
+                    values.append(skill.get('level', 0) or 0)
+        
+        levels = np.zeros((len(skill_lists), len(self.skill_names)), dtype=np.float32)
+        present = np.zeros(levels.shape, dtype=bool)
+        if rows:
+            # Fancy assignment keeps the last write, so assign in reverse for first-wins
+            rows, cols, values = rows[::-1], cols[::-1], values[::-1]
+            levels[rows, cols] = values
+            present[rows, cols] = True
+        return levels, present
+    
+    def score(self, skill_lists: List[List[Dict]], job_ids: List[Optional[str]], intern_ids: Optional[List[str]] = None) -> 'CohortSkillGaps':
+        levels, present = self.encode_skills(skill_lists)
+        tracks = np.array([self.job_index.get(job_id, -1) for job_id in job_ids], dtype=np.int64)
+        return CohortSkillGaps(self, intern_ids or [None] * len(job_ids), tracks, levels, present)
+    
+    def score_interns(self, interns: List[Dict]) -> 'CohortSkillGaps':
+        return self.score(
+            [intern.get('skills') or [] for intern in interns],
+            [intern.get('assigned_job_id') for intern in interns],
+            [intern.get('id') for intern in interns]
+        )
+    
+    def analyze(self, job_id: str, user_skills: List[Dict], limit: int = 5) -> Dict:
+        cohort = self.score([user_skills], [job_id])
+        return {
+            "similarity": int(cohort.similarity[0]),
+            "gaps": cohort.gap_records(0, limit)
+        }
+
+class CohortSkillGaps:
+    def __init__(self, engine: SkillGapEngine, intern_ids: List[Optional[str]], tracks: np.ndarray, levels: np.ndarray, present: np.ndarray):
+        self.engine = engine
+        self.intern_ids = intern_ids
+        self.tracks = tracks
+        self.levels = levels
+        self.present = present
+        
+        assigned = tracks >= 0
+        if len(engine.jobs):
+            self.required = np.where(assigned[:, None], engine.required[np.maximum(tracks, 0)], 0).astype(np.float32)
+        else:
+            self.required = np.zeros(levels.shape, dtype=np.float32)
+        
+        required_mask = self.required > 0
+        self.gaps = np.where(required_mask, np.clip(self.required - levels, 0, None), 0)
+        ratio = np.where(required_mask, np.minimum(levels / np.where(required_mask, self.required, 1), 1), 0)
+        
+        counts = required_mask.sum(axis=1)
+        self.similarity = np.where(
+            counts > 0,
+            np.floor(np.round(np.minimum(100, ratio.sum(axis=1, dtype=np.float64) / np.maximum(counts, 1) * 100), 6)),
+            0
+        ).astype(np.int64)
+        
+        self.priority = np.zeros(levels.shape, dtype=np.int8)
+        self.priority[required_mask & (self.gaps > 0)] = PRIORITY_MEDIUM
+        self.priority[required_mask & ((self.gaps >= 2) | ~present)] = PRIORITY_HIGH
+    
+    def __len__(self):
+        return len(self.tracks)
+    
+    def gap_records(self, row: int, limit: Optional[int] = 5) -> List[Dict]:
+        """Gap entries for one intern in the shape produced by `AIService.get_analysis`."""
+        track = self.tracks[row]
+        if track < 0:
+            return []
+        
+        records = []
+        for col, name in self.engine.job_skills[track]:
+            priority = self.priority[row, col]
+            if priority == PRIORITY_NONE:
+                continue
+            
+            current = int(self.levels[row, col])
+            required = int(self.required[row, col])
+            gap = int(self.gaps[row, col])
+            if self.present[row, col]:
+                reason = f"Need to improve from level {current} to level {required}"
+            else:
+                reason = "Skill not found in your current skill set"
+            
+            records.append({
+                "skill": name,
+                "currentLevel": current,
+                "requiredLevel": required,
+                "gapLevel": gap,
+                "reason": reason,
+                "priority": PRIORITY_LABELS[priority],
+                "estimatedImprovementTime": f"{gap * 2} weeks"
+            })
+            if limit and len(records) >= limit:
+                break
+        return records
+    
+    def track_summary(self) -> List[Dict]:
+        """Intern count and mean similarity per track, computed with bincount."""
+        n_tracks = len(self.engine.jobs)
+        assigned = self.tracks >= 0
+        counts = np.bincount(self.tracks[assigned], minlength=n_tracks)
+        totals = np.bincount(self.tracks[assigned], weights=self.similarity[assigned], minlength=n_tracks)
+        high_gaps = np.bincount(
+            self.tracks[assigned],
+            weights=(self.priority[assigned] == PRIORITY_HIGH).sum(axis=1),
+            minlength=n_tracks
+        )
+        
+        summary = []
+        for track, job in enumerate(self.engine.jobs):
+            count = int(counts[track])
+            summary.append({
+                "job_id": job['id'],
+                "title": job['title'],
+                "interns": count,
+                "avg_similarity": float(totals[track] / count) if count else 0.0,
+                "avg_high_priority_gaps": float(high_gaps[track] / count) if count else 0.0
+            })
+        return summary
+
+class TrackFitMatrix:
+    """Precomputed intern x track fit scores (0-100) over every track, not just the assigned one.
+    
+    The matrix is built once and then refreshed incrementally: an intern's skill change
+    recomputes one row, a track edit recomputes one column. The same rows also hold each
+    intern's per-skill gap to their assigned track as int8, for cohort gap heatmaps.
+    """
+    
+    def __init__(self, interns: List[Dict], jobs: List[Dict]):
+        self.lock = threading.RLock()
+        self.skill_index: Dict[str, int] = {}
+        self.job_ids: List[str] = []
+        self.job_titles: Dict[str, str] = {}
+        self.job_index: Dict[str, int] = {}
+        self.intern_ids: List[str] = []
+        self.intern_index: Dict[str, int] = {}
+        self.assigned_job_ids: List[Optional[str]] = []
+        self.intern_skills: List[Dict[str, float]] = []
+        # Every intern skill by normalized name, including skills no track requires yet,
+        # so a new track column can be backfilled without rereading users
+        self.holders: Dict[str, Dict[int, float]] = defaultdict(dict)
+        
+        self.size = 0
+        self.levels = np.zeros((0, 0), dtype=np.float32)
+        self.required = np.zeros((0, 0), dtype=np.float32)
+        self.assigned = np.zeros(0, dtype=np.int64)
+        self.onboarded = np.zeros(0, dtype=bool)
+        self.fit = np.zeros((0, 0), dtype=np.float32)
+        self.gaps = np.zeros((0, 0), dtype=np.int8)
+        
+        for job in jobs:
+            self._set_track_requirements(job)
+        for intern in interns:
+            self._set_intern_skills(intern)
+        self._reindex_assigned()
+        self.fit = np.zeros((len(self.levels), len(self.job_ids)), dtype=np.float32)
+        self.fit[:self.size] = self.compute_fit(self.levels[:self.size], self.required)
+        self._refresh_gaps(np.arange(self.size))
+    
+    @staticmethod
+    def compute_fit(levels: np.ndarray, required: np.ndarray, chunk_size: int = 8192) -> np.ndarray:
+        """Mean of min(level / minLevel, 1) over each track's required skills, times 100.
+        
+        Skill levels take only a handful of distinct values, so the clipped ratio is
+        evaluated as one matrix product per distinct level instead of a 3-D broadcast.
+        """
+        mask = required > 0
+        safe_required = np.where(mask, required, 1)
+        scale = (100 / np.maximum(mask.sum(axis=1), 1)).astype(np.float32)
+        
+        fit = np.zeros((levels.shape[0], required.shape[0]), dtype=np.float32)
+        if not fit.size:
+            return fit
+        for value in np.unique(levels):
+            if value <= 0:
+                continue
+            weights = np.where(mask, np.minimum(value / safe_required, 1), 0).astype(np.float32)
+            for start in range(0, levels.shape[0], chunk_size):
+                block = levels[start:start + chunk_size] == value
+                fit[start:start + chunk_size] += block.astype(np.float32) @ weights.T
+        return fit * scale[None, :]
+    
+    def _column_for(self, key: str) -> int:
+        if key not in self.skill_index:
+            col = len(self.skill_index)
+            self.skill_index[key] = col
+            self.levels = np.hstack([self.levels, np.zeros((len(self.levels), 1), dtype=np.float32)])
+            self.required = np.hstack([self.required, np.zeros((len(self.required), 1), dtype=np.float32)])
+            self.gaps = np.hstack([self.gaps, np.zeros((len(self.gaps), 1), dtype=np.int8)])
+            for row, level in self.holders.get(key, {}).items():
+                self.levels[row, col] = level
+        return self.skill_index[key]
+    
+    def _set_track_requirements(self, job: Dict) -> int:
+        get_taxonomy().register_skills([req['name'] for req in job['required_skills']])
+        columns = {}
+        for req in reversed(job['required_skills']):
+            columns[self._column_for(SkillGapEngine.normalize(req['name']))] = req.get('minLevel', 3)
+        
+        if job['id'] not in self.job_index:
+            self.job_index[job['id']] = len(self.job_ids)
+            self.job_ids.append(job['id'])
+            self.required = np.vstack([self.required, np.zeros((1, len(self.skill_index)), dtype=np.float32)])
+            self.fit = np.hstack([self.fit, np.zeros((len(self.fit), 1), dtype=np.float32)])
+        track = self.job_index[job['id']]
+        self.job_titles[job['id']] = job['title']
+        
+        self.required[track] = 0
+        for col, level in columns.items():
+            self.required[track, col] = level
+        return track
+    
+    def _set_intern_skills(self, intern: Dict) -> int:
+        row = self.intern_index.get(intern['id'])
+        if row is None:
+            row = self.size
+            if row == len(self.levels):
+                capacity = max(64, 2 * len(self.levels))
+                self.levels = np.vstack([self.levels, np.zeros((capacity - len(self.levels), len(self.skill_index)), dtype=np.float32)])
+                self.fit = np.vstack([self.fit, np.zeros((capacity - len(self.fit), len(self.job_ids)), dtype=np.float32)])
+                self.assigned = np.concatenate([self.assigned, np.full(capacity - len(self.assigned), -1, dtype=np.int64)])
+                self.onboarded = np.concatenate([self.onboarded, np.zeros(capacity - len(self.onboarded), dtype=bool)])
+                self.gaps = np.vstack([self.gaps, np.zeros((capacity - len(self.gaps), len(self.skill_index)), dtype=np.int8)])
+            self.intern_index[intern['id']] = row
+            self.intern_ids.append(intern['id'])
+            self.assigned_job_ids.append(None)
+            self.intern_skills.append({})
+            self.size += 1
+        
+        for key in self.intern_skills[row]:
+            self.holders[key].pop(row, None)
+        
+        skills = {}
+        for skill in reversed(intern.get('skills') or []):
+            skills[SkillGapEngine.normalize(skill.get('name', ''))] = skill.get('level', 0) or 0
+        self.intern_skills[row] = skills
+        for key, level in skills.items():
+            self.holders[key][row] = level
+        
+        self.levels[row] = 0
+        for key, level in skills.items():
+            col = self.skill_index.get(key)
+            if col is not None:
+                self.levels[row, col] = level
+        
+        self.assigned_job_ids[row] = intern.get('assigned_job_id')
+        self.assigned[row] = self.job_index.get(intern.get('assigned_job_id'), -1)
+        self.onboarded[row] = bool(intern.get('onboarded'))
+        return row
+    
+    def _reindex_assigned(self):
+        self.assigned[:self.size] = [self.job_index.get(job_id, -1) for job_id in self.assigned_job_ids]
+    
+    def _refresh_gaps(self, rows: np.ndarray) -> None:
+        assigned = self.assigned[rows]
+        if self.job_ids:
+            required = np.where((assigned >= 0)[:, None], self.required[np.maximum(assigned, 0)], 0)
+        else:
+            required = np.zeros((len(rows), len(self.skill_index)), dtype=np.float32)
+        self.gaps[rows] = np.rint(np.clip(required - self.levels[rows], 0, None)).astype(np.int8)
+    
+    def update_intern(self, intern: Dict) -> None:
+        with self.lock:
+            row = self._set_intern_skills(intern)
+            self.fit[row] = self.compute_fit(self.levels[row:row + 1], self.required)[0]
+            self._refresh_gaps(np.array([row]))
+    
+    def upsert_track(self, job: Dict) -> None:
+        with self.lock:
+            is_new = job['id'] not in self.job_index
+            track = self._set_track_requirements(job)
+            self.fit[:self.size, track] = self.compute_fit(self.levels[:self.size], self.required[track:track + 1])[:, 0]
+            if is_new:
+                self._reindex_assigned()
+            self._refresh_gaps(np.flatnonzero(self.assigned[:self.size] == track))
+    
+    def remove_track(self, job_id: str) -> None:
+        with self.lock:
+            track = self.job_index.pop(job_id, None)
+            if track is None:
+                return
+            self.job_ids.pop(track)
+            self.job_titles.pop(job_id, None)
+            self.job_index = {jid: idx for idx, jid in enumerate(self.job_ids)}
+            self.required = np.delete(self.required, track, axis=0)
+            self.fit = np.delete(self.fit, track, axis=1)
+            self._reindex_assigned()
+            self._refresh_gaps(np.arange(self.size))
+    
+    def on_change(self, event: str, payload) -> None:
+        if event in ('intern_registered', 'intern_updated'):
+            self.update_intern(payload)
+        elif event == 'job_upserted':
+            self.upsert_track(payload)
+        elif event == 'job_deleted':
+            self.remove_track(payload)
+    
+    def rank_tracks(self, intern_id: str, limit: Optional[int] = 3, exclude_assigned: bool = True) -> List[Dict]:
+        with self.lock:
+            row = self.intern_index.get(intern_id)
+            if row is None or not self.job_ids:
+                return []
+            scores = self.fit[row].copy()
+            assigned = self.assigned[row]
+            if exclude_assigned and assigned >= 0:
+                scores[assigned] = -np.inf
+            
+            if limit and limit < len(scores):
+                top = np.argpartition(-scores, limit - 1)[:limit]
+                order = top[np.argsort(-scores[top], kind='stable')]
+            else:
+                order = np.argsort(-scores, kind='stable')
+            
+            return [
+                {
+                    "job_id": self.job_ids[track],
+                    "title": self.job_titles[self.job_ids[track]],
+                    "fit": round(float(scores[track]), 1),
+                    "assigned": bool(track == assigned)
+                }
+                for track in order if np.isfinite(scores[track])
+            ]
+    
+    def best_alternatives(self, min_gain: float = 0.0, limit: Optional[int] = None) -> List[Dict]:
+        """Interns whose best-fitting track beats their assigned one, largest gain first."""
+        with self.lock:
+            if not self.size or not self.job_ids:
+                return []
+            fit = self.fit[:self.size]
+            rows = np.arange(self.size)
+            assigned = self.assigned[:self.size]
+            
+            best = fit.argmax(axis=1)
+            best_fit = fit[rows, best]
+            assigned_fit = np.where(assigned >= 0, fit[rows, np.maximum(assigned, 0)], 0)
+            gain = best_fit - assigned_fit
+            
+            candidates = np.flatnonzero((gain > min_gain) & (best != assigned))
+            candidates = candidates[np.argsort(-gain[candidates], kind='stable')][:limit]
+            
+            return [
+                {
+                    "intern_id": self.intern_ids[row],
+                    "assigned_job_id": self.assigned_job_ids[row],
+                    "assigned_fit": round(float(assigned_fit[row]), 1),
+                    "best_job_id": self.job_ids[best[row]],
+                    "best_title": self.job_titles[self.job_ids[best[row]]],
+                    "best_fit": round(float(best_fit[row]), 1),
+                    "gain": round(float(gain[row]), 1)
+                }
+                for row in candidates
+            ]
+    
+    def skill_names(self, columns: np.ndarray) -> List[str]:
+        keys = list(self.skill_index)
+        taxonomy = get_taxonomy()
+        return [taxonomy.display_name(keys[col]) for col in columns]
+    
+    def gap_matrix(self, job_id: Optional[str] = None) -> Dict:
+        """Current level, required level and gap of onboarded interns (optionally one track's)
+        over the skills their tracks require; arrays are interns x skills."""
+        with self.lock:
+            assigned = self.assigned[:self.size]
+            keep = (assigned >= 0) & self.onboarded[:self.size]
+            if job_id is not None:
+                keep &= assigned == self.job_index.get(job_id, -2)
+            rows = np.flatnonzero(keep)
+            tracks = assigned[rows]
+            columns = np.flatnonzero(self.required[np.unique(tracks)].any(axis=0)) if len(rows) else np.zeros(0, dtype=np.int64)
+            
+            return {
+                "intern_ids": [self.intern_ids[row] for row in rows],
+                "job_ids": [self.job_ids[track] for track in tracks],
+                "skills": self.skill_names(columns),
+                "current": self.levels[np.ix_(rows, columns)],
+                "required": self.required[np.ix_(tracks, columns)],
+                "gap": self.gaps[np.ix_(rows, columns)]
+            }
+    
+    def track_gap_summary(self) -> Dict:
+        """Per track x required skill: mean gap and share of onboarded interns with any gap.
+        
+        Skills a track does not require are NaN.
+        """
+        with self.lock:
+            assigned = self.assigned[:self.size]
+            rows = np.flatnonzero((assigned >= 0) & self.onboarded[:self.size])
+            tracks = len(self.job_ids)
+            
+            # Per-track sums as one product with a track x intern indicator matrix
+            members = np.zeros((tracks, len(rows)), dtype=np.float32)
+            members[assigned[rows], np.arange(len(rows))] = 1
+            gaps = self.gaps[rows].astype(np.float32)
+            interns = members.sum(axis=1)
+            per_intern = np.maximum(interns, 1)[:, None]
+            
+            required = self.required > 0
+            columns = np.flatnonzero(required.any(axis=0))
+            mean_gap = np.where(required, (members @ gaps) / per_intern, np.nan)
+            gap_share = np.where(required, (members @ (gaps > 0).astype(np.float32)) / per_intern * 100, np.nan)
+            
+            return {
+                "job_ids": list(self.job_ids),
+                "titles": [self.job_titles[job_id] for job_id in self.job_ids],
+                "interns": interns.astype(np.int64),
+                "skills": self.skill_names(columns),
+                "mean_gap": mean_gap[:, columns],
+                "gap_share": gap_share[:, columns]
+            }
+
+if __name__ == "__main__":
+    import csv
+    import sys
+    from database import DatabaseService
+    
+    # Offline scoring of every onboarded intern against their assigned track
+    db = DatabaseService()
+    interns = [intern for intern in db.get_all_interns() if intern['onboarded']]
+    cohort = SkillGapEngine(db.get_jobs()).score_interns(interns)
+    
+    writer = csv.writer(sys.stdout)
+    writer.writerow(["email", "track", "similarity", "high_priority_gaps", "top_gaps"])
+    high_counts = (cohort.priority == PRIORITY_HIGH).sum(axis=1)
+    for row, intern in enumerate(interns):
+        track = cohort.tracks[row]
+        writer.writerow([
+            intern['email'],
+            cohort.engine.jobs[track]['title'] if track >= 0 else "",
+            int(cohort.similarity[row]),
+            int(high_counts[row]),
+            "; ".join(gap['skill'] for gap in cohort.gap_records(row, 3))
+        ])
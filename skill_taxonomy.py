@@ -0,0 +1,181 @@
+import re
+import difflib
+import threading
+from collections import defaultdict
+from typing import List, Dict, Optional
+
+# canonical id -> (display name, aliases). Aliases are other names for the same skill only;
+# related but distinct skills (Sass and CSS, PostgreSQL and SQL) get their own entries
+SKILL_TAXONOMY = {
+    "javascript": ("JavaScript", ["js", "ecmascript", "es6", "vanilla js"]),
+    "typescript": ("TypeScript", ["ts"]),
+    "react": ("React", ["reactjs", "react.js"]),
+    "angular": ("Angular", ["angularjs", "angular.js"]),
+    "vue": ("Vue", ["vuejs", "vue.js"]),
+    "nodejs": ("Node.js", ["node", "nodejs", "node js"]),
+    "html": ("HTML", ["html5"]),
+    "css": ("CSS", ["css3"]),
+    "sass": ("Sass", ["scss"]),
+    "python": ("Python", ["py", "python3"]),
+    "java": ("Java", []),
+    "cpp": ("C++", ["c++", "cplusplus"]),
+    "csharp": ("C#", ["c#", "c sharp"]),
+    "dotnet": (".NET", []),
+    "go": ("Go", ["golang"]),
+    "rust": ("Rust", []),
+    "sql": ("SQL", []),
+    "postgresql": ("PostgreSQL", ["postgres"]),
+    "mysql": ("MySQL", []),
+    "sqlite": ("SQLite", []),
+    "mongodb": ("MongoDB", ["mongo"]),
+    "machine-learning": ("Machine Learning", ["ml", "machine learning", "machinelearning"]),
+    "deep-learning": ("Deep Learning", ["dl"]),
+    "tensorflow": ("TensorFlow", ["tf", "tensor flow"]),
+    "pytorch": ("PyTorch", ["torch"]),
+    "scikit-learn": ("Scikit-learn", ["sklearn", "scikit learn"]),
+    "statistics": ("Statistics", ["stats", "statistical modeling"]),
+    "data-analysis": ("Data Analysis", ["data analytics"]),
+    "pandas": ("Pandas", []),
+    "numpy": ("NumPy", []),
+    "nlp": ("NLP", ["natural language processing"]),
+    "aws": ("AWS", ["amazon web services"]),
+    "azure": ("Azure", ["microsoft azure"]),
+    "gcp": ("GCP", ["google cloud", "google cloud platform"]),
+    "docker": ("Docker", []),
+    "kubernetes": ("Kubernetes", ["k8s", "kube"]),
+    "linux": ("Linux", []),
+    "unix": ("Unix", []),
+    "bash": ("Bash", ["shell scripting"]),
+    "networking": ("Networking", ["computer networks", "tcp/ip"]),
+    "ci-cd": ("CI/CD", ["cicd"]),
+    "github-actions": ("GitHub Actions", []),
+    "jenkins": ("Jenkins", []),
+    "terraform": ("Terraform", []),
+    "infrastructure-as-code": ("Infrastructure as Code", ["iac"]),
+    "git": ("Git", []),
+    "github": ("GitHub", []),
+    "figma": ("Figma", []),
+    "ux-design": ("UX Design", ["ux", "user experience"]),
+    "ui-design": ("UI Design", ["user interface design"]),
+    "cybersecurity": ("Cybersecurity", ["infosec", "cyber security"]),
+    "flutter": ("Flutter", []),
+    "kotlin": ("Kotlin", []),
+    "swift": ("Swift", []),
+    "react-native": ("React Native", ["reactnative", "rn"]),
+}
+
+class SkillTaxonomy:
+    """Canonical skill ids with alias normalization and a trigram index for typos.
+    
+    Exact names and aliases resolve through a dict; anything else is shortlisted through
+    the trigram index, confirmed with an edit-distance ratio and memoized, so repeated
+    inputs resolve in O(1).
+    """
+    
+    max_memoized = 10000
+    # Misspellings keep roughly the same length; a longer or shorter name is another skill
+    max_length_difference = 2
+    
+    def __init__(self, taxonomy: Dict[str, tuple], min_similarity: float = 0.85):
+        self.min_similarity = min_similarity
+        self.lock = threading.Lock()
+        self.names: Dict[str, str] = {}
+        self.aliases: Dict[str, str] = {}
+        self.trigrams: Dict[str, set] = defaultdict(set)
+        self.key_trigrams: Dict[str, set] = {}
+        self.resolved: Dict[str, Optional[str]] = {}
+        
+        for skill_id, (name, aliases) in taxonomy.items():
+            self.add(skill_id, name, aliases)
+    
+    @staticmethod
+    def key(name: str) -> str:
+        return re.sub(r'[\s\-_\.]+', '', (name or '').strip().lower())
+    
+    @staticmethod
+    def ngrams(key: str) -> set:
+        padded = f"  {key} "
+        return {padded[i:i + 3] for i in range(len(padded) - 2)}
+    
+    def add(self, skill_id: str, name: str, aliases: List[str] = ()) -> None:
+        with self.lock:
+            self.names[skill_id] = name
+            for alias in [skill_id, name, *aliases]:
+                key = self.key(alias)
+                if not key or key in self.aliases:
+                    continue
+                self.aliases[key] = skill_id
+                grams = self.ngrams(key)
+                self.key_trigrams[key] = grams
+                for gram in grams:
+                    self.trigrams[gram].add(key)
+            # Earlier misses may now resolve to the new entry
+            self.resolved.clear()
+    
+    def resolve(self, name: str) -> Optional[str]:
+        """Canonical id for a skill name, alias or close misspelling; None if unknown."""
+        key = self.key(name)
+        if not key:
+            return None
+        skill_id = self.aliases.get(key)
+        if skill_id is not None:
+            return skill_id
+        if key in self.resolved:
+            return self.resolved[key]
+        
+        match = self._fuzzy_match(key)
+        if len(self.resolved) >= self.max_memoized:
+            self.resolved.clear()
+        self.resolved[key] = match
+        return match
+    
+    def _fuzzy_match(self, key: str) -> Optional[str]:
+        # Very short inputs ("go", "ui") produce too few trigrams to tell apart
+        if len(key) < 4:
+            return None
+        grams = self.ngrams(key)
+        shared = defaultdict(int)
+        for gram in grams:
+            for candidate in self.trigrams.get(gram, ()):
+                shared[candidate] += 1
+        
+        best, best_score = None, self.min_similarity
+        for candidate, count in shared.items():
+            if count < 2 or not self._plausible_typo(key, candidate):
+                continue
+            score = difflib.SequenceMatcher(None, key, candidate).ratio()
+            if score >= best_score:
+                best, best_score = candidate, score
+        return self.aliases[best] if best else None
+    
+    def _plausible_typo(self, key: str, candidate: str) -> bool:
+        """False when the names differ only by an added prefix or suffix ("Vuex", "TensorFlow.js")."""
+        if abs(len(key) - len(candidate)) > self.max_length_difference:
+            return False
+        longer, shorter = (key, candidate) if len(key) > len(candidate) else (candidate, key)
+        return not (longer.startswith(shorter) or longer.endswith(shorter))
+    
+    def normalize(self, name: str) -> str:
+        """Canonical id when known, otherwise the normalized raw key."""
+        return self.resolve(name) or self.key(name)
+    
+    def display_name(self, name: str) -> str:
+        skill_id = self.resolve(name)
+        return self.names[skill_id] if skill_id else (name or '').strip()
+    
+    def register_skills(self, names: List[str]) -> None:
+        """Add unknown names (e.g. from custom tracks) as their own canonical entries."""
+        for name in names:
+            if self.key(name) and not self.resolve(name):
+                self.add(self.key(name), name.strip())
+
+_taxonomy = None
+_taxonomy_lock = threading.Lock()
+
+def get_taxonomy() -> SkillTaxonomy:
+    global _taxonomy
+    if _taxonomy is None:
+        with _taxonomy_lock:
+            if _taxonomy is None:
+                _taxonomy = SkillTaxonomy(SKILL_TAXONOMY)
+    return _taxonomy
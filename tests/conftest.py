@@ -0,0 +1,23 @@
+import os
+import sys
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from database import DatabaseService
+
+@pytest.fixture
+def db(tmp_path, monkeypatch):
+    """A DatabaseService on a scratch interntrack.db, with the process-wide class state reset."""
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(DatabaseService, 'listeners', [])
+    monkeypatch.setattr(DatabaseService, 'track_fit', None)
+    monkeypatch.setattr(DatabaseService, 'intern_versions', {})
+    return DatabaseService()
+
+@pytest.fixture
+def interns(db):
+    """Ids of four registered interns on job-1."""
+    for i in range(4):
+        db.register_intern(f"Intern {i}", f"intern{i}@example.com", "secret", "job-1")
+    return sorted(intern['id'] for intern in db.get_all_interns())
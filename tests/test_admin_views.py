@@ -0,0 +1,39 @@
+import os
+import time
+import admin_dashboard
+import services
+import warmup
+from streamlit.testing.v1 import AppTest
+
+APP = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "app.py")
+
+def test_intern_names_lookup(db, interns):
+    names = db.get_intern_names([interns[0], interns[2], None, "missing"])
+    assert sorted(names) == sorted([interns[0], interns[2]])
+    assert names[interns[0]].startswith("Intern ")
+    assert db.get_intern_names([]) == {}
+
+def cohort_frame_not_needed(db):
+    raise AssertionError("the cohort frame was built for a view that does not need it")
+
+def test_change_feed_and_alerts_do_not_build_the_cohort_frame(db, interns, monkeypatch):
+    monkeypatch.setattr(services, "_db", db)
+    monkeypatch.setattr(services, "_last_sweep", time.monotonic())
+    monkeypatch.setattr(warmup, "WARMUP_ENABLED", False)
+    monkeypatch.setattr(admin_dashboard, "get_cohort_frame", cohort_frame_not_needed)
+    db.log_attendance({
+        "intern_id": interns[0], "date": "2020-01-01", "time_in": "10:00:00", "time_out": "11:00:00",
+        "task": "Study", "resources": [], "duration": 60, "score": 7, "status": "COMPLETED"
+    })
+    db.sweep_inactive_interns()
+    
+    at = AppTest.from_file(APP, default_timeout=60)
+    at.session_state.role = "COMPANY"
+    at.session_state.admin_last_seen = 0
+    at.session_state.admin_view = "Alerts"
+    at.run()
+    
+    assert not at.exception
+    intern_name = db.get_intern_by_id(interns[0])['name']
+    feed, alerts = at.dataframe[0].value, at.dataframe[-1].value
+    assert intern_name in set(feed['Intern']) and list(alerts['Intern']) == [intern_name]
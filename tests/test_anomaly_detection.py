@@ -0,0 +1,96 @@
+import statistics
+from anomaly_detection import AnomalyState, MIN_HISTORY, MIN_TRACK_SESSIONS, detect
+from online_stats import RunningStats
+from score_histogram import ScoreHistogram
+
+def session(day, score=7, duration=60):
+    return {"date": f"2025-01-{day:02d}", "score": score, "duration": duration}
+
+def replay(state, sessions, **baselines):
+    alerts = []
+    for log in sessions:
+        alerts.extend(detect(state, log, **baselines))
+    return alerts
+
+def kinds(alerts):
+    return [alert['kind'] for alert in alerts]
+
+def track(scores=None, durations=None):
+    return {
+        "track_scores": ScoreHistogram.from_scores(scores or [7, 8] * MIN_TRACK_SESSIONS),
+        "track_durations": RunningStats.from_values(durations or [55, 65] * MIN_TRACK_SESSIONS)
+    }
+
+def test_steady_history_raises_nothing():
+    state = AnomalyState()
+    assert replay(state, [session(day) for day in range(1, 11)], **track()) == []
+    assert state.score.count == 10 and state.last_date == "2025-01-10"
+
+def test_score_drop_against_own_history_without_track():
+    state = AnomalyState()
+    replay(state, [session(day, score=8) for day in range(1, MIN_HISTORY + 2)])
+    alerts = detect(state, session(20, score=2))
+    assert kinds(alerts) == ['inactivity_streak', 'score_drop']
+    assert alerts[1]['baseline'] == 8.0 and alerts[1]['z'] < 0
+
+def test_cold_start_uses_track_baseline():
+    alerts = detect(AnomalyState(), session(1, score=1, duration=400), **track())
+    assert kinds(alerts) == ['score_drop', 'duration_outlier']
+    assert "track" in alerts[0]['message'] and "usual" not in alerts[0]['message']
+
+def test_steadily_weak_intern_is_not_flagged_against_track():
+    # Always 3/10 on a track averaging 7.5: unusual for the track, but not for them
+    state = AnomalyState()
+    replay(state, [session(day, score=3) for day in range(1, MIN_HISTORY + 1)])
+    assert detect(state, session(10, score=3), **track()) == []
+
+def test_dip_normal_for_track_is_not_flagged():
+    state = AnomalyState()
+    replay(state, [session(day, score=9) for day in range(1, MIN_HISTORY + 3)])
+    wide_track = track(scores=list(range(11)) * 10)
+    assert kinds(detect(state, session(9, score=5))) == ['score_drop']
+    state = AnomalyState()
+    replay(state, [session(day, score=9) for day in range(1, MIN_HISTORY + 3)])
+    assert detect(state, session(9, score=5), **wide_track) == []
+
+def test_duration_outlier_checks_both_baselines():
+    state = AnomalyState()
+    replay(state, [session(day, duration=60) for day in range(1, MIN_HISTORY + 2)], **track())
+    alerts = detect(state, session(8, duration=240), **track())
+    assert kinds(alerts) == ['duration_outlier']
+    assert "usual 60.0 min and track 60.0 min" in alerts[0]['message']
+
+def test_state_round_trips_through_dict():
+    state = AnomalyState()
+    replay(state, [session(day, score=day % 10 + 1, duration=30 + day) for day in range(1, 8)])
+    restored = AnomalyState.from_dict(state.to_dict())
+    assert restored.to_dict() == state.to_dict()
+
+def test_logged_sessions_feed_track_baseline_and_alerts(db, interns):
+    durations = [40, 50, 60, 70, 80] * 5
+    for day, duration in enumerate(durations, start=1):
+        db.log_attendance({
+            "intern_id": interns[day % 2], "date": f"2025-02-{day:02d}", "time_in": "10:00:00",
+            "time_out": "11:00:00", "task": "Study", "resources": [], "duration": duration,
+            "score": 7, "status": "COMPLETED"
+        })
+    stats = db.get_track_duration_stats("job-1")
+    assert stats.count == len(durations)
+    assert abs(stats.mean - statistics.mean(durations)) < 1e-9
+    assert abs(stats.stdev - statistics.stdev(durations)) < 1e-9
+    
+    db.log_attendance({
+        "intern_id": interns[2], "date": "2025-02-28", "time_in": "10:00:00", "time_out": "18:00:00",
+        "task": "Study", "resources": [], "duration": 480, "score": 7, "status": "COMPLETED"
+    })
+    assert kinds(db.get_intern_alerts(interns[2])) == ['duration_outlier']
+
+def test_inactive_sweep_raises_one_alert_per_idle_stretch(db, interns):
+    db.log_attendance({
+        "intern_id": interns[0], "date": "2025-03-01", "time_in": "10:00:00", "time_out": "11:00:00",
+        "task": "Study", "resources": [], "duration": 60, "score": 7, "status": "COMPLETED"
+    })
+    assert db.sweep_inactive_interns(today="2025-03-20") == 1
+    assert db.sweep_inactive_interns(today="2025-03-21") == 0
+    db.resolve_alerts([alert['id'] for alert in db.get_alerts()])
+    assert db.sweep_inactive_interns(today="2025-03-22") == 0
@@ -0,0 +1,72 @@
+import threading
+import time
+import services
+from background_jobs import JobQueue
+from intern_dashboard import refresh_performance_metrics
+
+def wait(jobs, job_id, timeout=5):
+    deadline = time.time() + timeout
+    while not jobs.get(job_id).done:
+        assert time.time() < deadline
+        time.sleep(0.01)
+    return jobs.get(job_id)
+
+def test_job_queue_reports_result_and_failure():
+    jobs = JobQueue(workers=1)
+    ok = jobs.submit("add", lambda a, b: a + b, 2, 3)
+    failed = jobs.submit("fail", lambda: 1 / 0)
+    
+    assert wait(jobs, ok).result == 5
+    job = wait(jobs, failed)
+    assert job.state == "failed" and "division" in job.error
+
+def test_job_queue_history_is_bounded():
+    jobs = JobQueue(workers=1, history_limit=3)
+    ids = [jobs.submit("noop", lambda: None) for _ in range(5)]
+    wait(jobs, ids[-1])
+    assert jobs.get(ids[0]) is None and jobs.get(ids[-1]) is not None
+
+class SlowAnalysis:
+    def __init__(self):
+        self.started = threading.Event()
+        self.release = threading.Event()
+    
+    def get_performance_analysis(self, attendance, skill_data, score_stats=None):
+        self.started.set()
+        self.release.wait(5)
+        return {"overallScore": 8.0, "trend": "up"}
+
+def test_refresh_performance_metrics_merges_into_current_intern(db, interns):
+    ai = SlowAnalysis()
+    jobs = JobQueue(workers=1)
+    job_id = jobs.submit("performance_metrics", refresh_performance_metrics, db, ai, interns[0])
+    
+    # The intern is edited while the analysis runs; the job must not write back a stale copy
+    ai.started.wait(5)
+    user = db.get_intern_by_id(interns[0])
+    db.update_intern({**user, "skills": [{"name": "React", "level": 4}], "onboarded": True})
+    ai.release.set()
+    
+    assert wait(jobs, job_id).state == "done"
+    user = db.get_intern_by_id(interns[0])
+    assert user['skills'] == [{"name": "React", "level": 4}]
+    assert user['performance_metrics'] == {"overallScore": 8.0, "trend": "up"}
+    assert [m['metric_type'] for m in db.get_performance_metrics(interns[0])] == ["overallScore"]
+
+def test_inactivity_sweep_is_queued_at_most_once_per_interval(db, interns, monkeypatch):
+    jobs = JobQueue(workers=1)
+    monkeypatch.setattr(services, "_db", db)
+    monkeypatch.setattr(services, "_jobs", jobs)
+    monkeypatch.setattr(services, "_last_sweep", None)
+    db.log_attendance({
+        "intern_id": interns[0], "date": "2020-01-01", "time_in": "10:00:00", "time_out": "11:00:00",
+        "task": "Study", "resources": [], "duration": 60, "score": 7, "status": "COMPLETED"
+    })
+    
+    job_id = services.schedule_inactivity_sweep()
+    assert services.schedule_inactivity_sweep() is None
+    assert wait(jobs, job_id).result == 1
+    assert db.count_open_alerts().get('inactive') == 1
+    
+    monkeypatch.setattr(services, "_last_sweep", time.monotonic() - services.INACTIVITY_SWEEP_INTERVAL)
+    assert wait(jobs, services.schedule_inactivity_sweep()).result == 0
@@ -0,0 +1,42 @@
+import threading
+from database import DatabaseService
+
+def test_failing_listener_does_not_fail_the_write(db, interns):
+    received = []
+    
+    def broken(event, payload):
+        raise RuntimeError("listener bug")
+    
+    db.add_listener(broken)
+    db.add_listener(lambda event, payload: received.append((event, payload['id'])))
+    user = db.get_intern_by_id(interns[0])
+    db.update_intern({**user, "skills": [{"name": "React", "level": 3}]})
+    DatabaseService.wait_for_listeners()
+    
+    assert received == [('intern_updated', interns[0])]
+    assert db.get_intern_by_id(interns[0])['skills'] == [{"name": "React", "level": 3}]
+
+def test_listeners_run_off_the_writer_thread_in_commit_order(db, interns):
+    threads, events = set(), []
+    
+    def record(event, payload):
+        threads.add(threading.current_thread().name)
+        events.append(event)
+    
+    db.add_listener(record)
+    db.upsert_job({"id": "job-x", "title": "Data", "domain": "Data", "description": "", "required_skills": []})
+    db.delete_job("job-x")
+    DatabaseService.wait_for_listeners()
+    
+    assert events == ['job_upserted', 'job_deleted']
+    assert threading.current_thread().name not in threads
+
+def test_track_fit_matrix_follows_skill_updates(db, interns):
+    matrix = db.get_track_fit_matrix()
+    user = db.get_intern_by_id(interns[0])
+    db.update_intern({**user, "onboarded": True, "skills": [{"name": "Python", "level": 5}, {"name": "Statistics", "level": 4}]})
+    DatabaseService.wait_for_listeners()
+    
+    ranked = matrix.rank_tracks(interns[0], limit=None, exclude_assigned=False)
+    assert ranked[0]['job_id'] == "job-2"
+    assert ranked[0]['fit'] > ranked[-1]['fit']
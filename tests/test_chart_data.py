@@ -0,0 +1,41 @@
+import numpy as np
+from chart_data import SessionSeries, data_fingerprint, lttb_indices
+
+def test_lttb_keeps_ends_and_one_point_per_bucket():
+    x = np.arange(1000, dtype=float)
+    y = np.sin(x / 50)
+    picked = lttb_indices(x, y, 100)
+    assert len(picked) == 100
+    assert picked[0] == 0 and picked[-1] == 999
+    assert np.all(np.diff(picked) > 0)
+
+def test_lttb_keeps_a_spike():
+    x = np.arange(500, dtype=float)
+    y = np.zeros(500)
+    y[321] = 50
+    assert 321 in lttb_indices(x, y, 20)
+
+def test_lttb_short_series_is_untouched():
+    x = np.arange(10, dtype=float)
+    assert list(lttb_indices(x, x, 10)) == list(range(10))
+    assert list(lttb_indices(x, x, 2)) == list(range(10))
+
+def sessions(scores):
+    return [
+        {"id": str(i), "date": f"2025-05-{i + 1:02d}", "time_in": "10:00:00", "score": score,
+         "duration": 30 + i, "created_at": f"2025-05-{i + 1:02d} 11:00:00"}
+        for i, score in enumerate(scores)
+    ]
+
+def test_session_series_orders_and_skips_unscored():
+    rows = sessions([2, 0, 6, 8, 10])
+    series = SessionSeries(list(reversed(rows)))
+    assert list(series.dates) == [row['date'] for row in rows]
+    assert series.histogram.count == 4
+    assert abs(series.trend()(0) - 2.0) < 1e-9
+    assert abs(series.trend().coeffs[0] - 2.0) < 1e-9
+
+def test_fingerprint_changes_with_new_sessions_only():
+    rows = sessions([5, 6])
+    assert data_fingerprint(rows) == data_fingerprint([dict(row) for row in rows])
+    assert data_fingerprint(rows) != data_fingerprint(sessions([5, 6, 7]))
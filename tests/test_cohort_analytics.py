@@ -0,0 +1,56 @@
+import cohort_analytics
+from cohort_analytics import get_cohort_frame
+
+def count_rebuilds(db, monkeypatch):
+    calls = []
+    get_all_interns = db.get_all_interns
+    monkeypatch.setattr(db, "get_all_interns", lambda: calls.append(1) or get_all_interns())
+    monkeypatch.setattr(cohort_analytics, "_latest", None)
+    return calls
+
+def log_session(db, intern_id, day, score):
+    db.log_attendance({
+        "intern_id": intern_id, "date": f"2025-07-{day:02d}", "time_in": "10:00:00", "time_out": "11:00:00",
+        "task": "Study", "resources": [], "duration": 60, "score": score, "status": "COMPLETED"
+    })
+
+def test_sessions_and_metric_updates_are_applied_as_deltas(db, interns, monkeypatch):
+    rebuilds = count_rebuilds(db, monkeypatch)
+    log_session(db, interns[0], 1, 6)
+    frame = get_cohort_frame(db)
+    summary = frame.intern_summary()
+    
+    log_session(db, interns[1], 2, 8)
+    user = db.get_intern_by_id(interns[0])
+    db.update_intern({**user, "performance_metrics": {"overallScore": 6.0}})
+    latest = get_cohort_frame(db)
+    
+    assert len(rebuilds) == 1
+    assert latest is not frame and len(latest.attendance) == 2 and len(frame.attendance) == 1
+    assert latest.interns is frame.interns
+    assert latest.intern_summary() is not summary
+
+def test_skill_updates_patch_the_intern_in_place(db, interns, monkeypatch):
+    rebuilds = count_rebuilds(db, monkeypatch)
+    frame = get_cohort_frame(db)
+    assert frame.intern_summary()['skill_match'].isna().all()
+    
+    user = db.get_intern_by_id(interns[2])
+    skills = [{"name": "React", "level": 5}, {"name": "TypeScript", "level": 4}]
+    db.update_intern({**user, "onboarded": True, "skills": skills})
+    latest = get_cohort_frame(db)
+    
+    assert len(rebuilds) == 1
+    row = latest.interns.set_index('id').loc[interns[2]]
+    assert row['onboarded'] and row['skills'] == skills
+    assert not frame.interns.set_index('id').loc[interns[2]]['onboarded']
+    assert latest.cohort_metrics()['onboarded'] == 1
+    assert latest.intern_summary().set_index('id').loc[interns[2], 'skill_match'] > 0
+    assert next(i for i in latest.intern_records if i['id'] == interns[2])['skills'] == skills
+
+def test_new_interns_rebuild_the_frame(db, interns, monkeypatch):
+    rebuilds = count_rebuilds(db, monkeypatch)
+    get_cohort_frame(db)
+    db.register_intern("Late Joiner", "late@example.com", "secret", "job-2")
+    assert len(get_cohort_frame(db).interns) == 5
+    assert len(rebuilds) == 2
@@ -0,0 +1,73 @@
+import csv
+import io
+import os
+import data_export
+from data_export import export_file, export_table, take_export_file, export_command
+
+SKILLS = [{"name": "React", "level": 4}, {"name": "CSS", "level": 2}]
+
+def seed(db, interns):
+    """Two sessions for a job-1 intern with skills, one for a job-3 intern."""
+    db.register_intern("Linus", "linus@example.com", "secret", "job-3")
+    devops = next(intern['id'] for intern in db.get_all_interns() if intern['email'] == "linus@example.com")
+    user = db.get_intern_by_id(interns[0])
+    db.update_intern({**user, "onboarded": True, "skills": SKILLS, "analysis": {"similarity": 60, "gaps": []}})
+    for intern_id, day, score, resources in [(interns[0], 1, 7, ["docs", "video"]), (interns[0], 2, 9, []), (devops, 2, 0, [])]:
+        db.log_attendance({
+            "intern_id": intern_id, "date": f"2025-03-{day:02d}", "time_in": "09:00:00", "time_out": "10:00:00",
+            "task": "Study", "resources": resources, "duration": 60, "score": score, "status": "COMPLETED"
+        })
+
+def read_csv(text):
+    return list(csv.DictReader(io.StringIO(text)))
+
+def test_csv_export_streams_every_row_and_applies_filters(db, interns):
+    seed(db, interns)
+    out = io.StringIO()
+    assert export_table(db, "attendance", "csv", out, chunk_size=1) == 3
+    rows = read_csv(out.getvalue())
+    assert {row['job_id'] for row in rows} == {"job-1", "job-3"}
+    assert "docs; video" in {row['resources'] for row in rows}
+    
+    out = io.StringIO()
+    assert export_table(db, "attendance", "csv", out, job_id="job-1", start_date="2025-03-02") == 1
+    
+    out = io.StringIO()
+    export_table(db, "users", "csv", out)
+    users = {row['id']: row for row in read_csv(out.getvalue())}
+    assert users[interns[0]]['skills'] == "React:4; CSS:2"
+    assert users[interns[0]]['similarity'] == "60"
+
+def test_parquet_export_matches_csv_rows(db, interns, tmp_path):
+    import pyarrow.parquet as pq
+    seed(db, interns)
+    path = str(tmp_path / "attendance.parquet")
+    assert export_table(db, "attendance", "parquet", path, chunk_size=2) == 3
+    table = pq.read_table(path)
+    assert table.num_rows == 3
+    assert sorted(table.column("score").to_pylist()) == [0, 7, 9]
+
+def test_export_file_writes_a_temp_file(db, interns, tmp_path, monkeypatch):
+    monkeypatch.setattr(data_export, "EXPORT_TEMP_DIR", str(tmp_path / "exports"))
+    seed(db, interns)
+    path = export_file(db, "attendance", "csv", job_id="job-3")
+    assert os.path.dirname(path) == str(tmp_path / "exports")
+    with open(path, newline="", encoding="utf-8") as f:
+        assert len(read_csv(f.read())) == 1
+
+def test_taking_an_export_file_deletes_it(db, interns, tmp_path, monkeypatch):
+    monkeypatch.setattr(data_export, "EXPORT_TEMP_DIR", str(tmp_path / "exports"))
+    seed(db, interns)
+    path = export_file(db, "attendance", "csv")
+    assert len(read_csv(take_export_file(path).decode("utf-8"))) == 3
+    assert not os.path.exists(path)
+    
+    path = export_file(db, "attendance", "csv")
+    assert take_export_file(path, max_bytes=10) is None
+    assert not os.path.exists(path)
+
+def test_export_command_repeats_the_filters():
+    assert export_command("users", "csv") == "python data_export.py users --format csv -o users.csv"
+    assert export_command("attendance", "parquet", job_id="job-1", start_date="2025-06-01") == (
+        "python data_export.py attendance --format parquet -o attendance.parquet --track job-1 --start 2025-06-01"
+    )
@@ -0,0 +1,73 @@
+import io
+import os
+from data_import import import_csv
+
+INTERNS_CSV = """name,email,password,track,skills
+Ada,ada@example.com,pw,job-1,React:4; CSS:2
+Linus,linus@example.com,pw,devops engineer,
+Ada Again,ADA@example.com,pw,job-1,
+Nobody,nobody@example.com,pw,job-9,
+Bad,not-an-email,pw,job-1,
+"""
+
+ATTENDANCE_CSV = """email,date,time_in,time_out,task,resources,duration,score,status
+ada@example.com,2025-03-01,09:00,10:00,Study,docs; video,60,7,completed
+ada@example.com,2025-03-02,09:00:00,10:30:00,Build,,90,9,
+linus@example.com,2025-03-02,09:00,10:00,Setup,,60,0,
+ada@example.com,2025-03-03,9am,10:00,Study,,60,5,
+ada@example.com,2025-03-04,09:00,10:00,Study,,60,11,
+ghost@example.com,2025-03-04,09:00,10:00,Study,,60,5,
+"""
+
+def load(db):
+    interns = import_csv(db, "interns", io.StringIO(INTERNS_CSV), batch_size=1)
+    attendance = import_csv(db, "attendance", io.StringIO(ATTENDANCE_CSV))
+    return interns, attendance
+
+def test_import_interns_reports_duplicates_and_errors(db):
+    report, _ = load(db)
+    assert (report.inserted, report.duplicates, report.error_count) == (2, 1, 2)
+    assert [line for line, _ in report.errors] == [5, 6]
+    
+    emails = db.get_intern_emails()
+    ada = db.get_intern_by_id(emails["ada@example.com"])
+    assert ada['onboarded'] and ada['skills'] == [{"name": "React", "level": 4}, {"name": "CSS", "level": 2}]
+    assert ada['analysis']['similarity'] > 0
+    assert db.get_intern_by_id(emails["linus@example.com"])['assigned_job_id'] == "job-3"
+
+def test_import_attendance_validates_rows_and_rebuilds_stats(db):
+    _, report = load(db)
+    assert (report.inserted, report.error_count) == (3, 3)
+    assert [message for _, message in report.errors] == [
+        "invalid time: 9am", "score out of range: 11", "unknown intern: ghost@example.com"
+    ]
+    
+    ada_id = db.get_intern_emails()["ada@example.com"]
+    logs = sorted(db.get_attendance_for_intern(ada_id), key=lambda log: log['date'])
+    assert [log['status'] for log in logs] == ["COMPLETED", "COMPLETED"]
+    assert logs[0]['resources'] == ["docs", "video"]
+    assert db.get_score_stats(ada_id).count == 2
+
+def test_import_tracks_upserts_by_id(db):
+    report = import_csv(db, "tracks", io.StringIO(
+        "id,title,domain,description,required_skills\n"
+        "job-1,Frontend Developer,Web,Renamed,React:5; CSS\n"
+        ",Data Engineer,Data,,SQL:3\n"
+        "job-x,No Skills,Data,,\n"
+    ))
+    assert (report.inserted, report.error_count) == (2, 1)
+    jobs = {job['title']: job for job in db.get_jobs()}
+    assert jobs["Frontend Developer"]['required_skills'] == [{"name": "React", "minLevel": 5}, {"name": "CSS", "minLevel": 3}]
+    assert jobs["Data Engineer"]['id'].startswith("job-")
+
+def test_cli_import_accepts_a_byte_order_mark(db, tmp_path):
+    import subprocess
+    import sys
+    # Excel's "CSV UTF-8" starts the file with a BOM, which must not end up in the first header
+    path = tmp_path / "interns.csv"
+    path.write_bytes(INTERNS_CSV.encode("utf-8-sig"))
+    script = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "data_import.py")
+    result = subprocess.run([sys.executable, script, "interns", str(path)], cwd=tmp_path,
+                            capture_output=True, text=True, check=True)
+    assert result.stdout.startswith("interns: 2 imported")
+    assert sorted(db.get_intern_emails()) == ["ada@example.com", "linus@example.com"]
@@ -0,0 +1,104 @@
+import sqlite3
+import threading
+import uuid
+from datetime import date, timedelta
+
+SESSIONS_PER_THREAD = 50
+
+def run_threads(targets):
+    errors = []
+    
+    def guarded(target):
+        try:
+            target()
+        except Exception as e:
+            errors.append(e)
+    
+    threads = [threading.Thread(target=guarded, args=(target,)) for target in targets]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert errors == []
+
+def session(intern_id, day, score):
+    return {
+        "intern_id": intern_id,
+        "date": (date(2025, 1, 1) + timedelta(days=day)).isoformat(),
+        "time_in": "10:00:00",
+        "time_out": "11:00:00",
+        "task": "Study",
+        "resources": [],
+        "duration": 60,
+        "score": score,
+        "status": "COMPLETED"
+    }
+
+def test_concurrent_log_attendance_keeps_derived_state_consistent(db, interns):
+    def log_sessions(intern_id):
+        for day in range(SESSIONS_PER_THREAD):
+            db.log_attendance(session(intern_id, day, day % 10 + 1))
+    
+    # Two threads per intern, so the read-modify-write of its score stats is contended
+    run_threads([lambda intern_id=intern_id: log_sessions(intern_id) for intern_id in interns * 2])
+    
+    total = len(interns) * 2 * SESSIONS_PER_THREAD
+    cursor = db.conn.cursor()
+    cursor.execute("SELECT COUNT(*) FROM attendance")
+    assert cursor.fetchone()[0] == total
+    assert db.get_score_histogram().count == total
+    for intern_id in interns:
+        assert db.get_score_stats(intern_id).count == 2 * SESSIONS_PER_THREAD
+        assert db.get_intern_version(intern_id) == 2 * SESSIONS_PER_THREAD
+
+def test_concurrent_insert_interns_reports_own_rows(db):
+    results = []
+    
+    def insert_batch(batch):
+        interns = [
+            {
+                "id": str(uuid.uuid4()),
+                "name": f"Batch {batch} #{i}",
+                "email": f"batch{batch}-{i}@example.com",
+                "password": "secret",
+                "assigned_job_id": "job-1",
+                "skills": [],
+                "onboarded": False
+            }
+            for i in range(100)
+        ]
+        # Every batch repeats one email, so exactly one copy of it is inserted overall
+        interns.append({**interns[0], "id": str(uuid.uuid4()), "email": "shared@example.com"})
+        results.append(db.insert_interns(interns))
+    
+    run_threads([lambda batch=batch: insert_batch(batch) for batch in range(4)])
+    
+    assert sorted(results) == [100, 100, 100, 101]
+    assert len(db.get_intern_emails()) == 401
+
+def test_concurrent_threads_use_separate_connections(db):
+    seen = []
+    # All three hold their connection until every one has taken one
+    barrier = threading.Barrier(3)
+    run_threads([lambda: seen.append(db.conn) or barrier.wait() for _ in range(3)])
+    assert len(set(seen + [db.conn])) == 4
+
+def test_finished_threads_hand_their_connection_back(db):
+    seen = []
+    run_threads([lambda: seen.append(db.conn)])
+    run_threads([lambda: seen.append(db.conn)])
+    assert seen[0] is seen[1] and db.pool.idle.qsize() == 1
+    
+    # Only DB_POOL_SIZE stay open once a burst of threads is over
+    db.pool.idle = type(db.pool.idle)(maxsize=2)
+    barrier = threading.Barrier(4)
+    burst = []
+    run_threads([lambda: burst.append(db.conn) or barrier.wait() for _ in range(4)])
+    assert db.pool.idle.qsize() == 2
+    closed = 0
+    for conn in burst:
+        try:
+            conn.execute("SELECT 1")
+        except sqlite3.ProgrammingError:
+            closed += 1
+    assert closed == 2
@@ -0,0 +1,50 @@
+def log_scores(db, intern_id, scores, day=1):
+    for offset, score in enumerate(scores):
+        db.log_attendance({
+            "intern_id": intern_id, "date": f"2025-06-{day + offset:02d}", "time_in": "10:00:00",
+            "time_out": "11:00:00", "task": "Study", "resources": [], "duration": 60, "score": score,
+            "status": "COMPLETED"
+        })
+
+def test_ties_share_a_rank_and_the_next_rank_is_skipped(db, interns):
+    for intern_id, scores in zip(interns, [[9], [8, 10], [7], [5]]):
+        log_scores(db, intern_id, scores)
+    board = db.get_leaderboard(limit=10)
+    assert [entry['rank'] for entry in board] == [1, 1, 3, 4]
+    assert {entry['intern_id'] for entry in board[:2]} == set(interns[:2])
+    assert all(entry['ranked'] == 4 for entry in board)
+
+def test_ties_at_the_cut_off_are_included(db, interns):
+    for intern_id, scores in zip(interns, [[10], [8], [8], [3]]):
+        log_scores(db, intern_id, scores)
+    board = db.get_leaderboard(limit=2)
+    assert [entry['rank'] for entry in board] == [1, 2, 2]
+
+def test_displayed_average_decides_ties(db, interns):
+    log_scores(db, interns[0], [7, 7, 8])    # 7.33 -> 7.3
+    log_scores(db, interns[1], [7, 8, 7, 7, 7, 8])    # 7.33 -> 7.3
+    board = db.get_leaderboard()
+    assert [entry['avg_score'] for entry in board] == [7.3, 7.3]
+    assert [entry['rank'] for entry in board] == [1, 1]
+
+def test_track_leaderboards_and_intern_rank(db, interns):
+    db.register_intern("Intern 4", "intern4@example.com", "secret", "job-2")
+    other = next(intern['id'] for intern in db.get_all_interns() if intern['email'] == "intern4@example.com")
+    for intern_id, scores in zip(interns, [[6], [9], [4], []]):
+        log_scores(db, intern_id, scores)
+    log_scores(db, other, [8])
+    
+    boards = db.get_track_leaderboards(limit=2)
+    assert [entry['intern_id'] for entry in boards["job-1"]] == [interns[1], interns[0]]
+    assert [entry['rank'] for entry in boards["job-2"]] == [1]
+    
+    assert db.get_intern_rank(interns[0])['rank'] == 2
+    assert db.get_intern_rank(interns[0], per_track=False)['rank'] == 3
+    assert db.get_intern_rank(interns[3]) is None
+
+def test_date_filters_limit_the_sessions_ranked(db, interns):
+    log_scores(db, interns[0], [10, 2], day=1)
+    log_scores(db, interns[1], [6], day=2)
+    board = db.get_leaderboard(start_date="2025-06-02")
+    assert [(entry['intern_id'], entry['avg_score']) for entry in board] == [(interns[1], 6.0), (interns[0], 2.0)]
+    assert db.get_leaderboard(job_id="job-2") == []
@@ -0,0 +1,43 @@
+import random
+import statistics
+from online_stats import RunningStats
+
+def assert_close(a, b):
+    assert abs(a - b) < 1e-9 * max(1.0, abs(b))
+
+def test_push_matches_batch_statistics():
+    values = [random.Random(1).uniform(0, 10) for _ in range(200)]
+    stats = RunningStats.from_values(values)
+    assert stats.count == 200
+    assert_close(stats.mean, statistics.mean(values))
+    assert_close(stats.variance, statistics.variance(values))
+    assert stats.minimum == min(values) and stats.maximum == max(values)
+    assert stats.early == values[:3] and list(stats.recent) == values[-3:]
+
+def test_merge_equals_one_stream():
+    rng = random.Random(2)
+    values = [rng.randint(0, 10) for _ in range(101)]
+    for cut in (0, 1, 50, 100, 101):
+        merged = RunningStats.from_values(values[:cut]).merge(RunningStats.from_values(values[cut:]))
+        whole = RunningStats.from_values(values)
+        assert merged.count == whole.count and merged.total == whole.total
+        assert_close(merged.mean, whole.mean)
+        assert_close(merged.m2, whole.m2)
+        assert (merged.minimum, merged.maximum) == (whole.minimum, whole.maximum)
+        assert merged.early == whole.early and list(merged.recent) == list(whole.recent)
+
+def test_merge_is_associative_over_many_parts():
+    rng = random.Random(3)
+    parts = [[rng.gauss(5, 2) for _ in range(rng.randint(0, 20))] for _ in range(10)]
+    merged = RunningStats()
+    for part in parts:
+        merged = merged.merge(RunningStats.from_values(part))
+    flat = [value for part in parts for value in part]
+    assert_close(merged.variance, statistics.variance(flat))
+
+def test_dict_round_trip_and_empty_state():
+    stats = RunningStats.from_values([4, 8, 6, 9])
+    restored = RunningStats.from_dict(stats.to_dict())
+    assert restored.to_dict() == stats.to_dict()
+    empty = RunningStats()
+    assert (empty.average, empty.variance, empty.stdev, empty.recent_mean) == (0.0, 0.0, 0.0, 0.0)
@@ -0,0 +1,51 @@
+import math
+import random
+import statistics
+from score_histogram import ScoreHistogram
+
+def nearest_rank(values, q):
+    ordered = sorted(values)
+    return ordered[max(1, math.ceil(q * len(ordered) / 100)) - 1]
+
+def test_percentiles_match_nearest_rank_on_raw_scores():
+    rng = random.Random(4)
+    for size in (1, 2, 7, 100, 1001):
+        scores = [rng.randint(0, 10) for _ in range(size)]
+        histogram = ScoreHistogram.from_scores(scores)
+        for q in (0, 1, 10, 25, 50, 90, 99, 100):
+            assert histogram.percentile(q) == nearest_rank(scores, q), (size, q)
+
+def test_percentile_of_counts_ties_as_half():
+    histogram = ScoreHistogram.from_scores([2, 4, 4, 6])
+    assert histogram.percentile_of(4) == 50.0
+    assert histogram.percentile_of(5) == 75.0
+    assert histogram.percentile_of(0) == 0.0
+    assert ScoreHistogram().percentile_of(5) is None
+
+def test_empty_histogram():
+    histogram = ScoreHistogram()
+    assert histogram.percentile(50) is None
+    assert histogram.mean == 0.0 and histogram.stdev == 0.0
+
+def test_merge_mean_and_stdev():
+    a, b = [1, 5, 9, 9], [3, 3, 10]
+    merged = ScoreHistogram.from_scores(a).merge(ScoreHistogram.from_scores(b))
+    assert merged.counts == ScoreHistogram.from_scores(a + b).counts
+    assert abs(merged.mean - statistics.mean(a + b)) < 1e-12
+    assert abs(merged.stdev - statistics.stdev(a + b)) < 1e-12
+
+def test_bins_round_and_clamp():
+    histogram = ScoreHistogram.from_scores([-3, 4.4, 4.6, 12])
+    assert histogram.counts[0] == 1 and histogram.counts[4] == 1 and histogram.counts[5] == 1 and histogram.counts[10] == 1
+    assert histogram.bucket_counts([(0, 4), (5, 10)]) == [2, 2]
+
+def test_database_histograms_filter_by_track_and_date(db, interns):
+    for day, score in enumerate([3, 7, 7, 9], start=1):
+        db.log_attendance({
+            "intern_id": interns[0], "date": f"2025-04-{day:02d}", "time_in": "10:00:00", "time_out": "11:00:00",
+            "task": "Study", "resources": [], "duration": 60, "score": score, "status": "COMPLETED"
+        })
+    assert db.get_score_histogram("job-1").count == 4
+    assert db.get_score_histogram("job-2").count == 0
+    assert db.get_score_histogram(start_date="2025-04-02", end_date="2025-04-03").percentile(50) == 7
+    assert sorted(db.get_daily_score_histograms(days=2)) == ["2025-04-03", "2025-04-04"]
@@ -0,0 +1,70 @@
+import random
+from fractions import Fraction
+from skill_engine import SkillGapEngine
+
+JOBS = [
+    {"id": "job-a", "title": "Frontend", "domain": "Web", "required_skills": [
+        {"name": "React", "minLevel": 4}, {"name": "TypeScript", "minLevel": 3}, {"name": "CSS", "minLevel": 3}
+    ]},
+    {"id": "job-b", "title": "Data", "domain": "ML", "required_skills": [
+        {"name": "Python", "minLevel": 5}, {"name": "Statistics", "minLevel": 4}
+    ]}
+]
+SKILLS = ["React", "TypeScript", "CSS", "Python", "Statistics", "Go", "Docker"]
+
+def reference(job, skills):
+    """Per-intern loop with exact arithmetic: mean per-skill match ratio, gaps in track order."""
+    levels = {}
+    for skill in skills:
+        levels.setdefault(skill['name'].lower(), skill['level'])
+    ratios, gaps = [], []
+    for req in job['required_skills']:
+        level = levels.get(req['name'].lower())
+        ratios.append(min(Fraction(level or 0, req['minLevel']), 1))
+        gap = req['minLevel'] - (level or 0)
+        if level is None or gap > 0:
+            gaps.append((req['name'], max(gap, 0), "HIGH" if level is None or gap >= 2 else "MEDIUM"))
+    return int(sum(ratios) / len(ratios) * 100), gaps
+
+def random_cohort(rng, size):
+    cohort = []
+    for _ in range(size):
+        names = rng.sample(SKILLS, rng.randint(0, len(SKILLS)))
+        cohort.append(([{"name": name, "level": rng.randint(1, 5)} for name in names], rng.choice(JOBS)))
+    return cohort
+
+def test_vectorized_scores_match_per_intern_reference():
+    rng = random.Random(3)
+    cohort = random_cohort(rng, 300)
+    engine = SkillGapEngine(JOBS)
+    scored = engine.score([skills for skills, _ in cohort], [job['id'] for _, job in cohort])
+    
+    for row, (skills, job) in enumerate(cohort):
+        similarity, gaps = reference(job, skills)
+        assert scored.similarity[row] == similarity
+        records = scored.gap_records(row, limit=None)
+        assert [(r['skill'], r['gapLevel'], r['priority']) for r in records] == gaps
+
+def test_first_listed_duplicate_skill_wins_and_case_is_ignored():
+    engine = SkillGapEngine(JOBS)
+    result = engine.analyze("job-b", [{"name": "python", "level": 5}, {"name": "Python", "level": 1},
+                                      {"name": "Statistics", "level": 4}])
+    assert result == {"similarity": 100, "gaps": []}
+
+def test_unknown_track_scores_zero_without_gaps():
+    engine = SkillGapEngine(JOBS)
+    scored = engine.score([[{"name": "React", "level": 5}]], ["job-missing"])
+    assert scored.similarity[0] == 0
+    assert scored.gap_records(0) == []
+
+def test_track_summary_averages_per_track():
+    engine = SkillGapEngine(JOBS)
+    scored = engine.score(
+        [[{"name": "Python", "level": 5}, {"name": "Statistics", "level": 4}], [], [{"name": "React", "level": 4}]],
+        ["job-b", "job-b", "job-a"]
+    )
+    summary = {row['job_id']: row for row in scored.track_summary()}
+    assert summary["job-b"]["interns"] == 2
+    assert summary["job-b"]["avg_similarity"] == 50.0
+    assert summary["job-b"]["avg_high_priority_gaps"] == 1.0
+    assert summary["job-a"]["avg_similarity"] == 33.0
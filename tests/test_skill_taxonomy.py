@@ -0,0 +1,33 @@
+from skill_taxonomy import SKILL_TAXONOMY, SkillTaxonomy
+
+def test_aliases_and_typos_resolve_to_one_skill():
+    taxonomy = SkillTaxonomy(SKILL_TAXONOMY)
+    assert taxonomy.resolve("ES6") == "javascript"
+    assert taxonomy.resolve("React.js") == "react"
+    assert taxonomy.resolve("golang") == "go"
+    assert taxonomy.resolve("Kubernets") == "kubernetes"
+    assert taxonomy.display_name(" k8s ") == "Kubernetes"
+
+def test_related_skills_stay_distinct():
+    taxonomy = SkillTaxonomy(SKILL_TAXONOMY)
+    for name, related in [("SCSS", "CSS"), ("Sass", "CSS"), ("Bash", "Linux"), ("Unix", "Linux"),
+                          ("GitHub", "Git"), ("Postgres", "SQL"), ("MySQL", "SQL"), ("SQLite", "SQL"),
+                          (".NET", "C#"), ("GitHub Actions", "CI/CD"), ("Jenkins", "CI/CD"),
+                          ("IaC", "Terraform")]:
+        assert taxonomy.resolve(name) is not None
+        assert taxonomy.resolve(name) != taxonomy.resolve(related), name
+    for name in ["security", "neural networks", "analytics", "version control", "ui"]:
+        assert taxonomy.resolve(name) is None, name
+
+def test_unknown_track_skills_are_registered_as_their_own_entries():
+    taxonomy = SkillTaxonomy(SKILL_TAXONOMY)
+    taxonomy.register_skills(["Solidity", "Security"])
+    assert taxonomy.display_name("solidity") == "Solidity"
+    assert taxonomy.resolve("Security") not in (None, "cybersecurity")
+
+def test_fuzzy_matching_rejects_names_that_extend_a_skill():
+    taxonomy = SkillTaxonomy(SKILL_TAXONOMY)
+    for name in ["Vuex", "TensorFlow.js", "Reactive", "Dockerfile", "Pythonista"]:
+        assert taxonomy.resolve(name) is None, name
+    assert taxonomy.resolve("Tensorflw") == "tensorflow"
+    assert taxonomy.resolve("Kuberentes") == "kubernetes"
@@ -1,8 +1,196 @@
 import plotly.graph_objects as go
 import plotly.express as px
 from plotly.subplots import make_subplots
-from typing import List, Dict
+import functools
+import json
+import threading
+import numpy as np
+from collections import OrderedDict
+from typing import List, Dict, Optional
+from chart_data import SessionSeries, data_fingerprint
 
+# Above this many points a trace renders with WebGL instead of SVG
+WEBGL_POINT_THRESHOLD = 1000
+# Above this many points a scatter is drawn as a binned density grid instead of markers
+AGGREGATE_POINT_THRESHOLD = 200000
+DENSITY_BINS = 100
+SCORE_BUCKET_LABELS = ['Excellent (8-10)', 'Good (6-8)', 'Average (4-6)', 'Poor (<4)']
+SCORE_BUCKET_EDGES = [(8, 10), (6, 7), (4, 5), (0, 3)]
+SCORE_BUCKET_COLORS = ['#10b981', '#3b82f6', '#f59e0b', '#ef4444']
+MATCH_COLORSCALE = [[0, '#ef4444'], [0.5, '#f59e0b'], [1, '#10b981']]
+DATE_RANGE_BUTTONS = [
+    dict(count=1, label="1m", step="month", stepmode="backward"),
+    dict(count=3, label="3m", step="month", stepmode="backward"),
+    dict(step="all", label="All")
+]
+
+FIGURE_CACHE_MAX_ENTRIES = 256
+FIGURE_CACHE_MAX_BYTES = 16 * 1024 * 1024
+
+class FigureCache:
+    """Process-wide LRU of serialized figures, bounded by entry count and total JSON size."""
+    
+    def __init__(self, max_entries: int = FIGURE_CACHE_MAX_ENTRIES, max_bytes: int = FIGURE_CACHE_MAX_BYTES):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.entries: OrderedDict = OrderedDict()
+        self.size = 0
+        self.hits = 0
+        self.misses = 0
+        self.lock = threading.Lock()
+    
+    def get(self, key: str) -> Optional[go.Figure]:
+        with self.lock:
+            spec = self.entries.get(key)
+            if spec is None:
+                self.misses += 1
+                return None
+            self.entries.move_to_end(key)
+            self.hits += 1
+        # The JSON came from a validated figure, so skip plotly's per-property validation;
+        # every caller gets its own figure object to modify
+        return go.Figure(json.loads(spec), _validate=False)
+    
+    def put(self, key: str, fig: go.Figure) -> None:
+        spec = fig.to_json()
+        if len(spec) > self.max_bytes:
+            return
+        with self.lock:
+            if key in self.entries:
+                self.size -= len(self.entries.pop(key))
+            self.entries[key] = spec
+            self.size += len(spec)
+            while len(self.entries) > self.max_entries or self.size > self.max_bytes:
+                _, evicted = self.entries.popitem(last=False)
+                self.size -= len(evicted)
+    
+    def clear(self) -> None:
+        with self.lock:
+            self.entries.clear()
+            self.size = 0
+
+figure_cache = FigureCache()
+
+def memoize_figure(builder):
+    """Serve `builder`'s figure from figure_cache while its inputs are unchanged."""
+    @functools.wraps(builder)
+    def wrapper(*args):
+        parts = [builder.__name__]
+        for arg in args:
+            if isinstance(arg, SessionSeries):
+                parts.append(arg.fingerprint)
+            elif isinstance(arg, list):
+                parts.append(data_fingerprint(arg))
+            else:
+                parts.append(json.dumps(arg, sort_keys=True, default=str))
+        key = "|".join(parts)
+        
+        fig = figure_cache.get(key)
+        if fig is None:
+            fig = builder(*args)
+            figure_cache.put(key, fig)
+        return fig
+    return wrapper
+
+def scatter_trace(x, y, **kwargs):
+    """go.Scatter for small series, go.Scattergl above WEBGL_POINT_THRESHOLD points."""
+    trace = go.Scattergl if len(x) > WEBGL_POINT_THRESHOLD else go.Scatter
+    return trace(x=x, y=y, **kwargs)
+
+def density_trace(x: np.ndarray, y: np.ndarray, values: np.ndarray, bins: int = DENSITY_BINS,
+                  x_label: str = "x", y_label: str = "y", value_label: str = "value"):
+    """Heatmap of point counts on a bins x bins grid, with the mean of `values` per cell on hover."""
+    counts, x_edges, y_edges = np.histogram2d(x, y, bins=bins)
+    known = ~np.isnan(values)
+    value_counts, _, _ = np.histogram2d(x[known], y[known], bins=[x_edges, y_edges])
+    value_sums, _, _ = np.histogram2d(x[known], y[known], bins=[x_edges, y_edges], weights=values[known])
+    with np.errstate(invalid='ignore', divide='ignore'):
+        means = value_sums / value_counts
+    
+    return go.Heatmap(
+        x=(x_edges[:-1] + x_edges[1:]) / 2,
+        y=(y_edges[:-1] + y_edges[1:]) / 2,
+        # histogram2d indexes [x, y]; Heatmap rows are y
+        z=np.where(counts > 0, counts, np.nan).T,
+        customdata=means.T,
+        colorscale=[[0, '#e0e7ff'], [1, '#4338ca']],
+        colorbar=dict(title="Interns"),
+        hoverongaps=False,
+        hovertemplate=f"{x_label} %{{x:.1f}} • {y_label} %{{y:.0f}}<br>%{{z}} interns<br>{value_label} %{{customdata:.0f}}<extra></extra>"
+    )
+
+def create_cohort_scatter(summary):
+    """Interns by average score and total hours, coloured by skill match with their track.
+    
+    `summary` is CohortFrame.intern_summary(); interns without a scored session are left
+    out. Large cohorts render with WebGL, and past AGGREGATE_POINT_THRESHOLD as a density grid.
+    """
+    active = summary[summary['avg_score'].notna()]
+    fig = go.Figure()
+    
+    if len(active) > AGGREGATE_POINT_THRESHOLD:
+        fig.add_trace(density_trace(
+            active['avg_score'].to_numpy(dtype=float),
+            active['total_hours'].to_numpy(dtype=float),
+            active['skill_match'].to_numpy(dtype=float),
+            x_label="Score", y_label="Hours", value_label="Avg match %"
+        ))
+    else:
+        marker_size = 8 if len(active) <= WEBGL_POINT_THRESHOLD else 4
+        hovertemplate = "<b>%{customdata[0]}</b> • %{customdata[1]}<br>Avg score %{x:.1f} • %{y:.1f} h<br>Skill match %{customdata[2]}<extra></extra>"
+        
+        matched = active[active['skill_match'].notna()]
+        fig.add_trace(scatter_trace(
+            matched['avg_score'].to_numpy(),
+            matched['total_hours'].to_numpy(),
+            mode='markers',
+            name='Onboarded',
+            marker=dict(
+                size=marker_size,
+                opacity=0.75,
+                color=matched['skill_match'].to_numpy(),
+                colorscale=MATCH_COLORSCALE,
+                cmin=0,
+                cmax=100,
+                colorbar=dict(title="Skill Match %")
+            ),
+            customdata=np.column_stack([
+                matched['name'].to_numpy(),
+                matched['track'].to_numpy(),
+                [f"{match:.0f}%" for match in matched['skill_match']]
+            ]) if len(matched) else None,
+            hovertemplate=hovertemplate
+        ))
+        
+        pending = active[active['skill_match'].isna()]
+        if len(pending):
+            fig.add_trace(scatter_trace(
+                pending['avg_score'].to_numpy(),
+                pending['total_hours'].to_numpy(),
+                mode='markers',
+                name='Pending onboarding',
+                marker=dict(size=marker_size, opacity=0.6, color='#94a3b8'),
+                customdata=np.column_stack([
+                    pending['name'].to_numpy(),
+                    pending['track'].to_numpy(),
+                    ["n/a"] * len(pending)
+                ]),
+                hovertemplate=hovertemplate
+            ))
+    
+    fig.update_layout(
+        height=450,
+        showlegend=False,
+        plot_bgcolor='white',
+        paper_bgcolor='white',
+        margin=dict(t=30, b=20, l=20, r=20)
+    )
+    fig.update_xaxes(title_text="Average Score", range=[0, 10.5])
+    fig.update_yaxes(title_text="Total Hours")
+    
+    return fig
+
+@memoize_figure
 def create_skill_gap_pie(similarity: float):
     fig = go.Figure()
     
@@ -34,28 +222,18 @@ def create_skill_gap_pie(similarity: float):
     
     return fig
 
-def create_performance_pie_chart(attendance_data: List[Dict]):
-    if not attendance_data:
+@memoize_figure
+def create_performance_pie_chart(sessions: SessionSeries):
+    if not len(sessions):
         return go.Figure()
     
-    scores = [entry['score'] for entry in attendance_data if entry['score']]
-    
-    excellent = sum(1 for s in scores if s >= 8)
-    good = sum(1 for s in scores if 6 <= s < 8)
-    average = sum(1 for s in scores if 4 <= s < 6)
-    poor = sum(1 for s in scores if s < 4)
-    
-    categories = ['Excellent (8-10)', 'Good (6-8)', 'Average (4-6)', 'Poor (<4)']
-    values = [excellent, good, average, poor]
-    colors = ['#10b981', '#3b82f6', '#f59e0b', '#ef4444']
-    
     fig = go.Figure()
     
     fig.add_trace(go.Pie(
-        labels=categories,
-        values=values,
+        labels=SCORE_BUCKET_LABELS,
+        values=sessions.bucket_counts(SCORE_BUCKET_EDGES),
         hole=0.4,
-        marker_colors=colors,
+        marker_colors=SCORE_BUCKET_COLORS,
         textinfo='label+percent',
         hoverinfo='value+percent'
     ))
@@ -70,12 +248,12 @@ def create_performance_pie_chart(attendance_data: List[Dict]):
     
     return fig
 
-def create_score_velocity_chart(attendance_data: List[Dict]):
-    if not attendance_data:
+@memoize_figure
+def create_score_velocity_chart(sessions: SessionSeries):
+    if not len(sessions):
         return go.Figure()
     
-    dates = [entry['date'] for entry in attendance_data][-15:]
-    scores = [entry['score'] for entry in attendance_data][-15:]
+    shown = sessions.sample(sessions.scores)
     
     fig = make_subplots(
         rows=1, cols=2,
@@ -85,8 +263,8 @@ def create_score_velocity_chart(attendance_data: List[Dict]):
     
     fig.add_trace(
         go.Scatter(
-            x=dates,
-            y=scores,
+            x=sessions.dates[shown],
+            y=sessions.scores[shown],
             mode='lines+markers',
             name='Scores',
             line=dict(color='#6366f1', width=3),
@@ -97,15 +275,13 @@ def create_score_velocity_chart(attendance_data: List[Dict]):
         row=1, col=1
     )
     
-    if len(scores) > 1:
-        import numpy as np
-        x_numeric = list(range(len(scores)))
-        z = np.polyfit(x_numeric, scores, 1)
-        p = np.poly1d(z)
+    # The trend is fitted on every scored session against days elapsed, not on the plotted sample
+    trend = sessions.trend()
+    if trend is not None:
         fig.add_trace(
             go.Scatter(
-                x=dates,
-                y=p(x_numeric),
+                x=[sessions.dates[0], sessions.dates[-1]],
+                y=trend([0, sessions.days[-1] - sessions.days[0]]),
                 mode='lines',
                 name='Trend',
                 line=dict(color='#ef4444', width=2, dash='dash')
@@ -113,20 +289,12 @@ def create_score_velocity_chart(attendance_data: List[Dict]):
             row=1, col=1
         )
     
-    categories = ['Excellent (8-10)', 'Good (6-8)', 'Average (4-6)', 'Poor (<4)']
-    excellent = sum(1 for s in scores if s >= 8)
-    good = sum(1 for s in scores if 6 <= s < 8)
-    average = sum(1 for s in scores if 4 <= s < 6)
-    poor = sum(1 for s in scores if s < 4)
-    values = [excellent, good, average, poor]
-    colors = ['#10b981', '#3b82f6', '#f59e0b', '#ef4444']
-    
     fig.add_trace(
         go.Pie(
-            labels=categories,
-            values=values,
+            labels=SCORE_BUCKET_LABELS,
+            values=sessions.bucket_counts(SCORE_BUCKET_EDGES),
             hole=0.4,
-            marker_colors=colors,
+            marker_colors=SCORE_BUCKET_COLORS,
             textinfo='label+percent',
             hoverinfo='value+percent'
         ),
@@ -141,18 +309,23 @@ def create_score_velocity_chart(attendance_data: List[Dict]):
         margin=dict(t=50, b=20, l=20, r=20)
     )
     
-    fig.update_xaxes(title_text="Session Date", row=1, col=1)
+    fig.update_xaxes(
+        title_text="Session Date",
+        rangeslider_visible=True,
+        rangeselector=dict(buttons=DATE_RANGE_BUTTONS),
+        row=1, col=1
+    )
     fig.update_yaxes(title_text="Score", range=[0, 10], row=1, col=1)
     
     return fig
 
-def create_performance_analysis_chart(attendance_data: List[Dict], performance_metrics: Dict):
-    if not attendance_data:
+@memoize_figure
+def create_performance_analysis_chart(sessions: SessionSeries, performance_metrics: Dict):
+    if not len(sessions):
         return go.Figure()
     
-    dates = [entry['date'] for entry in attendance_data][-10:]
-    scores = [entry['score'] for entry in attendance_data][-10:]
-    durations = [entry['duration'] for entry in attendance_data][-10:]
+    score_points = sessions.sample(sessions.scores)
+    duration_points = sessions.sample(sessions.durations)
     
     fig = make_subplots(
         rows=2, cols=2,
@@ -170,8 +343,8 @@ def create_performance_analysis_chart(attendance_data: List[Dict], performance_m
     
     fig.add_trace(
         go.Scatter(
-            x=dates,
-            y=scores,
+            x=sessions.dates[score_points],
+            y=sessions.scores[score_points],
             mode='lines+markers',
             name='Scores',
             line=dict(color='#6366f1', width=2),
@@ -182,20 +355,19 @@ def create_performance_analysis_chart(attendance_data: List[Dict], performance_m
     
     fig.add_trace(
         go.Bar(
-            x=dates,
-            y=durations,
+            x=sessions.dates[duration_points],
+            y=sessions.durations[duration_points],
             name='Duration (min)',
-            marker_color='#10b981',
-            text=durations,
-            textposition='auto',
+            marker_color='#10b981'
         ),
         row=1, col=2
     )
     
+    # Binned over the full history, so the figure carries 11 bars instead of every score
     fig.add_trace(
-        go.Histogram(
-            x=scores,
-            nbinsx=10,
+        go.Bar(
+            x=list(range(len(sessions.histogram.counts))),
+            y=sessions.histogram.counts,
             name='Score Distribution',
             marker_color='#8b5cf6'
         ),
@@ -229,5 +401,34 @@ def create_performance_analysis_chart(attendance_data: List[Dict], performance_m
         paper_bgcolor='white',
         margin=dict(t=50, b=20, l=20, r=20)
     )
+    # Zooming either time series zooms both
+    fig.update_xaxes(matches='x', rangeselector=dict(buttons=DATE_RANGE_BUTTONS), row=1, col=1)
+    fig.update_xaxes(matches='x', row=1, col=2)
+    
+    return fig
+
+def create_skill_gap_heatmap(gaps, skills: List[str], rows: List[str], hover_label: str = "Gap", customdata=None, hovertemplate: str = None):
+    """Heatmap of skill gaps (rows x skills); NaN cells (skill not required) stay blank."""
+    fig = go.Figure()
+    
+    fig.add_trace(go.Heatmap(
+        z=gaps,
+        x=skills,
+        y=rows,
+        customdata=customdata,
+        colorscale=[[0, '#f1f5f9'], [0.5, '#f59e0b'], [1, '#ef4444']],
+        zmin=0,
+        colorbar=dict(title=hover_label),
+        hovertemplate=hovertemplate or f"%{{y}} • %{{x}}<br>{hover_label}: %{{z:.1f}}<extra></extra>",
+        hoverongaps=False
+    ))
+    
+    fig.update_layout(
+        height=max(300, min(900, 40 + 22 * len(rows))),
+        plot_bgcolor='white',
+        paper_bgcolor='white',
+        margin=dict(t=30, b=20, l=20, r=20)
+    )
+    fig.update_yaxes(autorange="reversed")
     
     return fig
@@ -0,0 +1,115 @@
+import os
+import threading
+import time
+from typing import Callable, Dict, List, Optional
+from services import get_db
+
+# Set INTERNTRACK_WARMUP=0 to skip the warm-up, e.g. for short-lived test processes
+WARMUP_ENABLED = os.getenv("INTERNTRACK_WARMUP", "1") != "0"
+WARMUP_RECENT_INTERNS = 20
+# Grace period before the first step, so the landing page and the browser's follow-up
+# reruns finish before the warm-up imports pandas/numpy and competes for the GIL
+WARMUP_DELAY_SECONDS = 2.0
+
+class WarmupStatus:
+    """Progress of the process-wide warm-up; read by the admin hub, written by the warm-up thread."""
+    
+    def __init__(self, steps: List[str]):
+        self.steps = steps
+        self.timings: Dict[str, float] = {}
+        self.errors: Dict[str, str] = {}
+        self.current: Optional[str] = None
+        self.started_at: Optional[float] = None
+        self.finished_at: Optional[float] = None
+    
+    @property
+    def done(self) -> bool:
+        return self.finished_at is not None
+    
+    @property
+    def progress(self) -> float:
+        return (len(self.timings) + len(self.errors)) / len(self.steps) if self.steps else 1.0
+    
+    @property
+    def elapsed(self) -> float:
+        if self.started_at is None:
+            return 0.0
+        return (self.finished_at or time.time()) - self.started_at
+
+def _touch_pages(db) -> None:
+    # Read through the tables and the indexes the dashboards use, so their pages are hot
+    cursor = db.conn.cursor()
+    cursor.execute("SELECT COUNT(*), SUM(duration), SUM(score) FROM attendance")
+    cursor.execute("SELECT COUNT(*) FROM attendance INDEXED BY idx_attendance_intern WHERE intern_id > ''")
+    cursor.execute("SELECT COUNT(*), MAX(LENGTH(skills)) FROM users")
+    cursor.execute("SELECT COUNT(*) FROM score_histograms")
+
+def _cohort(db) -> None:
+    from cohort_analytics import get_cohort_frame
+    frame = get_cohort_frame(db)
+    frame.performance
+    frame.intern_summary()
+    frame.track_summary()
+
+def _admin_views(db) -> None:
+    from admin_dashboard import load_leaderboard, load_tracks_view
+    load_tracks_view(db, db.get_data_version(['jobs']))
+    load_leaderboard(db, 10, None, None, None, db.get_data_version(['attendance', 'users', 'jobs']))
+
+def _recent_figures(db) -> None:
+    from utils import SessionSeries, create_performance_pie_chart, create_score_velocity_chart, create_skill_gap_pie
+    for intern_id in db.get_recently_active_interns(WARMUP_RECENT_INTERNS):
+        intern = db.get_intern_by_id(intern_id)
+        sessions = SessionSeries(db.get_attendance_for_intern(intern_id))
+        create_score_velocity_chart(sessions)
+        create_performance_pie_chart(sessions)
+        if intern and intern.get('analysis'):
+            create_skill_gap_pie(intern['analysis'].get('similarity', 0))
+
+WARMUP_STEPS: List[tuple] = [
+    ("SQLite pages", _touch_pages),
+    ("Tracks", lambda db: db.get_jobs()),
+    ("Cohort frame", _cohort),
+    ("Track fit matrix", lambda db: db.get_track_fit_matrix()),
+    ("Admin views", _admin_views),
+    ("Recent figures", _recent_figures)
+]
+
+_status: Optional[WarmupStatus] = None
+_lock = threading.Lock()
+
+def _run(status: WarmupStatus, steps: List[tuple], delay: float) -> None:
+    time.sleep(delay)
+    status.started_at = time.time()
+    db = get_db()
+    for name, step in steps:
+        status.current = name
+        started = time.perf_counter()
+        try:
+            step(db)
+        except Exception as e:
+            # A failed step only means a colder first request; carry on with the rest
+            status.errors[name] = str(e)
+            continue
+        status.timings[name] = time.perf_counter() - started
+    status.current = None
+    status.finished_at = time.time()
+
+def start_warmup(steps: Optional[List[tuple]] = None, delay: float = WARMUP_DELAY_SECONDS) -> Optional[WarmupStatus]:
+    """Start the warm-up thread once per process; later calls return the same status.
+    
+    Call it after the page has been rendered. The daemon thread waits `delay` seconds,
+    then imports what each step needs itself. Returns None when INTERNTRACK_WARMUP=0.
+    """
+    global _status
+    if not WARMUP_ENABLED:
+        return None
+    with _lock:
+        if _status is None:
+            steps = steps or WARMUP_STEPS
+            _status = WarmupStatus([name for name, _ in steps])
+            threading.Thread(target=_run, args=(_status, steps, delay), name="interntrack-warmup", daemon=True).start()
+    return _status
+
+def get_warmup_status() -> Optional[WarmupStatus]:
+    return _status